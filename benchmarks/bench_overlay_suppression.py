@@ -0,0 +1,209 @@
+# benchmarks/bench_overlay_suppression.py - 팝업 제거 페이지당 비용 비교 (기존 스윕 vs 오버레이 억제 스크립트)
+#
+# 실행: python benchmarks/bench_overlay_suppression.py [--rows 50] [--filler 4000] [--calls 4] [--repeat 20]
+#
+# 매물 리스트와 비슷한 합성 페이지(50행 테이블 + 채움 요소 + 팝업)를 만들어 before/after 모두
+# 같은 방식으로 측정한다 - 팝업을 다시 삽입한 뒤 MultiPropertyAutomation.remove_popups()를 그대로 호출
+#   - before: 억제 스크립트 미설치 (호출마다 전체 DOM getComputedStyle 스윕)
+#   - after : 억제 스크립트 설치 (매물 리스트에서는 호출이 바로 반환, 팝업은 MutationObserver가 처리)
+# 페이지당 wall(호출 측 소요, round trip 포함)/in_page(페이지 내 처리 시간)/남은 팝업 수를 JSON으로 출력한다.
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from playwright.async_api import async_playwright
+
+from multi_property_automation import (
+    AD_LIST_PATH, REMOVE_POPUPS_SCRIPT, MultiPropertyAutomation, overlay_suppressor_script,
+)
+
+
+def build_page_html(rows, filler):
+    """매물 리스트 구조를 흉내낸 합성 페이지 HTML"""
+    row_html = ''.join(
+        f'<tr class="adComplete">'
+        f'<td>{i}</td><td>단지</td><td><div class="numberN">26{i:08d}</div></td><td>매매</td>'
+        f'<td>상일동<br>단지 {i}동</td><td>-</td><td>-</td><td>로켓등록</td>'
+        f'<td><button id="naverEnd">노출종료</button></td>'
+        f'</tr>'
+        for i in range(rows)
+    )
+    filler_html = ''.join(f'<div class="item"><span>{i}</span></div>' for i in range(filler))
+    popup_html = (
+        '<div class="layer_popup"><img src="/img/popup_banner.png"></div>'
+        '<div id="popupNotice">공지</div>'
+        '<div style="position:fixed;z-index:9999;inset:0">dim</div>'
+    )
+    return (
+        '<html><head><style>.item { position: relative; }</style></head><body>'
+        f'<div id="wrap"><table><tbody>{row_html}</tbody></table>{filler_html}</div>'
+        f'{popup_html}</body></html>'
+    )
+
+
+# 동적으로 팝업을 다시 삽입 (사이트가 시간차로 배너를 띄우는 상황 재현)
+INJECT_POPUPS_SCRIPT = """
+    () => {
+        const popup = document.createElement('div');
+        popup.className = 'layer_popup';
+        document.body.appendChild(popup);
+        const dim = document.createElement('div');
+        dim.style.cssText = 'position:fixed;z-index:9999;inset:0';
+        document.body.appendChild(dim);
+    }
+"""
+
+TIMED_LEGACY_SWEEP = f"""
+    () => {{
+        const sweep = {REMOVE_POPUPS_SCRIPT};
+        const start = performance.now();
+        sweep();
+        return performance.now() - start;
+    }}
+"""
+
+# 억제 스크립트 방식의 페이지 내 비용 - 팝업 삽입 후 MutationObserver 콜백(마이크로태스크) 처리까지
+TIMED_OBSERVED_INJECT = f"""
+    () => new Promise(resolve => {{
+        const start = performance.now();
+        ({INJECT_POPUPS_SCRIPT})();
+        queueMicrotask(() => setTimeout(() => resolve(performance.now() - start), 0));
+    }})
+"""
+
+LEFTOVER_POPUPS_SCRIPT = """
+    () => document.querySelectorAll('div.layer_popup').length
+        + Array.from(document.querySelectorAll('body > div')).filter(el => el.style.zIndex === '9999').length
+"""
+
+
+BENCH_URL = f'http://bench.local{AD_LIST_PATH}'
+
+
+class PopupRemover:
+    """MultiPropertyAutomation.remove_popups를 그대로 호출하기 위한 최소 상태 (브라우저/설정 없이 생성)"""
+
+    remove_popups = MultiPropertyAutomation.remove_popups
+
+    def __init__(self, installed):
+        self.overlay_suppressor_installed = installed
+        self.ad_list_path = AD_LIST_PATH
+
+
+async def open_bench_page(context, html):
+    """합성 페이지를 실제 내비게이션으로 로드 (init 스크립트가 새 문서마다 실행되도록)"""
+    page = await context.new_page()
+    await page.route(BENCH_URL, lambda route: route.fulfill(status=200, content_type='text/html', body=html))
+    return page
+
+
+async def in_page_cost(page, calls, suppressed):
+    """페이지 하나에서 팝업 처리에 쓴 페이지 내 시간 (ms)
+
+    before: 호출마다 전체 스윕, after: load 스윕 1회(억제 스크립트가 load 때 하는 작업) + 동적 삽입 노드 검사
+    """
+    if not suppressed:
+        total = 0.0
+        for _ in range(calls):
+            await page.evaluate(INJECT_POPUPS_SCRIPT)
+            total += await page.evaluate(TIMED_LEGACY_SWEEP)
+        return total
+    total = await page.evaluate("""
+        () => {
+            const start = performance.now();
+            window.__overlaySuppressor.sweep();
+            return performance.now() - start;
+        }
+    """)
+    for _ in range(calls):
+        total += await page.evaluate(TIMED_OBSERVED_INJECT)
+    return total
+
+
+async def measure(browser, html, calls, repeat, suppressed):
+    """페이지당 remove_popups calls회 호출 비용 (before/after 동일한 측정)
+
+    Returns:
+        (list, list, list): 페이지별 wall ms, in_page ms, 마지막 호출 후 남은 팝업 수
+    """
+    context = await browser.new_context()
+    if suppressed:
+        await context.add_init_script(overlay_suppressor_script(AD_LIST_PATH))
+    page = await open_bench_page(context, html)
+    remover = PopupRemover(suppressed)
+    per_page_wall, per_page_inpage, leftovers = [], [], []
+    for _ in range(repeat):
+        await page.goto(BENCH_URL, wait_until='load')
+        wall = 0.0
+        for _ in range(calls):
+            await page.evaluate(INJECT_POPUPS_SCRIPT)
+            start = time.perf_counter()
+            await remover.remove_popups(page)
+            wall += (time.perf_counter() - start) * 1000
+        leftovers.append(await page.evaluate(LEFTOVER_POPUPS_SCRIPT))
+        per_page_wall.append(wall)
+
+        await page.goto(BENCH_URL, wait_until='load')
+        per_page_inpage.append(await in_page_cost(page, calls, suppressed))
+    await context.close()
+    return per_page_wall, per_page_inpage, leftovers
+
+
+def summarize(values):
+    return {
+        'median_ms': round(statistics.median(values), 3),
+        'mean_ms': round(statistics.mean(values), 3),
+        'max_ms': round(max(values), 3),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='팝업 제거 페이지당 비용 벤치마크')
+    parser.add_argument('--rows', type=int, default=50, help='테이블 행 수 (기본 50)')
+    parser.add_argument('--filler', type=int, default=4000, help='추가 DOM 요소 수 (기본 4000)')
+    parser.add_argument('--calls', type=int, default=4, help='페이지당 remove_popups 호출 횟수 (기본 4)')
+    parser.add_argument('--repeat', type=int, default=20, help='반복 횟수 (기본 20)')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    html = build_page_html(args.rows, args.filler)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        before_wall, before_inpage, before_leftovers = await measure(browser, html, args.calls, args.repeat, False)
+        after_wall, after_inpage, after_leftovers = await measure(browser, html, args.calls, args.repeat, True)
+        await browser.close()
+
+    report = {
+        'benchmark': 'overlay_suppression',
+        'executed_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'params': vars(args),
+        'before': {
+            'description': f'페이지당 remove_popups {args.calls}회 (전체 DOM getComputedStyle 스윕)',
+            'wall': summarize(before_wall),
+            'in_page': summarize(before_inpage),
+            'leftover_popups': max(before_leftovers),
+        },
+        'after': {
+            'description': f'억제 스크립트: load 시 1회 스윕 + MutationObserver, 페이지당 remove_popups {args.calls}회',
+            'wall': summarize(after_wall),
+            'in_page': summarize(after_inpage),
+            'leftover_popups': max(after_leftovers),
+        },
+    }
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,210 @@
+# benchmarks/bench_scale.py - 배치 파이프라인 규모별 벤치마크 (로컬 모의 서버 대상 run_automation 실행)
+#
+# 실행: python benchmarks/bench_scale.py [--listings 500,2000,5000,20000] [--targets 1,10,50,300]
+#                                        [--positions front,back,scattered] [--latency-ms 0] [--quick]
+#
+# 케이스(전체 매물 수 × 대상 매물 수 × 대상 위치)마다 benchmarks/mock_aipartner.py 모의 서버를 새로 띄우고
+# MultiPropertyAutomation.run_automation()을 그대로 실행해 다음을 측정한다:
+#   - wall_seconds : 케이스 전체 소요 시간
+#   - pages_visited: 목록 페이지 렌더링 수 (ad_list 문서 + AJAX 목록 요청)
+#   - navigations  : 문서 내비게이션 수 (로그인/ad_list/ad_regist GET)
+#   - playwright_calls: Page/ElementHandle API 호출 수 (메서드별/호출 위치별, PLAYWRIGHT_PROFILE 프로파일러 사용)
+#   - sleep_ms     : wait_for_timeout으로 요청한 고정 대기 시간 합
+#   - success/total: 실행 결과 파일 기준 성공 수
+#   - first_row_seconds: 실행 시작부터 매물 리스트 첫 행 표시까지 (browser: launch | reused | server_started)
+#   - lookup_paths : 매물 조회 경로별 횟수 (--search param|form 시 목록 검색, 없으면 페이지 순회)
+# 결과는 schema_version과 git 커밋이 포함된 JSON으로 저장한다 (변경 전후 비교용).
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from mock_aipartner import MockAipartner
+import multi_property_automation
+
+SCHEMA_VERSION = 1
+
+def pick_targets(mock, count, position):
+    """로켓등록 매물 중 대상 선택 (front: 앞쪽, back: 뒤쪽, scattered: 고르게 분산)"""
+    rocket = [number for number in mock.state.active if mock.state.listings[number]['ad_type'] == '로켓등록']
+    if count > len(rocket):
+        return None
+    if position == 'front':
+        return rocket[:count]
+    if position == 'back':
+        return rocket[-count:]
+    step = len(rocket) / count
+    return [rocket[int(i * step)] for i in range(count)]
+
+
+def case_env(mock, targets, args):
+    return {
+        'LOGIN_URL': mock.login_url,
+        'AD_LIST_URL': mock.ad_list_url,
+        'LOGIN_ID': 'mock',
+        'LOGIN_PASSWORD': 'mock',
+        'PROPERTY_NUMBERS': ','.join(targets),
+        'TEST_MODE': 'false',
+        'SESSION_CACHE_KEY': '',
+        'TRACE_OUTPUT': '',
+        'RESOURCE_POLICY': args.resource_policy,
+        'WORKER_POOL_SIZE': str(args.pool_size),
+        'PIPELINE_MODE': 'true' if args.pipeline else 'false',
+        'BROWSER_SERVER': 'true' if args.browser_server else 'false',
+        'PLAYWRIGHT_PROFILE': 'true',
+        'AD_LIST_SEARCH_PARAM': 'keyword' if args.search == 'param' else '',
+        'AD_LIST_SEARCH_INPUT': '#searchKeyword' if args.search == 'form' else '',
+        'AD_LIST_SEARCH_BUTTON': '#btnSearch' if args.search == 'form' else '',
+    }
+
+
+async def run_case(listings, target_count, position, args):
+    mock = MockAipartner(
+        listings=listings, page_size=args.page_size, latency_ms=args.latency_ms,
+        popup_rate=args.popup_rate, seed=args.seed,
+    ).start()
+    try:
+        targets = pick_targets(mock, target_count, position)
+        if targets is None:
+            return None
+
+        workdir = tempfile.mkdtemp(prefix='bench_scale_')
+        previous_env = {key: os.environ.get(key) for key in case_env(mock, targets, args)}
+        os.environ.update(case_env(mock, targets, args))
+        previous_cwd = os.getcwd()
+        os.chdir(workdir)
+        started = time.perf_counter()
+        try:
+            with open('automation.log', 'w', encoding='utf-8') as log, contextlib.redirect_stdout(log):
+                automation = multi_property_automation.MultiPropertyAutomation()
+                try:
+                    await automation.run_automation()
+                except SystemExit:
+                    pass
+            wall = time.perf_counter() - started
+            with open(multi_property_automation.RUN_RESULT_PATH, encoding='utf-8') as f:
+                run_result = json.load(f)
+            with open(multi_property_automation.PROFILE_PATH, encoding='utf-8') as f:
+                profile = json.load(f)
+        finally:
+            os.chdir(previous_cwd)
+            for key, value in previous_env.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+        requests = mock.stats()['requests']
+        return {
+            'listings': listings,
+            'targets': target_count,
+            'position': position,
+            'wall_seconds': round(wall, 2),
+            'success': run_result['success_count'],
+            'total': run_result['total_count'],
+            'stage_timings': run_result['stage_timings'],
+            'browser': run_result['startup'].get('browser'),
+            'first_row_seconds': run_result['startup'].get('first_row_seconds'),
+            'lookup_paths': run_result['lookup']['paths'],
+            'pages_visited': requests.get('GET /offerings/ad_list', 0) + requests.get('GET /api/list', 0),
+            'navigations': sum(
+                count for key, count in requests.items()
+                if key in ('GET /offerings/ad_list', 'GET /offerings/ad_regist', 'GET /integrated/login')
+            ),
+            'playwright_calls': profile['total_calls'],
+            'playwright_calls_by_method': {row['key']: row['calls'] for row in profile['by_method']},
+            'playwright_ms_by_call_site': {row['key']: row['total_ms'] for row in profile['by_call_site']},
+            'sleep_ms': profile['sleep_ms'],
+            'log': os.path.join(workdir, 'automation.log'),
+        }
+    finally:
+        mock.stop()
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def int_list(value):
+    return [int(item) for item in value.split(',') if item]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='배치 파이프라인 규모별 벤치마크')
+    parser.add_argument('--listings', type=int_list, default=[500, 2000, 5000, 20000], help='전체 매물 수 목록')
+    parser.add_argument('--targets', type=int_list, default=[1, 10, 50, 300], help='대상 매물 수 목록')
+    parser.add_argument('--positions', default='front,back,scattered', help='대상 위치 목록 (front,back,scattered)')
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--latency-ms', type=int, default=0, help='모의 서버 요청당 지연')
+    parser.add_argument('--popup-rate', type=float, default=0.5)
+    parser.add_argument('--resource-policy', default='block')
+    parser.add_argument('--pool-size', type=int, default=1)
+    parser.add_argument('--pipeline', action='store_true', help='파이프라인 모드(PIPELINE_MODE)로 실행')
+    parser.add_argument('--browser-server', action='store_true',
+                        help='브라우저 서버 재사용(BROWSER_SERVER) - 첫 케이스가 서버를 띄우고 이후 케이스는 재사용')
+    parser.add_argument('--search', choices=['off', 'param', 'form'], default='off',
+                        help='목록 검색 경로 (param: ?keyword= URL, form: 검색창 입력, off: 페이지 순회)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--quick', action='store_true', help='작은 그리드 (500,2000 × 1,10 × front,back)')
+    parser.add_argument('--output', help='결과 JSON 경로 (기본 benchmarks/results/scale_<커밋>_<시각>.json)')
+    args = parser.parse_args()
+
+    if args.quick:
+        args.listings, args.targets, args.positions = [500, 2000], [1, 10], 'front,back'
+    positions = [item for item in args.positions.split(',') if item]
+
+    cases = []
+    for listings in args.listings:
+        for target_count in args.targets:
+            for position in positions:
+                print(f"▶ listings={listings} targets={target_count} position={position}", flush=True)
+                case = await run_case(listings, target_count, position, args)
+                if case is None:
+                    print("  (대상 수가 로켓등록 매물 수보다 많아 건너뜀)")
+                    continue
+                print(f"  {case['wall_seconds']}s, {case['success']}/{case['total']} 성공, "
+                      f"페이지 {case['pages_visited']}, 내비게이션 {case['navigations']}, "
+                      f"호출 {case['playwright_calls']}, 대기 {case['sleep_ms']}ms", flush=True)
+                cases.append(case)
+
+    revision = git_revision()
+    report = {
+        'benchmark': 'scale',
+        'schema_version': SCHEMA_VERSION,
+        'git_revision': revision,
+        'executed_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'params': {key: value for key, value in vars(args).items() if key != 'output'},
+        'cases': cases,
+    }
+
+    output = args.output or os.path.join(
+        BENCH_DIR, 'results', f"scale_{revision or 'unknown'}_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"📝 결과 저장: {output}")
+    if args.browser_server:
+        # 서버를 띄운 케이스의 작업 디렉터리에 서버 정보가 남아 있음
+        for case in cases:
+            state_path = os.path.join(os.path.dirname(case['log']), multi_property_automation.BROWSER_SERVER_STATE)
+            if os.path.exists(state_path):
+                multi_property_automation.stop_browser_server(state_path)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,555 @@
+# benchmarks/mock_aipartner.py - aipartner 매물 리스트/종료매물/광고등록 흐름 로컬 모의 서버 (표준 라이브러리만 사용)
+#
+# 실행: python benchmarks/mock_aipartner.py [--port 8765] [--listings 500] [--page-size 50] [--latency-ms 50]
+#                                          [--popup-rate 0.5] [--error-rate 0.0] [--non-rocket-rate 0.05]
+#
+# 자동화 스크립트를 모의 서버로 향하게 하려면:
+#   LOGIN_URL=http://127.0.0.1:8765/integrated/login?serviceCode=1000 \
+#   AD_LIST_URL=http://127.0.0.1:8765/offerings/ad_list \
+#   LOGIN_ID=mock LOGIN_PASSWORD=mock PROPERTY_NUMBERS=2600000010,2600000020 \
+#   python multi_property_automation.py
+#
+# 목록 검색 경로를 쓰려면 AD_LIST_SEARCH_PARAM=keyword 또는
+# AD_LIST_SEARCH_INPUT=#searchKeyword AD_LIST_SEARCH_BUTTON=#btnSearch 를 함께 설정한다.
+#
+# 스크립트가 의존하는 DOM 계약을 재현한다:
+#   - table tbody tr.adComplete 행, td:nth-child(3) > div.numberN 매물번호, 8번째 칸 광고유형
+#   - 행 안의 #naverEnd / #reReg / #naverAd 버튼, td.danjiName p.fullName span 단지명
+#   - .statusItem.statusAll span.cnt 전체 매물 수, .statusAdEnd 광고종료 버튼
+#   - .pagination a.btnArrow.next[data-value] (AJAX로 테이블만 교체), .pagination .on 활성 페이지
+#   - 광고등록(ad_regist) → 광고하기 → #consentMobile2, #paymentMethod1, #naverSendSave
+#     (실서비스처럼 URL은 쿼리 없는 /offerings/ad_regist - 매물번호/단계는 쿠키로 전달)
+#   - #searchKeyword 검색창 + #btnSearch 버튼, 또는 ?keyword= 쿼리 (매물번호/단지명 부분 일치로 목록 필터)
+#   - 확인 팝업 문구: "노출종료 했어요", "통신 중 오류", "매물을 저장 하였습니다", "로켓전송이 완료되었습니다", "동의해 주세요"
+#
+# 프로그램에서 사용할 때는 MockAipartner(...).start()로 백그라운드 스레드에서 띄우고 stats()로 요청 수를 확인한다.
+
+import argparse
+import html
+import json
+import random
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+SESSION_COOKIE = 'MOCK_SESSION=ok'
+
+# 광고등록 페이지로 넘기는 매물번호/단계 (URL을 /offerings/ad_regist 그대로 두기 위해 쿠키 사용)
+REGIST_NUMBER_COOKIE = 'MOCK_REGIST_NUMBER'
+REGIST_STEP_COOKIE = 'MOCK_REGIST_STEP'
+
+# 1x1 PNG (리소스 차단 정책 측정용 이미지 응답)
+PIXEL_PNG = bytes.fromhex(
+    '89504e470d0a1a0a0000000d4948445200000001000000010806000000'
+    '1f15c4890000000d4944415478da63f8ffff3f0005fe02fea7d6a1a20000000049454e44ae426082'
+)
+
+
+class MockState:
+    """모의 매물 데이터와 동작 (스레드 안전)
+
+    상태: active(광고중, 매물 리스트) | ended(종료매물 리스트) | saved(저장됨, 매물 리스트에 #naverAd)
+    노출종료된 매물은 종료매물 목록 맨 앞에, 결제 완료된 매물은 매물 리스트 맨 앞에 들어간다.
+    """
+
+    def __init__(self, listings=500, page_size=50, ended=0, non_rocket_rate=0.05,
+                 popup_rate=0.5, error_rate=0.0, latency_ms=0, seed=0):
+        self.page_size = page_size
+        self.popup_rate = popup_rate
+        self.error_rate = error_rate
+        self.latency_ms = latency_ms
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = {}
+        self.actions = {}
+
+        self.listings = {}
+        self.active = []
+        self.ended = []
+        for i in range(listings + ended):
+            number = f"26{i:08d}"
+            self.listings[number] = {
+                'number': number,
+                'fullname': f"모의단지 {100 + i % 40}동 {i}호",
+                'location': f"상일동\n\n모의단지 {100 + i % 40}동 {i}호",
+                'trade_type': '매매' if i % 3 else '전세',
+                'ad_type': '일반' if self.random.random() < non_rocket_rate else '로켓등록',
+            }
+            (self.active if i < listings else self.ended).append(number)
+        self.saved = []
+
+    def count_request(self, key):
+        with self.lock:
+            self.requests[key] = self.requests.get(key, 0) + 1
+
+    def count_action(self, key):
+        self.actions[key] = self.actions.get(key, 0) + 1
+
+    def stats(self):
+        with self.lock:
+            return {
+                'requests': dict(self.requests),
+                'actions': dict(self.actions),
+                'active': len(self.active),
+                'ended': len(self.ended),
+                'saved': len(self.saved),
+            }
+
+    def position(self, number):
+        """(목록 이름, 0부터 시작하는 위치) - 없으면 (None, None)"""
+        with self.lock:
+            for name, numbers in (('active', self.active), ('ended', self.ended), ('saved', self.saved)):
+                if number in numbers:
+                    return name, numbers.index(number)
+        return None, None
+
+    def list_numbers(self, status, keyword=''):
+        if status == 'end':
+            numbers = list(self.ended)
+        else:
+            # 매물 리스트: 저장됨(결제 미완료) 매물이 앞쪽, 이후 광고중 매물
+            numbers = list(self.saved) + list(self.active)
+        if keyword:
+            numbers = [
+                number for number in numbers
+                if keyword in number or keyword in self.listings[number]['fullname']
+            ]
+        return numbers
+
+    def page(self, status, page, keyword=''):
+        with self.lock:
+            numbers = self.list_numbers(status, keyword)
+            last_page = max(1, (len(numbers) + self.page_size - 1) // self.page_size)
+            page = min(max(1, page), last_page)
+            start = (page - 1) * self.page_size
+            rows = [(number, self.row_state(number)) for number in numbers[start:start + self.page_size]]
+            counts = {'all': len(self.active) + len(self.saved), 'end': len(self.ended)}
+        return rows, page, last_page, counts
+
+    def row_state(self, number):
+        if number in self.ended:
+            return 'ended'
+        if number in self.saved:
+            return 'saved'
+        return 'active'
+
+    def end_exposure(self, number):
+        with self.lock:
+            self.count_action('naverEnd')
+            if number not in self.active:
+                return {'result': 'fail', 'message': '노출종료에 실패했어요'}
+            if self.random.random() < self.error_rate:
+                return {'result': 'fail', 'message': '통신 중 오류가 발생했습니다'}
+            self.active.remove(number)
+            self.ended.insert(0, number)
+            return {'result': 'success', 'message': '노출종료 했어요'}
+
+    def re_register(self, number):
+        with self.lock:
+            self.count_action('reReg')
+            if number not in self.ended:
+                return {'result': 'fail', 'message': '재광고할 수 없는 매물입니다'}
+            return {'result': 'success', 'message': ''}
+
+    def save(self, number):
+        """광고하기: 매물 저장 (종료매물 목록에서 빠지고 매물 리스트에 저장됨 상태로 표시)"""
+        with self.lock:
+            self.count_action('save')
+            if number in self.ended:
+                self.ended.remove(number)
+                self.saved.insert(0, number)
+            return {'result': 'success', 'message': '매물을 저장 하였습니다'}
+
+    def pay(self, number, consent):
+        with self.lock:
+            self.count_action('naverSendSave')
+            if not consent:
+                return {'result': 'fail', 'message': '필수 약관에 동의해 주세요'}
+            if self.random.random() < self.error_rate:
+                return {'result': 'fail', 'message': '통신 중 오류가 발생했습니다'}
+            if number in self.saved:
+                self.saved.remove(number)
+            if number in self.ended:
+                self.ended.remove(number)
+            if number not in self.active:
+                self.active.insert(0, number)
+            self.listings[number]['ad_type'] = '로켓등록'
+            return {'result': 'success', 'message': '로켓전송이 완료되었습니다'}
+
+
+def render_row(state, number, row_state):
+    item = state.listings[number]
+    if row_state == 'active':
+        row_class, button = 'adComplete', '<button type="button" id="naverEnd" class="btn">노출종료</button>'
+    elif row_state == 'ended':
+        row_class, button = 'adEnd', '<button type="button" id="reReg" class="btn">재광고</button>'
+    else:
+        row_class, button = 'adSaved', '<button type="button" id="naverAd" class="btn">광고하기</button>'
+    location = html.escape(item['location']).replace('\n', '<br>')
+    return (
+        f'<tr class="{row_class}">'
+        f'<td><input type="checkbox"></td>'
+        f'<td class="danjiName"><div><p class="fullName"><span>{html.escape(item["fullname"])}</span></p></div></td>'
+        f'<td><div class="numberN">{number}</div></td>'
+        f'<td>{item["trade_type"]}</td>'
+        f'<td>{location}</td>'
+        f'<td>-</td><td>-</td>'
+        f'<td>{item["ad_type"]}</td>'
+        f'<td>{button}</td>'
+        f'</tr>'
+    )
+
+
+def render_pagination(page, last_page):
+    window_start = ((page - 1) // 10) * 10 + 1
+    numbers = ''.join(
+        f'<a href="#" data-value="{n}" class="on">{n}</a>' if n == page else f'<a href="#" data-value="{n}">{n}</a>'
+        for n in range(window_start, min(window_start + 9, last_page) + 1)
+    )
+    next_class = 'btnArrow next disabled' if page >= last_page else 'btnArrow next'
+    return (
+        f'<span><a href="#" class="btnArrow first" data-value="1">처음</a></span>'
+        f'<span><a href="#" class="btnArrow prev" data-value="{max(1, page - 1)}">이전</a></span>'
+        f'<span class="num">{numbers}</span>'
+        f'<span class="total">{page}/{last_page}</span>'
+        f'<span><a href="#" class="{next_class}" data-value="{min(page + 1, last_page)}">다음</a></span>'
+    )
+
+
+def render_list_fragment(state, status, page, keyword=''):
+    rows, page, last_page, counts = state.page(status, page, keyword)
+    body = ''.join(render_row(state, number, row_state) for number, row_state in rows)
+    if keyword and not rows:
+        body = '<tr class="noData"><td colspan="9">검색 결과가 없습니다</td></tr>'
+    return {
+        'rows': body,
+        'pagination': render_pagination(page, last_page),
+        'page': page,
+        'counts': counts,
+    }
+
+
+def render_popups(state):
+    """사이트 배너/레이어 팝업 (popup_rate 확률로 삽입)"""
+    if state.random.random() >= state.popup_rate:
+        return ''
+    return (
+        '<div class="layer_popup" style="position:fixed;z-index:9999;top:10%;left:10%;width:80%;height:80%;background:#fff">'
+        '<img src="/img/popup_banner.png"><a href="#" class="close">닫기</a></div>'
+        '<div class="dim" style="position:fixed;z-index:9998;inset:0;background:rgba(0,0,0,.5)"></div>'
+    )
+
+
+LIST_SCRIPT = """
+<script>
+let listStatus = %(status)s;
+let listKeyword = %(keyword)s;
+async function loadList(status, page, keyword = listKeyword) {
+    const tbody = document.querySelector('table tbody');
+    tbody.innerHTML = '';
+    const res = await fetch(`/api/list?status=${status}&page=${page}&keyword=${encodeURIComponent(keyword)}`);
+    const data = await res.json();
+    listStatus = status;
+    listKeyword = keyword;
+    tbody.innerHTML = data.rows;
+    document.querySelector('.pagination').innerHTML = data.pagination;
+    document.querySelector('.statusAll span.cnt').innerText = data.counts.all.toLocaleString();
+    document.querySelector('.statusAdEnd span.cnt').innerText = data.counts.end.toLocaleString();
+}
+async function post(path, body) {
+    const res = await fetch(path, {method: 'POST', headers: {'Content-Type': 'application/json'}, body: JSON.stringify(body)});
+    return res.json();
+}
+function search() {
+    loadList(listStatus, 1, document.querySelector('#searchKeyword').value.trim());
+}
+function clearSearch() {
+    document.querySelector('#searchKeyword').value = '';
+}
+document.addEventListener('keydown', (e) => {
+    if (e.key === 'Enter' && e.target.id === 'searchKeyword') { e.preventDefault(); search(); }
+});
+function goRegist(number, step) {
+    document.cookie = `%(number_cookie)s=${number}; path=/`;
+    document.cookie = `%(step_cookie)s=${step}; path=/`;
+    location.href = '/offerings/ad_regist';
+}
+function rowNumber(el) {
+    return el.closest('tr').querySelector('td:nth-child(3) > div.numberN').innerText.trim();
+}
+document.addEventListener('click', async (e) => {
+    const link = e.target.closest('.pagination a');
+    if (link) {
+        e.preventDefault();
+        if (link.classList.contains('disabled')) return;
+        loadList(listStatus, parseInt(link.getAttribute('data-value'), 10));
+        return;
+    }
+    if (e.target.closest('.statusAdEnd')) { clearSearch(); loadList('end', 1, ''); return; }
+    if (e.target.closest('.statusAll')) { clearSearch(); loadList('all', 1, ''); return; }
+    if (e.target.closest('#btnSearch')) { search(); return; }
+    if (e.target.closest('.layer_popup .close')) { e.preventDefault(); e.target.closest('.layer_popup').remove(); return; }
+    const button = e.target.closest('button');
+    if (!button) return;
+    const number = rowNumber(button);
+    if (button.id === 'naverEnd') {
+        if (!confirm('노출종료 하시겠어요?')) return;
+        const data = await post('/api/naverEnd', {number});
+        alert(data.message);
+    } else if (button.id === 'reReg') {
+        const data = await post('/api/reReg', {number});
+        if (data.result !== 'success') { alert(data.message); return; }
+        goRegist(number, '');
+    } else if (button.id === 'naverAd') {
+        goRegist(number, 'pay');
+    }
+});
+%(late_popup)s
+</script>
+"""
+
+LATE_POPUP_SCRIPT = """
+setTimeout(() => {
+    const popup = document.createElement('div');
+    popup.className = 'layer_popup';
+    popup.style.cssText = 'position:fixed;z-index:9999;top:20%;left:20%;width:60%;height:60%;background:#fff';
+    popup.innerHTML = '<img src="/img/popup_late.png">';
+    document.body.appendChild(popup);
+}, 300);
+"""
+
+
+def render_ad_list(state, status, page, keyword=''):
+    fragment = render_list_fragment(state, status, page, keyword)
+    late_popup = LATE_POPUP_SCRIPT if state.random.random() < state.popup_rate else ''
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>매물 리스트</title>'
+        '<link rel="stylesheet" href="/static/fonts.css">'
+        '<script src="https://www.googletagmanager.com/gtm.js?id=GTM-MOCK" async></script></head><body>'
+        '<div id="wrap"><div class="container"><div><div><div class="sectionWrap">'
+        '<div class="statusWrap ver3">'
+        f'<div class="statusItem statusAll GTM_offerings_ad_list_total">전체 <span class="cnt">{fragment["counts"]["all"]:,}</span></div>'
+        f'<div class="statusItem statusAdEnd GTM_offerings_ad_list_end_ad">광고종료 <span class="cnt">{fragment["counts"]["end"]:,}</span></div>'
+        '</div>'
+        '<div class="searchWrap">'
+        f'<input type="text" id="searchKeyword" placeholder="매물번호/단지명" value="{html.escape(keyword)}">'
+        '<button type="button" id="btnSearch" class="btn">검색</button>'
+        '</div>'
+        '<div class="singleSection listSection">'
+        f'<table><thead><tr><th></th><th>단지</th><th>매물번호</th><th>거래</th><th>가격/소재지</th><th></th><th></th><th>광고유형</th><th></th></tr></thead>'
+        f'<tbody>{fragment["rows"]}</tbody></table>'
+        f'<div class="pagination">{fragment["pagination"]}</div>'
+        '</div></div></div></div></div></div>'
+        f'{render_popups(state)}'
+        f'{LIST_SCRIPT % {"status": json.dumps(status), "keyword": json.dumps(keyword), "late_popup": late_popup, "number_cookie": REGIST_NUMBER_COOKIE, "step_cookie": REGIST_STEP_COOKIE}}'
+        '</body></html>'
+    )
+
+
+def render_login():
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>로그인</title></head><body>'
+        '<form id="loginForm" method="post" action="/integrated/login">'
+        '<input id="member-id" name="id"><input id="member-pw" name="pw" type="password">'
+        '<div id="integrated-login"><a href="#" onclick="document.getElementById(\'loginForm\').submit(); return false;">로그인</a></div>'
+        '</form></body></html>'
+    )
+
+
+def render_ad_regist(number, step):
+    if step != 'pay':
+        return (
+            '<!DOCTYPE html><html><head><meta charset="utf-8"><title>광고등록</title></head><body>'
+            f'<div class="regist"><p class="numberN">{html.escape(number)}</p>'
+            '<a href="#" id="btnRegist" class="btn">광고하기</a></div>'
+            '<script>'
+            'document.getElementById("btnRegist").addEventListener("click", async (e) => {'
+            '  e.preventDefault();'
+            f'  const res = await fetch("/api/save", {{method: "POST", headers: {{"Content-Type": "application/json"}}, body: JSON.stringify({{number: {json.dumps(number)}}})}});'
+            '  const data = await res.json();'
+            '  alert(data.message);'
+            f'  document.cookie = "{REGIST_STEP_COOKIE}=pay; path=/";'
+            '  location.href = "/offerings/ad_regist";'
+            '});'
+            '</script></body></html>'
+        )
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>광고등록 결제</title></head><body>'
+        '<div class="payment">'
+        '<label><input type="checkbox" id="consentMobile2"> 이용약관 동의</label>'
+        '<label><input type="radio" name="paymentMethod" id="paymentMethod1" value="charge" checked> 충전금</label>'
+        '<label><input type="radio" name="paymentMethod" id="paymentMethod2" value="card"> 카드</label>'
+        '<button type="button" id="naverSendSave">결제하기</button>'
+        '</div>'
+        '<script>'
+        'document.getElementById("naverSendSave").addEventListener("click", async () => {'
+        '  const consent = document.getElementById("consentMobile2").checked;'
+        f'  const res = await fetch("/api/naverSendSave", {{method: "POST", headers: {{"Content-Type": "application/json"}}, body: JSON.stringify({{number: {json.dumps(number)}, consent}})}});'
+        '  const data = await res.json();'
+        '  alert(data.message);'
+        '  if (data.result === "success") location.href = "/offerings/ad_list";'
+        '});'
+        '</script></body></html>'
+    )
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    state = None  # MockAipartner.start()에서 서버별 하위 클래스에 주입
+
+    def log_message(self, format, *args):
+        pass
+
+    def _delay(self):
+        if self.state.latency_ms:
+            time.sleep(self.state.latency_ms / 1000)
+
+    def _send(self, status, body, content_type='text/html; charset=utf-8', headers=None):
+        data = body if isinstance(body, bytes) else body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _json(self, payload):
+        self._send(200, json.dumps(payload, ensure_ascii=False), 'application/json; charset=utf-8')
+
+    def _redirect(self, location, headers=None):
+        self._send(302, b'', headers=dict(headers or {}, Location=location))
+
+    def _logged_in(self):
+        return SESSION_COOKIE in (self.headers.get('Cookie') or '')
+
+    def _body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length).decode('utf-8') if length else ''
+        if (self.headers.get('Content-Type') or '').startswith('application/json'):
+            return json.loads(raw or '{}')
+        return {key: values[0] for key, values in parse_qs(raw).items()}
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        self.state.count_request(f"GET {url.path}")
+        self._delay()
+
+        if url.path == '/integrated/login':
+            self._send(200, render_login())
+        elif url.path.startswith('/img/'):
+            self._send(200, PIXEL_PNG, 'image/png')
+        elif url.path == '/static/fonts.css':
+            self._send(200, 'body { font-family: sans-serif; }', 'text/css')
+        elif url.path == '/__mock/stats':
+            self._json(self.state.stats())
+        elif not self._logged_in():
+            self._redirect('/integrated/login?serviceCode=1000')
+        elif url.path == '/offerings/ad_list':
+            self._send(200, render_ad_list(
+                self.state, query.get('status', 'all'), int(query.get('page', 1)), query.get('keyword', '').strip()
+            ))
+        elif url.path == '/api/list':
+            self._json(render_list_fragment(
+                self.state, query.get('status', 'all'), int(query.get('page', 1)), query.get('keyword', '').strip()
+            ))
+        elif url.path == '/offerings/ad_regist':
+            cookies = SimpleCookie(self.headers.get('Cookie') or '')
+            self._send(200, render_ad_regist(
+                cookies[REGIST_NUMBER_COOKIE].value if REGIST_NUMBER_COOKIE in cookies else '',
+                cookies[REGIST_STEP_COOKIE].value if REGIST_STEP_COOKIE in cookies else ''
+            ))
+        else:
+            self._send(404, 'not found', 'text/plain')
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        self.state.count_request(f"POST {url.path}")
+        self._delay()
+        body = self._body()
+
+        if url.path == '/integrated/login':
+            self._redirect('/offerings/ad_list', headers={'Set-Cookie': f'{SESSION_COOKIE}; Path=/'})
+        elif not self._logged_in():
+            self._send(401, json.dumps({'result': 'fail', 'message': '로그인이 필요합니다'}), 'application/json')
+        elif url.path == '/api/naverEnd':
+            self._json(self.state.end_exposure(body.get('number', '')))
+        elif url.path == '/api/reReg':
+            self._json(self.state.re_register(body.get('number', '')))
+        elif url.path == '/api/save':
+            self._json(self.state.save(body.get('number', '')))
+        elif url.path == '/api/naverSendSave':
+            self._json(self.state.pay(body.get('number', ''), bool(body.get('consent'))))
+        else:
+            self._send(404, 'not found', 'text/plain')
+
+
+class MockAipartner:
+    """모의 서버 실행기 - 백그라운드 스레드에서 ThreadingHTTPServer 실행"""
+
+    def __init__(self, host='127.0.0.1', port=0, **state_options):
+        self.state = MockState(**state_options)
+        handler = type('BoundMockHandler', (MockHandler,), {'state': self.state})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def login_url(self):
+        return f"{self.base_url}/integrated/login?serviceCode=1000"
+
+    @property
+    def ad_list_url(self):
+        return f"{self.base_url}/offerings/ad_list"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def stats(self):
+        return self.state.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='aipartner 로컬 모의 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--listings', type=int, default=500, help='광고중 매물 수 (기본 500)')
+    parser.add_argument('--ended', type=int, default=0, help='처음부터 종료 상태인 매물 수 (기본 0)')
+    parser.add_argument('--page-size', type=int, default=50, help='페이지당 행 수 (기본 50)')
+    parser.add_argument('--latency-ms', type=int, default=0, help='요청당 지연 (기본 0ms)')
+    parser.add_argument('--popup-rate', type=float, default=0.5, help='페이지 로드 시 팝업 삽입 확률 (기본 0.5)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='노출종료/결제 "통신 중 오류" 확률 (기본 0)')
+    parser.add_argument('--non-rocket-rate', type=float, default=0.05, help='로켓등록이 아닌 매물 비율 (기본 0.05)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    mock = MockAipartner(
+        host=args.host, port=args.port, listings=args.listings, ended=args.ended,
+        page_size=args.page_size, latency_ms=args.latency_ms, popup_rate=args.popup_rate,
+        error_rate=args.error_rate, non_rocket_rate=args.non_rocket_rate, seed=args.seed,
+    )
+    print(f"🧪 모의 서버 실행: {mock.base_url}")
+    print(f"   LOGIN_URL={mock.login_url}")
+    print(f"   AD_LIST_URL={mock.ad_list_url}")
+    try:
+        mock.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        mock.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
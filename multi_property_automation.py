@@ -1,34 +1,1563 @@
 # multi_property_automation.py - 다중 매물 처리
 
 import asyncio
+import contextlib
+import base64
+import contextvars
+import functools
+import hashlib
+import inspect
+import json
 import os
+import re
+import signal
+import subprocess
 import sys
+import time
+import urllib.request
 from datetime import datetime
-from playwright.async_api import async_playwright
+from urllib.parse import urlencode, urlparse
+
+# 테이블 행 일괄 추출 스크립트 - 행마다 query_selector/inner_text를 반복하지 않고 한 번의 호출로 읽음
+ROW_EXTRACT_SCRIPT = """
+    (rows) => rows.map((row, index) => {
+        const text = (el) => (el ? el.innerText.trim() : '');
+        const cells = row.querySelectorAll('td');
+        const fullnameSelectors = [
+            'td.danjiName p.fullName span',
+            'td.danjiName > div > p.fullName > span',
+            'p.fullName span',
+            '.fullName span'
+        ];
+        let fullname = '';
+        for (const selector of fullnameSelectors) {
+            fullname = text(row.querySelector(selector));
+            if (fullname) break;
+        }
+        return {
+            index: index,
+            number: text(row.querySelector('td:nth-child(3) > div.numberN')),
+            ad_type: row.querySelector('td:nth-child(8)') ? text(row.querySelector('td:nth-child(8)')) : null,
+            fullname: fullname,
+            trade_type: cells.length > 3 ? text(cells[3]) : '',
+            buttons: {
+                naverEnd: !!row.querySelector('#naverEnd'),
+                reReg: !!row.querySelector('#reReg'),
+                naverAd: !!row.querySelector('#naverAd')
+            }
+        };
+    })
+"""
+
+# 현재 테이블 지문 - 첫/마지막 매물번호, 활성 페이지 번호, 다음 버튼 data-value, 행 수
+TABLE_FINGERPRINT_SCRIPT = """
+    () => {
+        const numbers = Array.from(document.querySelectorAll('table tbody tr td:nth-child(3) > div.numberN'))
+            .map(el => el.innerText.trim());
+        const active = document.querySelector('.pagination .on, .pagination .active, .pagination strong, .pagination [aria-current]');
+        const next = document.querySelector('.pagination a.btnArrow.next');
+        return {
+            rows: document.querySelectorAll('table tbody tr').length,
+            first: numbers.length ? numbers[0] : null,
+            last: numbers.length ? numbers[numbers.length - 1] : null,
+            active: active ? active.innerText.trim() : null,
+            next: next ? next.getAttribute('data-value') : null
+        };
+    }
+"""
+
+# 행이 다시 그려졌을 때 true (page.wait_for_function 인자로 이전 지문 전달) - 페이지네이션만 먼저 바뀌고
+# 이전 행이 남아 있는 순간을 전환으로 보지 않도록 행 내용(첫/마지막 매물번호) 또는 행 수가 바뀌어야 함
+TABLE_TRANSITION_SCRIPT = f"""
+    (previous) => {{
+        const current = ({TABLE_FINGERPRINT_SCRIPT})();
+        if (current.rows === 0) return false;
+        return current.first !== previous.first
+            || current.last !== previous.last
+            || current.rows !== previous.rows;
+    }}
+"""
+
+# 목록 페이지 직접 이동 - 페이지 번호 링크가 있으면 클릭, 없으면 다음 버튼의 data-value를 목표 페이지로
+# 바꿔 사이트의 페이지네이션 핸들러를 그대로 실행
+GOTO_PAGE_SCRIPT = """
+    (target) => {
+        const link = document.querySelector(`.pagination a[data-value="${target}"]:not(.btnArrow)`);
+        if (link) {
+            link.click();
+            return 'link';
+        }
+        const next = document.querySelector('.pagination a.btnArrow.next');
+        if (!next) return null;
+        next.setAttribute('data-value', String(target));
+        next.dataset.value = String(target);
+        if (window.jQuery) window.jQuery(next).data('value', target);
+        next.click();
+        return 'handler';
+    }
+"""
+
+# 기존 팝업 제거 스크립트 (전체 DOM getComputedStyle 스윕) - 억제 스크립트 미설치 시 폴백용
+REMOVE_POPUPS_SCRIPT = """
+    () => {
+        if (window.__overlaySuppressor) {
+            window.__overlaySuppressor.sweep();
+            return;
+        }
+
+        const popups = document.querySelectorAll('img[src*="popup"], div[class*="popup"], div[id*="popup"], .modal, .overlay');
+        popups.forEach(popup => {
+            popup.style.display = 'none';
+            popup.style.visibility = 'hidden';
+            popup.remove();
+        });
+
+        const highZIndexElements = document.querySelectorAll('*');
+        highZIndexElements.forEach(el => {
+            const zIndex = window.getComputedStyle(el).zIndex;
+            if (zIndex && parseInt(zIndex) > 1000) {
+                el.style.display = 'none';
+                el.remove();
+            }
+        });
+    }
+"""
+
+# 오버레이 억제 init 스크립트 - 컨텍스트에 한 번 설치되면 모든 문서에서 실행되지만 매물 리스트
+# 경로(AD_LIST_URL의 path)로 시작하는 문서에서만 동작 (광고등록/결제 단계의 동의·결제 레이어는 건드리지 않음)
+#   1) CSS 주입으로 팝업/모달 셀렉터를 즉시 숨김 (스타일 재계산 비용 없음)
+#   2) MutationObserver로 새로 추가되는 노드만 검사 (전체 DOM 스윕 없음)
+#   3) load 시점에 한 번만 높은 z-index 요소 스윕
+OVERLAY_SUPPRESSOR_TEMPLATE = """
+(() => {
+    if (window.__overlaySuppressor) return;
+    if (!location.pathname.startsWith(%(path)s)) return;
+
+    const POPUP_SELECTOR = 'img[src*="popup"], div[class*="popup"], div[id*="popup"], .modal, .overlay';
+    const Z_INDEX_LIMIT = 1000;
+    const state = { removed: 0, sweeps: 0 };
+
+    const neutralize = (el) => {
+        el.style.display = 'none';
+        el.remove();
+        state.removed += 1;
+    };
+
+    const isHighZIndex = (el) => {
+        const zIndex = parseInt(window.getComputedStyle(el).zIndex);
+        return zIndex > Z_INDEX_LIMIT;
+    };
+
+    const inspect = (node) => {
+        if (node.nodeType !== Node.ELEMENT_NODE || !node.isConnected) return;
+        if (node.matches(POPUP_SELECTOR) || isHighZIndex(node)) {
+            neutralize(node);
+            return;
+        }
+        node.querySelectorAll(POPUP_SELECTOR).forEach(neutralize);
+    };
+
+    const sweep = () => {
+        state.sweeps += 1;
+        document.querySelectorAll(POPUP_SELECTOR).forEach(neutralize);
+        document.querySelectorAll('body *').forEach(el => {
+            if (el.isConnected && isHighZIndex(el)) neutralize(el);
+        });
+    };
+
+    const style = document.createElement('style');
+    style.textContent = POPUP_SELECTOR + ' { display: none !important; visibility: hidden !important; }';
+    const attachStyle = () => {
+        const parent = document.head || document.documentElement;
+        if (parent && !style.isConnected) parent.appendChild(style);
+    };
+    attachStyle();
+
+    // 파싱 중 추가되는 노드는 CSS가 처리하고, 문서 로딩 후 동적으로 추가되는 노드만 검사
+    let loaded = false;
+    const observer = new MutationObserver((mutations) => {
+        attachStyle();
+        if (!loaded) return;
+        for (const mutation of mutations) {
+            mutation.addedNodes.forEach(inspect);
+        }
+    });
+    observer.observe(document, { childList: true, subtree: true });
+
+    window.addEventListener('load', () => {
+        sweep();
+        loaded = true;
+    }, { once: true });
+
+    window.__overlaySuppressor = { sweep: sweep, state: state };
+})();
+"""
+AD_LIST_PATH = '/offerings/ad_list'
+
+
+def overlay_suppressor_script(path=AD_LIST_PATH):
+    """path로 시작하는 문서에서만 동작하는 오버레이 억제 스크립트"""
+    return OVERLAY_SUPPRESSOR_TEMPLATE % {'path': json.dumps(path)}
+
+# 확인 팝업(alert) 패턴 - 먼저 선언된 키가 우선
+EXPOSURE_END_PATTERNS = {
+    'success': ["노출종료 했어요"],
+    'failure': ["노출종료에 실패", "통신 중 오류"],
+}
+PAYMENT_PATTERNS = {
+    'success': ["로켓전송이 완료되었습니다"],
+    'failure': ["동의해 주세요", "동의"],
+}
+SAVED_MESSAGE = "매물을 저장 하였습니다"
+
+
+class DialogBus:
+    """페이지별 팝업(dialog) 메시지 스트림
+
+    handle_global_popup이 publish()로 메시지를 넣고, 호출 측은 wait_for()로 원하는 패턴이
+    도착할 때까지 대기한다. sleep 폴링 없이 메시지가 도착하는 즉시 재개되며, 기존 popup_messages
+    리스트처럼 반복/인덱싱/clear()를 지원한다.
+    """
+
+    def __init__(self, name='main'):
+        self.name = name
+        self.messages = []
+        self._published = 0  # 지금까지 publish된 전체 메시지 수
+        self._offset = 0     # messages[0]의 전체 순번 (clear() 시 갱신)
+        self._condition = asyncio.Condition()
+        self._listeners = []
+
+    def __iter__(self):
+        return iter(self.messages)
+
+    def __len__(self):
+        return len(self.messages)
+
+    def __getitem__(self, index):
+        return self.messages[index]
+
+    def __repr__(self):
+        return repr(self.messages)
+
+    def clear(self):
+        self.messages.clear()
+        self._offset = self._published
+
+    def contains(self, *patterns):
+        """현재 메시지 중 패턴을 포함한 메시지가 있는지 확인"""
+        return any(pattern in message for message in self.messages for pattern in patterns)
+
+    def subscribe(self, listener):
+        """메시지 도착 시 호출할 콜백 등록 (listener(message))"""
+        self._listeners.append(listener)
+
+    async def publish(self, message):
+        async with self._condition:
+            self.messages.append(message)
+            self._published += 1
+            self._condition.notify_all()
+        for listener in self._listeners:
+            listener(message)
+
+    async def wait_for(self, patterns, timeout):
+        """패턴에 맞는 메시지가 도착할 때까지 대기
+
+        이미 받은 메시지(마지막 clear() 이후)도 검사하며, 이후에는 새로 도착한 메시지만 검사한다.
+
+        Args:
+            patterns: {결과 키: [부분 문자열, ...]} - 같은 시점에 여러 키가 맞으면 먼저 선언된 키 우선
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            (str, str): (결과 키, 메시지) - 타임아웃 시 (None, None)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        scanned = self._offset
+
+        async with self._condition:
+            while True:
+                new_messages = self.messages[max(0, scanned - self._offset):]
+                scanned = self._published
+
+                for key, key_patterns in patterns.items():
+                    for message in new_messages:
+                        if any(pattern in message for pattern in key_patterns):
+                            return key, message
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return None, None
+                try:
+                    await asyncio.wait_for(self._condition.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+
+
+# 응답 페이로드 판정 - 사이트 AJAX 응답 형식 {"result": "success" | "fail", "message": "..."}만 인정
+RESPONSE_RESULT_KEY = 'result'
+RESPONSE_RESULT_VALUES = {'success': 'success', 'fail': 'failure'}
+RESPONSE_MESSAGE_KEY = 'message'
+
+
+def classify_action_response(status, payload, action=None):
+    """버튼 클릭에 대한 백엔드 응답으로 성공/실패 판정
+
+    result 키 값이 정확히 success/fail인 응답만 판정하고, 그 외(5xx, 다른 형식, 본문 없음)는
+    판정 불가로 두어 확인 팝업으로 대체한다. 결제(naverSendSave)는 저장만 된 응답
+    (SAVED_MESSAGE)을 성공보다 먼저 확인한다.
+
+    Args:
+        status: HTTP 상태 코드
+        payload: 응답 본문 (JSON이면 dict/list, 아니면 문자열)
+        action: 감지 중인 버튼 ('naverEnd' | 'reReg' | 'naverSendSave')
+
+    Returns:
+        str: 'success' | 'failure' | 'saved' | None (판정 불가 → 팝업 확인으로 대체)
+    """
+    if status >= 500 or not isinstance(payload, dict):
+        return None
+    verdict = RESPONSE_RESULT_VALUES.get(str(payload.get(RESPONSE_RESULT_KEY, '')).strip().lower())
+    if action == 'naverSendSave' and SAVED_MESSAGE in str(payload.get(RESPONSE_MESSAGE_KEY) or ''):
+        return 'saved'
+    return verdict
+
+
+class ResponseDetector:
+    """페이지별 백엔드 응답(XHR/fetch) 기반 완료 감지기
+
+    arm(action)으로 감지할 버튼을 지정한 뒤 클릭하면, 이후 해당 패턴에 맞는 XHR/fetch 응답을
+    모아 wait_verdict()에서 페이로드로 성공/실패를 판정한다. URL 패턴이 없는 버튼은 감지하지 않는다.
+    """
+
+    def __init__(self, page, url_patterns):
+        self.url_patterns = {action: re.compile(pattern) for action, pattern in url_patterns.items()}
+        self.action = None
+        self._responses = None
+        page.on('response', self._on_response)
+
+    def arm(self, action):
+        if action not in self.url_patterns:
+            self.disarm()
+            return
+        self.action = action
+        self._responses = asyncio.Queue()
+
+    def disarm(self):
+        self.action = None
+
+    async def _on_response(self, response):
+        action = self.action
+        responses = self._responses
+        if action is None:
+            return
+        request = response.request
+        if request.resource_type not in ('xhr', 'fetch') or request.method == 'GET':
+            return
+        if not self.url_patterns[action].search(response.url):
+            return
+
+        try:
+            payload = await response.json()
+        except Exception:
+            try:
+                payload = await response.text()
+            except Exception:
+                payload = None
+        await responses.put((response.status, payload, response.url))
+
+    async def wait_verdict(self, timeout):
+        """판정 가능한 응답이 올 때까지 대기
+
+        Returns:
+            (str, str): ('success' | 'failure' | 'saved', 상세) - 타임아웃 또는 판정 불가 시 (None, None)
+        """
+        action = self.action
+        responses = self._responses
+        if responses is None:
+            return None, None
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None, None
+            try:
+                status, payload, url = await asyncio.wait_for(responses.get(), remaining)
+            except asyncio.TimeoutError:
+                return None, None
+
+            verdict = classify_action_response(status, payload, action)
+            if verdict:
+                return verdict, f"{status} {url}"
+
+
+# 리소스 라우팅 정책 - 자동화 흐름에 필요 없는 요청 차단
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font'}
+TRACKING_HOSTS = (
+    'googletagmanager.com',
+    'google-analytics.com',
+    'doubleclick.net',
+    'facebook.net',
+    'wcs.naver.net',
+    'wcs.naver.com',
+)
+FIRST_PARTY_HOST = 'aipartner.com'
+RESOURCE_SIZE_CACHE = os.path.join('.cache', 'resource_sizes.json')
+
+
+class ResourcePolicy:
+    """브라우저 컨텍스트 단위 요청 라우팅 정책
+
+    mode:
+        block - 이미지/미디어/폰트와 서드파티 분석 스크립트 요청을 abort (기본)
+        audit - 차단 대상도 그대로 받되, 차단했을 경우 절감됐을 요청 수/바이트를 측정
+        off   - 라우팅 미설치
+
+    allowlist의 문자열이 URL에 포함되면 항상 통과시킨다.
+    audit 모드에서 측정한 URL별 크기는 RESOURCE_SIZE_CACHE에 저장되어
+    block 모드에서 절감 바이트를 추정하는 데 쓰인다 (abort된 요청은 크기를 알 수 없으므로).
+    """
+
+    def __init__(self, mode='block', allowlist=None, size_cache_path=RESOURCE_SIZE_CACHE):
+        self.mode = mode
+        self.allowlist = [item for item in (allowlist or []) if item]
+        self.size_cache_path = size_cache_path
+        self.known_sizes = self._load_sizes()
+        self.matched = {}       # {카테고리: 요청 수}
+        self.matched_bytes = {} # {카테고리: 바이트}
+        self.unknown_size = 0   # 크기를 알 수 없는 차단 요청 수
+        self.allowed = 0
+        self._audited = {}      # audit 모드: {url: 카테고리}
+
+    def _load_sizes(self):
+        try:
+            with open(self.size_cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_sizes(self):
+        if self.mode != 'audit' or not self.known_sizes:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.size_cache_path), exist_ok=True)
+            with open(self.size_cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self.known_sizes, f)
+        except OSError as e:
+            print(f"⚠️ 리소스 크기 캐시 저장 실패: {e}")
+
+    def classify(self, request):
+        """차단 대상이면 카테고리('image'|'media'|'font'|'analytics'), 아니면 None"""
+        url = request.url
+        if any(item in url for item in self.allowlist):
+            return None
+        host = urlparse(url).hostname or ''
+        if not host.endswith(FIRST_PARTY_HOST) and any(host.endswith(t) for t in TRACKING_HOSTS):
+            return 'analytics'
+        if request.resource_type in BLOCKED_RESOURCE_TYPES:
+            return request.resource_type
+        return None
+
+    async def install(self, context):
+        if self.mode not in ('block', 'audit'):
+            return
+        await context.route('**/*', self._handle)
+        if self.mode == 'audit':
+            context.on('response', self._on_response)
+
+    async def _handle(self, route):
+        request = route.request
+        category = self.classify(request)
+        if category is None:
+            self.allowed += 1
+            await route.continue_()
+            return
+
+        self.matched[category] = self.matched.get(category, 0) + 1
+        if self.mode == 'audit':
+            self._audited[request.url] = category
+            await route.continue_()
+            return
+
+        size = self.known_sizes.get(request.url)
+        if size is None:
+            self.unknown_size += 1
+        else:
+            self.matched_bytes[category] = self.matched_bytes.get(category, 0) + size
+        await route.abort()
+
+    def _on_response(self, response):
+        category = self._audited.pop(response.url, None)
+        if category is None:
+            return
+        try:
+            size = int(response.headers.get('content-length', ''))
+        except ValueError:
+            self.unknown_size += 1
+            return
+        self.known_sizes[response.url] = size
+        self.matched_bytes[category] = self.matched_bytes.get(category, 0) + size
+
+    def summary(self):
+        return {
+            'mode': self.mode,
+            'requests_saved': sum(self.matched.values()),
+            'bytes_saved': sum(self.matched_bytes.values()),
+            'unknown_size': self.unknown_size,
+            'requests_allowed': self.allowed,
+            'by_category': {
+                category: {'requests': count, 'bytes': self.matched_bytes.get(category, 0)}
+                for category, count in sorted(self.matched.items())
+            },
+        }
+
+    def print_report(self):
+        if self.mode not in ('block', 'audit'):
+            return
+        report = self.summary()
+        label = '차단' if self.mode == 'block' else '차단 대상 (audit)'
+        print(f"🚫 리소스 {label}: 요청 {report['requests_saved']}개, "
+              f"{report['bytes_saved'] / 1024:.1f}KB 절감 (통과 {report['requests_allowed']}개, 크기 미상 {report['unknown_size']}개)")
+        for category, item in report['by_category'].items():
+            print(f"   - {category}: {item['requests']}개 / {item['bytes'] / 1024:.1f}KB")
+
+
+# 로컬 상태 암호화 - SESSION_CACHE_KEY 패스프레이즈로 .cache/에 남는 세션/개인정보를 AES-GCM으로 암호화
+STATE_CIPHER_MAGIC = b'SSC2'
+SEALED_PREFIX = 'enc:'
+
+
+class StateCipher:
+    """SESSION_CACHE_KEY 기반 AES-256-GCM 암호화 (cryptography 패키지의 AESGCM)
+
+    키는 패스프레이즈에서 PBKDF2-HMAC-SHA256으로 파생하고 salt별로 한 번만 계산한다.
+    형식: MAGIC(4) + salt(16) + nonce(12) + 암호문(태그 포함). 용도(purpose)를 associated data로 넣어
+    다른 용도로 만든 암호문은 복호화되지 않는다.
+    """
+
+    def __init__(self, passphrase):
+        # 선택 의존성 - 없으면 ImportError (from_env()에서 처리)
+        from cryptography.exceptions import InvalidTag
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        self._aesgcm = AESGCM
+        self._invalid_tag = InvalidTag
+        self.passphrase = passphrase.encode('utf-8')
+        self.salt = os.urandom(16)
+        self._keys = {}
+
+    @classmethod
+    def from_env(cls):
+        """SESSION_CACHE_KEY가 있고 cryptography를 쓸 수 있으면 StateCipher, 아니면 None"""
+        passphrase = os.getenv('SESSION_CACHE_KEY', '')
+        if not passphrase:
+            return None
+        try:
+            return cls(passphrase)
+        except ImportError:
+            print("⚠️ cryptography 패키지가 없어 세션 캐시를 사용하지 않음 (pip install cryptography)")
+            return None
+
+    def _key(self, salt):
+        if salt not in self._keys:
+            self._keys[salt] = hashlib.pbkdf2_hmac('sha256', self.passphrase, salt, 200000, dklen=32)
+        return self._keys[salt]
+
+    def encrypt(self, plaintext, purpose):
+        header = STATE_CIPHER_MAGIC + self.salt
+        nonce = os.urandom(12)
+        return header + nonce + self._aesgcm(self._key(self.salt)).encrypt(nonce, plaintext, header + purpose)
+
+    def decrypt(self, blob, purpose):
+        """복호화 (형식/키/무결성 검증 실패 시 None)"""
+        if len(blob) < 48 or not blob.startswith(STATE_CIPHER_MAGIC):
+            return None
+        header, nonce, ciphertext = blob[:20], blob[20:32], blob[32:]
+        try:
+            return self._aesgcm(self._key(blob[4:20])).decrypt(nonce, ciphertext, header + purpose)
+        except self._invalid_tag:
+            return None
+
+    def seal(self, text, purpose):
+        """JSON에 넣을 문자열 필드 암호화 ('enc:' + base64)"""
+        return SEALED_PREFIX + base64.urlsafe_b64encode(self.encrypt(text.encode('utf-8'), purpose)).decode('ascii')
+
+    def unseal(self, token, purpose):
+        """seal()한 문자열 복호화 (암호문이 아니거나 검증 실패 시 None)"""
+        if not isinstance(token, str) or not token.startswith(SEALED_PREFIX):
+            return None
+        try:
+            blob = base64.urlsafe_b64decode(token[len(SEALED_PREFIX):].encode('ascii'))
+        except ValueError:
+            return None
+        plaintext = self.decrypt(blob, purpose)
+        return plaintext.decode('utf-8') if plaintext is not None else None
+
+
+# 세션 캐시 - 로그인 후 storage state(쿠키/로컬스토리지)를 암호화 저장
+SESSION_CACHE_PATH = os.path.join('.cache', 'session_state.bin')
+
+
+class SessionCache:
+    """로그인 세션(storage state) 암호화 캐시
+
+    StateCipher(AES-GCM)로 암호화해 권한 0600으로 저장한다.
+    키가 다르거나 손상된 파일(이전 형식 포함)은 무시하고, 로그인 ID가 바뀌면 캐시를 쓰지 않는다.
+    """
+
+    def __init__(self, cipher, login_id, path=SESSION_CACHE_PATH):
+        self.cipher = cipher
+        self.account = hashlib.sha256(login_id.encode('utf-8')).hexdigest()
+        self.path = path
+
+    def load(self):
+        """저장된 storage state 반환 (없거나 검증 실패 시 None)"""
+        try:
+            with open(self.path, 'rb') as f:
+                plaintext = self.cipher.decrypt(f.read(), b'session')
+        except OSError:
+            return None
+        if plaintext is None:
+            print("⚠️ 세션 캐시 검증 실패 (키 불일치 또는 손상) - 무시")
+            return None
+        try:
+            payload = json.loads(plaintext.decode('utf-8'))
+        except ValueError:
+            return None
+        if payload.get('account') != self.account:
+            print("⚠️ 세션 캐시의 계정이 다름 - 무시")
+            return None
+        return payload.get('storage_state')
+
+    def save(self, storage_state):
+        payload = json.dumps({
+            'account': self.account,
+            'saved_at': datetime.now().isoformat(timespec='seconds'),
+            'storage_state': storage_state,
+        }).encode('utf-8')
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self.cipher.encrypt(payload, b'session'))
+            print("💾 세션 캐시 저장 완료")
+        except OSError as e:
+            print(f"⚠️ 세션 캐시 저장 실패: {e}")
+
+
+# 적응형 페이싱 - 오류 신호 시 지연을 배수로 늘리고 성공 시 일정량씩 줄임 (AIMD)
+PACING_ERROR_PATTERNS = ("통신 중 오류", "점검")
+PACING_ERROR_STATUSES = {'error', 'timeout_error', 'page_load_fail', 'server_maintenance', 'process_error'}
+
+
+class PacingController:
+    """매물 간/재시도 간 지연을 사이트 상태에 맞춰 조절
+
+    지연 0ms에서 시작해 오류 신호(타임아웃/처리 오류, "통신 중 오류"·"점검" 팝업, page_load_fail)가
+    들어오면 배수로 늘리고(최소 base_ms), 성공할 때마다 step_ms씩 줄인다.
+    """
+
+    def __init__(self, initial_ms=0, base_ms=500, factor=2.0, step_ms=250, max_ms=8000):
+        self.delay_ms = initial_ms
+        self.base_ms = base_ms
+        self.factor = factor
+        self.step_ms = step_ms
+        self.max_ms = max_ms
+        self.adjustments = []  # [{'at', 'signal', 'from_ms', 'to_ms'}]
+        self.total_wait_ms = 0
+
+    def _adjust(self, new_delay, signal):
+        new_delay = int(max(0, min(self.max_ms, new_delay)))
+        if new_delay == self.delay_ms:
+            return
+        icon = "🐢" if new_delay > self.delay_ms else "🐇"
+        print(f"{icon} 페이싱 조정: {self.delay_ms}ms → {new_delay}ms ({signal})")
+        self.adjustments.append({
+            'at': datetime.now().strftime('%H:%M:%S'),
+            'signal': signal,
+            'from_ms': self.delay_ms,
+            'to_ms': new_delay,
+        })
+        self.delay_ms = new_delay
+
+    def back_off(self, signal):
+        self._adjust(max(self.base_ms, self.delay_ms * self.factor), signal)
+
+    def speed_up(self):
+        self._adjust(self.delay_ms - self.step_ms, 'success')
+
+    def observe_dialog(self, message):
+        """DialogBus 리스너: 통신 오류/점검 팝업이면 감속"""
+        for pattern in PACING_ERROR_PATTERNS:
+            if pattern in message:
+                self.back_off(f"popup:{pattern}")
+                return
+
+    def record(self, outcome):
+        """매물 처리 결과((성공, 상태) 튜플/bool/예외)로 조정"""
+        if isinstance(outcome, Exception):
+            self.back_off(type(outcome).__name__)
+            return
+        success, status = outcome if isinstance(outcome, tuple) else (bool(outcome), None)
+        if status in PACING_ERROR_STATUSES:
+            self.back_off(status)
+        elif success:
+            self.speed_up()
+
+    async def pause(self, page):
+        if self.delay_ms > 0:
+            self.total_wait_ms += self.delay_ms
+            await page.wait_for_timeout(self.delay_ms)
+
+
+# 실행 결과 파일 (워크플로우가 로그 grep 대신 읽는 기계 판독용 결과)
+RUN_RESULT_PATH = os.path.join('results', 'run_result.json')
+RUN_RESULT_VERSION = 1
+
+# 최종 상태 코드 → 실패 사유 (이메일 리포트/FAIL_DETAIL/실행 결과 공통)
+REASON_MAP = {
+    'success': '성공',
+    'saved': '광고 저장됨(결제 미완료)',
+    'failed': '결제 실패',
+    'not_found': '종료매물에서 미발견',
+    'exposure_ended': '노출종료 후 재광고 실패',
+    'server_maintenance': '네이버 서버 점검',
+    'page_load_fail': '페이지 로딩 실패',
+    'pagination_blocked': '팝업으로 페이지 이동 차단',
+    'no_readd_button': '재광고 버튼 없음',
+    'timeout_error': '타임아웃 오류',
+    'process_error': '처리 중 오류',
+    'process_failed': '처리 실패',
+    'not_rocket': '로켓등록 상품 아님',
+    'exposure_not_found': '매물을 찾을 수 없습니다',
+    'exposure_error': '처리 중 오류 발생',
+    'exposure_failed': '노출종료 실패',
+    'not_processed': '처리 안됨',
+}
+
+
+def exposure_status_code(status):
+    """1단계 노출종료 실패 상태 → 최종 상태 코드"""
+    if status == "not_rocket":
+        return 'not_rocket'
+    if status is None:
+        return 'exposure_not_found'
+    if status == "error":
+        return 'exposure_error'
+    return 'exposure_failed'
+
+
+# 현재 실행 단계 이름 (RunRecorder.stage가 설정, 프로파일러의 단계별 집계에 사용)
+CURRENT_STAGE = contextvars.ContextVar('current_stage', default='setup')
+
+
+class RunRecorder:
+    """매물별 단계 결과/소요 시간/재시도 횟수를 모아 RUN_RESULT_PATH에 저장
+
+    매물명은 공개 저장소에 커밋되므로 마스킹된 이름만 기록한다.
+    """
+
+    def __init__(self, property_numbers, test_mode=False):
+        self.started_at = datetime.now()
+        self._started = time.perf_counter()
+        self.test_mode = test_mode
+        self.stage_timings = {}
+        self.properties = {
+            num: {'status': None, 'reason': None, 'stages': {}, 'retries': 0}
+            for num in property_numbers
+        }
+        self.extra = {}
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """전체 단계 소요 시간 측정 (with 블록 안에서 await 가능)"""
+        started = time.perf_counter()
+        token = CURRENT_STAGE.set(name)
+        try:
+            yield
+        finally:
+            CURRENT_STAGE.reset(token)
+            self.stage_timings[name] = round(self.stage_timings.get(name, 0) + time.perf_counter() - started, 2)
+
+    def _entry(self, property_number):
+        return self.properties.setdefault(
+            property_number, {'status': None, 'reason': None, 'stages': {}, 'retries': 0}
+        )
+
+    def record(self, property_number, stage, outcome, seconds=None):
+        """매물의 단계 결과 기록 (outcome: (성공, 상태) 튜플/bool/예외)"""
+        if isinstance(outcome, Exception):
+            success, status = False, type(outcome).__name__
+        elif isinstance(outcome, tuple):
+            success, status = outcome
+        else:
+            success, status = bool(outcome), None
+        item = {'success': bool(success), 'status': status}
+        if seconds is not None:
+            item['seconds'] = round(seconds, 2)
+        self._entry(property_number)['stages'][stage] = item
+
+    async def track(self, property_number, stage, action):
+        """작업(awaitable)을 실행하며 소요 시간과 결과를 기록"""
+        started = time.perf_counter()
+        try:
+            outcome = await action
+        except Exception as e:
+            self.record(property_number, stage, e, time.perf_counter() - started)
+            raise
+        self.record(property_number, stage, outcome, time.perf_counter() - started)
+        return outcome
+
+    def add_retry(self, property_number):
+        self._entry(property_number)['retries'] += 1
+
+    def finish(self, property_number, status, **fields):
+        entry = self._entry(property_number)
+        entry['status'] = status
+        entry['reason'] = REASON_MAP.get(status, status)
+        entry.update({key: value for key, value in fields.items() if value is not None})
+
+    def build(self, aborted=None):
+        properties = self.properties
+        success = [num for num, item in properties.items() if item['status'] == 'success']
+        failed = [num for num, item in properties.items() if item['status'] != 'success']
+        return {
+            'version': RUN_RESULT_VERSION,
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'finished_at': datetime.now().isoformat(timespec='seconds'),
+            'test_mode': self.test_mode,
+            'aborted': aborted,
+            'total_count': len(properties),
+            'success_count': len(success),
+            'failed_properties': failed,
+            'stage_timings': dict(self.stage_timings, total=round(time.perf_counter() - self._started, 2)),
+            'properties': properties,
+            **self.extra,
+        }
+
+    def write(self, path=RUN_RESULT_PATH, aborted=None):
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.build(aborted), f, ensure_ascii=False, indent=2)
+            print(f"📝 실행 결과 저장: {path}")
+        except OSError as e:
+            print(f"⚠️ 실행 결과 저장 실패: {e}")
+
+
+# 진행 저널 - 매물별 단계 전이를 추가 기록하여 크래시 후 재실행 시 마지막 단계부터 이어서 처리
+PROGRESS_JOURNAL_PATH = os.path.join('.cache', 'progress_journal.jsonl')
+PROGRESS_STAGES = ('found', 'exposure_ended', 'fullname', 're_registered', 'saved', 'paid')
+
+
+class ProgressJournal:
+    """추가 전용(append-only) 매물 진행 저널
+
+    한 줄에 하나의 단계 전이 {"ts", "property", "stage", ...}를 JSON으로 기록하고 매번 flush + fsync 하므로
+    프로세스가 죽어도 마지막으로 기록된 단계는 남는다. 매물의 상태는 PROGRESS_STAGES 순서상 가장 앞선
+    단계이며, 배치가 정상 종료되면 clear()로 삭제한다. 중단된 배치의 기록도 ttl_hours가 지나면 무시하고
+    로드 시 파일에서 정리한다.
+    .cache/는 Actions 캐시로 다른 실행에서도 복원되므로 fullName은 cipher(StateCipher)가 있을 때만 암호화해
+    기록하고, 없으면 기록하지 않는다 (재개 시 실제 행에서 다시 읽음). 이전 형식의 평문 fullName은 로드 시 지운다.
+    """
+
+    def __init__(self, enabled=True, path=PROGRESS_JOURNAL_PATH, ttl_hours=12, cipher=None):
+        self.enabled = enabled
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600
+        self.cipher = cipher
+        self.states = {}
+
+    @staticmethod
+    def rank(stage):
+        return PROGRESS_STAGES.index(stage) if stage in PROGRESS_STAGES else -1
+
+    def _apply(self, entry):
+        state = self.states.setdefault(entry['property'], {'stage': None})
+        if self.rank(entry['stage']) >= self.rank(state['stage']):
+            state['stage'] = entry['stage']
+            state['ts'] = entry['ts']
+        state.update({key: value for key, value in entry.items()
+                      if key not in ('property', 'stage', 'ts') and value is not None})
+
+    def _seal(self, entry):
+        """디스크에 쓸 기록 (fullName은 암호화하거나 제외)"""
+        if 'fullname' not in entry:
+            return entry
+        sealed = dict(entry)
+        fullname = sealed.pop('fullname')
+        if self.cipher:
+            sealed['fullname'] = self.cipher.seal(fullname, b'fullname')
+        return sealed
+
+    def _unseal(self, entry):
+        """디스크에서 읽은 기록 (복호화하지 못한 fullName은 제외)"""
+        if 'fullname' not in entry:
+            return entry
+        opened = dict(entry)
+        token = opened.pop('fullname')
+        fullname = self.cipher.unseal(token, b'fullname') if self.cipher else None
+        if fullname is not None:
+            opened['fullname'] = fullname
+        return opened
+
+    def load(self):
+        """유효 기간 내 기록을 읽어 매물별 상태 복원 (마지막 줄이 잘린 경우 등 손상된 줄은 무시)"""
+        if not self.enabled:
+            return self.states
+        now = time.time()
+        kept, dropped = [], 0
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        expired = now - entry['ts'] > self.ttl_seconds
+                    except (ValueError, KeyError, TypeError):
+                        dropped += 1
+                        continue
+                    if expired:
+                        dropped += 1
+                        continue
+                    if isinstance(entry.get('fullname'), str) and not entry['fullname'].startswith(SEALED_PREFIX):
+                        # 이전 형식의 평문 fullName은 파일에서 지움
+                        del entry['fullname']
+                        line = json.dumps(entry, ensure_ascii=False)
+                        dropped += 1
+                    kept.append(line if line.endswith('\n') else line + '\n')
+                    self._apply(self._unseal(entry))
+        except OSError:
+            return self.states
+
+        if dropped:
+            # 만료/손상/평문 기록 정리 (임시 파일에 쓴 뒤 교체)
+            try:
+                temp_path = self.path + '.tmp'
+                fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.writelines(kept)
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                print(f"⚠️ 진행 저널 정리 실패: {e}")
+        return self.states
+
+    def mark(self, property_number, stage, **data):
+        """단계 전이 기록 (디스크에 반영된 뒤 반환)"""
+        if not self.enabled:
+            return
+        entry = {'ts': round(time.time(), 3), 'property': property_number, 'stage': stage}
+        entry.update({key: value for key, value in data.items() if value is not None})
+        self._apply(entry)
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+            with os.fdopen(fd, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(self._seal(entry), ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            print(f"⚠️ 진행 저널 기록 실패: {e}")
+
+    def stage_of(self, property_number):
+        return self.states.get(property_number, {}).get('stage')
+
+    def clear(self):
+        """배치가 정상 종료되면 기록 삭제 (같은 매물이 다시 배정되면 처음부터 처리)"""
+        self.states = {}
+        if not self.enabled:
+            return
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"⚠️ 진행 저널 삭제 실패: {e}")
+
+
+# 목록 메타데이터 캐시 - 매물 위치/광고유형/fullName을 실행 간에 보관 (검색 힌트, 실제 행으로 항상 갱신)
+LISTING_CACHE_PATH = os.path.join('.cache', 'listing_cache.json')
+
+
+def is_rocket(ad_type):
+    """광고유형이 로켓등록인지 (기존과 같이 8번째 칸이 없으면(None) 로켓등록으로 간주, 빈 칸은 로켓등록 아님)"""
+    return ad_type is None or "로켓등록" in ad_type
+
+
+class ListingCache:
+    """매물번호별 목록 메타데이터 캐시 {매물번호: {page, page_updated_at, ad_type, fullname, updated_at}}
+
+    ttl_hours가 지난 항목은 get()에서 쓰지 않는다. 페이지 위치는 목록 검색 결과처럼 페이지를 모르는 채로
+    갱신될 수 있으므로 page_updated_at으로 따로 판단한다 (page_of()). 캐시는 검색 시작 위치와 fullName 미리 채우기에만 쓰고
+    (로켓등록 여부 등 판정은 항상 실제 행으로), 실제 행을 읽을 때마다 update()로 덮어써서 어긋난 항목이
+    다음 실행부터 고쳐지도록 한다.
+    fullName은 ProgressJournal과 마찬가지로 cipher가 있을 때만 암호화해 저장하고, 없으면 저장하지 않는다.
+    """
+
+    def __init__(self, enabled=True, path=LISTING_CACHE_PATH, ttl_hours=72, cipher=None):
+        self.enabled = enabled
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600
+        self.cipher = cipher
+        self.entries = {}
+        self.changed = False
+
+    def load(self):
+        if not self.enabled:
+            return self
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+        for entry in self.entries.values():
+            if 'fullname' not in entry:
+                continue
+            token = entry.pop('fullname')
+            fullname = self.cipher.unseal(token, b'fullname') if self.cipher else None
+            if fullname is not None:
+                entry['fullname'] = fullname
+            elif not str(token).startswith(SEALED_PREFIX):
+                self.changed = True  # 이전 형식의 평문 fullName은 다음 저장 시 지움
+        return self
+
+    def _sealed_entries(self):
+        """디스크에 쓸 항목 (fullName은 암호화하거나 제외)"""
+        sealed = {}
+        for num, entry in self.entries.items():
+            entry = dict(entry)
+            fullname = entry.pop('fullname', None)
+            if fullname and self.cipher:
+                entry['fullname'] = self.cipher.seal(fullname, b'fullname')
+            sealed[num] = entry
+        return sealed
+
+    def get(self, property_number):
+        """유효 기간 내 항목 (없거나 만료 시 None)"""
+        entry = self.entries.get(property_number)
+        if not entry or time.time() - entry.get('updated_at', 0) > self.ttl_seconds:
+            return None
+        return entry
+
+    def page_of(self, property_number):
+        """유효 기간 내에 실제로 확인된 페이지 위치 (없거나 만료 시 None)"""
+        entry = self.entries.get(property_number) or {}
+        checked_at = entry.get('page_updated_at', entry.get('updated_at', 0))
+        if not entry.get('page') or time.time() - checked_at > self.ttl_seconds:
+            return None
+        return entry['page']
+
+    def update(self, property_number, **fields):
+        """실제 행에서 다시 읽은 필드만 갱신 (None인 필드는 기존 값과 확인 시각 유지)"""
+        if not self.enabled:
+            return
+        now = round(time.time())
+        entry = self.entries.setdefault(property_number, {})
+        entry.update({key: value for key, value in fields.items() if value is not None})
+        entry['updated_at'] = now
+        if fields.get('page') is not None:
+            entry['page_updated_at'] = now
+        self.changed = True
+
+    def forget(self, property_number, *fields):
+        """항목 전체 삭제 (fields를 주면 해당 필드만 삭제)"""
+        entry = self.entries.get(property_number)
+        if entry is None:
+            return
+        if not fields:
+            del self.entries[property_number]
+        else:
+            for key in fields:
+                entry.pop(key, None)
+        self.changed = True
+
+    def save(self):
+        if not self.enabled or not self.changed:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temp_path = self.path + '.tmp'
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._sealed_entries(), f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+            self.changed = False
+            print(f"🗃️ 목록 캐시 저장: {len(self.entries)}개 매물")
+        except OSError as e:
+            print(f"⚠️ 목록 캐시 저장 실패: {e}")
+
+
+# 스팬 트레이서 - Chrome trace / Perfetto(ui.perfetto.dev)에서 열 수 있는 JSON으로 내보냄
+TRACE_LANE = contextvars.ContextVar('trace_lane', default='main')
+
+
+class SpanTracer:
+    """계층형 비동기 스팬 트레이서
+
+    스팬은 Chrome trace의 complete 이벤트(ph='X')로 기록되고, 같은 레인(tid)에서 시간 포함 관계로
+    중첩되어 보인다. 레인은 TRACE_LANE 컨텍스트 변수(워커 탭 이름)로 나뉜다.
+    비활성화 상태에서는 아무것도 기록하지 않는다.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.events = []
+        self.lanes = {}
+        self._origin = time.perf_counter()
+
+    def _lane_id(self, lane):
+        if lane not in self.lanes:
+            self.lanes[lane] = len(self.lanes) + 1
+        return self.lanes[lane]
+
+    def start(self, name, cat='action', **args):
+        """수동 스팬 시작 (finish()로 종료) - with 블록으로 감싸기 어려운 긴 분기용"""
+        if not self.enabled:
+            return None
+        return {'name': name, 'cat': cat, 'args': args, 'lane': TRACE_LANE.get(), 'start': time.perf_counter()}
+
+    def finish(self, span, **args):
+        if span is None:
+            return
+        end = time.perf_counter()
+        span['args'].update(args)
+        self.events.append({
+            'name': span['name'],
+            'cat': span['cat'],
+            'ph': 'X',
+            'ts': round((span['start'] - self._origin) * 1e6),
+            'dur': round((end - span['start']) * 1e6),
+            'pid': 1,
+            'tid': self._lane_id(span['lane']),
+            'args': {key: value for key, value in span['args'].items() if value is not None},
+        })
+
+    @contextlib.contextmanager
+    def span(self, name, cat='action', **args):
+        span = self.start(name, cat, **args)
+        try:
+            yield span
+        except BaseException as e:
+            if span is not None:
+                span['args']['error'] = type(e).__name__
+            raise
+        finally:
+            self.finish(span)
+
+    def export(self, path):
+        if not self.enabled:
+            return
+        metadata = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': tid, 'args': {'name': lane}}
+            for lane, tid in self.lanes.items()
+        ]
+        metadata.append({'name': 'process_name', 'ph': 'M', 'pid': 1, 'args': {'name': 'property automation'}})
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'traceEvents': metadata + self.events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+            print(f"🧵 트레이스 저장: {path} ({len(self.events)}개 스팬)")
+        except OSError as e:
+            print(f"⚠️ 트레이스 저장 실패: {e}")
+
+
+def traced(name=None, cat='action'):
+    """MultiPropertyAutomation 비동기 메서드를 self.tracer 스팬으로 감싸는 데코레이터
+
+    메서드에 property_number 인자가 있으면 스팬 args에 기록한다.
+    """
+    def decorator(method):
+        span_name = name or method.__name__
+        params = list(inspect.signature(method).parameters)
+        position = params.index('property_number') if 'property_number' in params else None
+
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            if not self.tracer.enabled:
+                return await method(self, *args, **kwargs)
+            property_number = kwargs.get('property_number')
+            if property_number is None and position is not None and position - 1 < len(args):
+                property_number = args[position - 1]
+            with self.tracer.span(span_name, cat, property=property_number):
+                return await method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# Playwright 호출 프로파일러 (PLAYWRIGHT_PROFILE=true 일 때만 설치)
+PROFILE_PATH = os.path.join('results', 'playwright_profile.json')
+PROFILED_METHODS = {
+    'Page': ('goto', 'query_selector', 'query_selector_all', 'wait_for_selector', 'wait_for_timeout',
+             'wait_for_function', 'wait_for_url', 'wait_for_load_state', 'evaluate', 'eval_on_selector_all',
+             'click', 'fill', 'screenshot'),
+    'ElementHandle': ('query_selector', 'query_selector_all', 'inner_text', 'get_attribute', 'click', 'evaluate'),
+}
+
+
+class PlaywrightProfiler:
+    """Page/ElementHandle API를 클래스 단위로 감싸 호출 수와 누적 지연을 집계
+
+    집계 키는 메서드(Page.click 등), 호출 위치(호출한 MultiPropertyAutomation 메서드),
+    단계(CURRENT_STAGE) 세 가지이며, 실행 종료 시 상위 N개 표를 출력하고 PROFILE_PATH에 저장한다.
+    wait_for_timeout으로 요청한 고정 대기 시간은 sleep_ms로 따로 합산한다.
+    """
+
+    def __init__(self, enabled=False, owner='MultiPropertyAutomation', top_n=15, path=PROFILE_PATH):
+        self.enabled = enabled
+        self.owner_prefix = owner + '.'
+        self.top_n = top_n
+        self.path = path
+        self.by_method = {}
+        self.by_site = {}
+        self.by_phase = {}
+        self.by_site_method = {}
+        self.sleep_ms = 0
+        self._originals = []
+
+    def install(self):
+        if not self.enabled or self._originals:
+            return
+        import playwright.async_api as api
+        for class_name, names in PROFILED_METHODS.items():
+            cls = getattr(api, class_name)
+            for name in names:
+                original = getattr(cls, name)
+                self._originals.append((cls, name, original))
+                setattr(cls, name, self._wrap(f"{class_name}.{name}", original))
+
+    def uninstall(self):
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+        self._originals = []
+
+    def call_site(self, frame):
+        """호출 스택에서 가장 가까운 MultiPropertyAutomation 메서드 이름 (내부 함수는 바깥 메서드로 묶음)"""
+        while frame is not None:
+            qualname = frame.f_code.co_qualname
+            if qualname.startswith(self.owner_prefix):
+                return qualname[len(self.owner_prefix):].split('.')[0]
+            frame = frame.f_back
+        return '(외부)'
+
+    def _add(self, table, key, elapsed_ms):
+        item = table.setdefault(key, [0, 0.0])
+        item[0] += 1
+        item[1] += elapsed_ms
+
+    def _wrap(self, key, original):
+        profiler = self
+
+        async def wrapper(target, *args, **kwargs):
+            site = profiler.call_site(sys._getframe(1))
+            phase = CURRENT_STAGE.get()
+            if key.endswith('.wait_for_timeout'):
+                profiler.sleep_ms += args[0] if args else kwargs.get('timeout', 0)
+            started = time.perf_counter()
+            try:
+                return await original(target, *args, **kwargs)
+            finally:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                profiler._add(profiler.by_method, key, elapsed_ms)
+                profiler._add(profiler.by_site, site, elapsed_ms)
+                profiler._add(profiler.by_phase, phase, elapsed_ms)
+                profiler._add(profiler.by_site_method, (site, key), elapsed_ms)
+        return functools.wraps(original)(wrapper)
+
+    @property
+    def total_calls(self):
+        return sum(count for count, _ in self.by_method.values())
+
+    @staticmethod
+    def _rows(table):
+        rows = [
+            {'key': key, 'calls': count, 'total_ms': round(total, 1), 'avg_ms': round(total / count, 2)}
+            for key, (count, total) in table.items()
+        ]
+        return sorted(rows, key=lambda row: -row['total_ms'])
+
+    def summary(self):
+        return {
+            'total_calls': self.total_calls,
+            'total_ms': round(sum(total for _, total in self.by_method.values()), 1),
+            'sleep_ms': self.sleep_ms,
+            'by_method': self._rows(self.by_method),
+            'by_call_site': self._rows(self.by_site),
+            'by_phase': self._rows(self.by_phase),
+            'by_call_site_method': [
+                dict(row, key=f"{row['key'][0]} → {row['key'][1]}") for row in self._rows(self.by_site_method)
+            ],
+        }
+
+    def print_report(self, summary):
+        print(f"\n🔬 Playwright 호출 프로파일: {summary['total_calls']}회, "
+              f"누적 {summary['total_ms'] / 1000:.1f}초 (고정 대기 {summary['sleep_ms'] / 1000:.1f}초)")
+        for title, rows in (('호출 위치 → 메서드', summary['by_call_site_method']), ('단계', summary['by_phase'])):
+            print(f"   [{title} 상위 {self.top_n}]")
+            print(f"   {'누적(ms)':>10} {'호출':>6} {'평균(ms)':>9}  항목")
+            for row in rows[:self.top_n]:
+                print(f"   {row['total_ms']:>10.1f} {row['calls']:>6} {row['avg_ms']:>9.2f}  {row['key']}")
+
+    def finish(self):
+        """표 출력 + PROFILE_PATH 저장 후 패치 해제 (비활성화 시 아무것도 하지 않음)"""
+        if not self.enabled:
+            return
+        self.uninstall()
+        summary = self.summary()
+        self.print_report(summary)
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, ensure_ascii=False, indent=2)
+            print(f"📝 프로파일 저장: {self.path}")
+        except OSError as e:
+            print(f"⚠️ 프로파일 저장 실패: {e}")
+
+
+class ShardListLock:
+    """샤드 프로세스 간 매물 목록 잠금 (파일 잠금, 같은 프로세스의 탭끼리는 공유)
+
+    샤드는 같은 계정의 같은 목록을 보므로 한 샤드의 노출종료/재광고가 다른 샤드가 읽는 행을 당긴다.
+    목록을 훑고 행을 클릭하는 구간만 이 잠금으로 한 번에 한 샤드씩 진행하고, 로그인과 광고등록/결제는
+    샤드끼리 동시에 진행한다. 중첩해서 잡을 수 있으며, path가 없으면(샤드 실행이 아니면) 아무것도 하지 않는다.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._guard = asyncio.Lock()
+        self._holders = 0
+        self._fd = None
+
+    async def acquire(self):
+        if not self.path:
+            return
+        async with self._guard:
+            if self._holders == 0:
+                import fcntl  # 샤드 실행(리눅스 러너)에서만 필요
+                fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+                try:
+                    try:
+                        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except BlockingIOError:
+                        print("⏳ 다른 샤드의 목록 작업 대기 중...")
+                        await asyncio.to_thread(fcntl.flock, fd, fcntl.LOCK_EX)
+                except BaseException:
+                    os.close(fd)
+                    raise
+                self._fd = fd
+            self._holders += 1
+
+    def release(self):
+        if not self.path:
+            return
+        self._holders -= 1
+        if self._holders == 0:
+            os.close(self._fd)  # 파일을 닫으면 잠금도 풀림
+            self._fd = None
+
+    @contextlib.asynccontextmanager
+    async def hold(self):
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+
+class PagePool:
+    """같은 브라우저 컨텍스트(로그인 세션 공유)의 탭 N개로 구성된 워커 풀
+
+    워커는 (page, dialog bus) 쌍이며, 세마포어로 동시 작업 수를 탭 수로 제한하고
+    유휴 워커는 큐에서 꺼내 쓴다. 탭마다 자체 dialog bus를 가지므로
+    한 탭의 alert가 다른 탭의 확인 대기에 섞이지 않는다.
+    """
+
+    def __init__(self, workers):
+        self.workers = list(workers)
+        self._semaphore = asyncio.Semaphore(len(self.workers))
+        self._idle = asyncio.Queue()
+        for worker in self.workers:
+            self._idle.put_nowait(worker)
+
+    def __len__(self):
+        return len(self.workers)
+
+    @contextlib.asynccontextmanager
+    async def acquire(self):
+        """유휴 워커 (page, bus) 하나를 빌려 쓰고 반납"""
+        async with self._semaphore:
+            worker = await self._idle.get()
+            try:
+                yield worker
+            finally:
+                self._idle.put_nowait(worker)
+
+    async def map(self, func, items):
+        """items 각각에 대해 func(page, bus, item)을 워커에서 실행 (입력 순서대로 결과 반환, 예외는 결과로 반환)"""
+        async def run(item):
+            async with self.acquire() as (page, bus):
+                TRACE_LANE.set(bus.name)
+                return await func(page, bus, item)
+
+        return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+
 
 class MultiPropertyAutomation:
     def __init__(self):
         self.login_id = os.getenv('LOGIN_ID', '')
         self.login_pw = os.getenv('LOGIN_PASSWORD', '')
-        self.login_url = "https://www.aipartner.com/integrated/login?serviceCode=1000"
-        self.ad_list_url = "https://www.aipartner.com/offerings/ad_list"
+        # 로컬 모의 서버(benchmarks/mock_aipartner.py) 등으로 바꿀 때 LOGIN_URL/AD_LIST_URL 사용
+        self.login_url = os.getenv('LOGIN_URL') or "https://www.aipartner.com/integrated/login?serviceCode=1000"
+        self.ad_list_url = os.getenv('AD_LIST_URL') or "https://www.aipartner.com/offerings/ad_list"
         
-        # 환경변수에서 매물번호들 가져오기
-        property_numbers_str = os.getenv('PROPERTY_NUMBERS', '')
-        self.property_numbers = [
-            num.strip() for num in property_numbers_str.split(',') 
-            if num.strip()
-        ]
-        
-        self.test_mode = os.getenv('TEST_MODE', 'false').lower() == 'true'
+        # 매물번호: PROPERTY_NUMBERS(없으면 data/scheduled_properties.json), 중복만 제거
+        property_input = read_property_input()
+        self.property_numbers = property_input['numbers']
+        # .cache/ 암호화 키 (SESSION_CACHE_KEY 설정 및 cryptography 설치 시) - 세션 캐시, 저장되는 fullName
+        self.state_cipher = StateCipher.from_env()
+        # 목록 메타데이터 캐시 (위치/광고유형/fullName, 실행 간 유지)
+        # 파일 경로는 샤드 실행 시 샤드별 파일로 분리 (LISTING_CACHE_FILE / PROGRESS_JOURNAL_FILE)
+        self.listing_cache = ListingCache(
+            enabled=os.getenv('LISTING_CACHE', 'true').lower() == 'true',
+            path=os.getenv('LISTING_CACHE_FILE') or LISTING_CACHE_PATH,
+            ttl_hours=float(os.getenv('LISTING_CACHE_TTL_HOURS', '72') or 72),
+            cipher=self.state_cipher
+        ).load()
+        self.listing_cache_radius = int(os.getenv('LISTING_CACHE_RADIUS', '2') or 2)
+        # 알려진 목록 위치(직전 실행 결과/목록 캐시/진행 저널) 순으로 정렬해 페이지 k 작업을 모두 끝낸 뒤 k+1로 이동
+        self.journal_path = os.getenv('PROGRESS_JOURNAL_FILE') or PROGRESS_JOURNAL_PATH
+        self.known_positions = load_known_positions(self.property_numbers, self.listing_cache, self.journal_path)
+        if os.getenv('POSITION_ORDER', 'true').lower() == 'true':
+            self.property_numbers = order_by_position(self.property_numbers, self.known_positions)
 
-        self.fullname_mapping = {}
+        self.test_mode = os.getenv('TEST_MODE', 'false').lower() == 'true'
+        # 결과 파일 디렉터리 (샤드 실행 시 샤드별 디렉터리로 분리)
+        self.results_dir = os.getenv('RESULTS_DIR') or 'results'
+        self.email_report_path = os.path.join(self.results_dir, 'email_report.txt')
+        # 노출종료 단계에서 매물 리스트를 한 번만 순회하며 모든 대상을 처리 (기본 활성화)
+        self.single_sweep = os.getenv('SINGLE_SWEEP', 'true').lower() == 'true'
+        # 컨텍스트 단위 오버레이 억제 스크립트 사용 (설치 성공 시 매물 리스트에서 remove_popups는 no-op)
+        self.overlay_suppressor = os.getenv('OVERLAY_SUPPRESSOR', 'true').lower() == 'true'
+        self.overlay_suppressor_installed = False
+        self.ad_list_path = urlparse(self.ad_list_url).path or AD_LIST_PATH
+
+        # 네트워크 응답 기반 완료 감지 (선택) - 응답으로 판정되면 팝업 타임아웃/서버 반영 대기 생략
+        self.network_detector = os.getenv('NETWORK_DETECTOR', 'false').lower() == 'true'
+        # URL 패턴이 설정된 버튼만 감지 (빈 패턴은 모든 URL과 일치하므로 제외)
+        network_patterns = {
+            'naverEnd': os.getenv('NETWORK_PATTERN_NAVER_END', ''),
+            'reReg': os.getenv('NETWORK_PATTERN_RE_REG', ''),
+            'naverSendSave': os.getenv('NETWORK_PATTERN_SEND_SAVE', ''),
+        }
+        self.network_patterns = {action: pattern for action, pattern in network_patterns.items() if pattern}
+        self.response_detectors = {}
+        self.network_confirmed = set()
+
+        # 매물 리스트 URL의 페이지 파라미터 이름 (설정 시 URL로 바로 이동, 예: 'page')
+        self.page_param = os.getenv('AD_LIST_PAGE_PARAM', '')
+        # 매물 리스트 자체 검색 (매물번호/fullName으로 목록을 좁혀 페이지 순회 없이 조회, 미설정 시 페이지 순회)
+        #   AD_LIST_SEARCH_PARAM: 검색어 URL 파라미터 이름 (예: 'keyword') - 설정 시 검색 URL로 바로 이동
+        #   AD_LIST_SEARCH_INPUT/AD_LIST_SEARCH_BUTTON: 검색창/검색 버튼 셀렉터 (버튼이 없으면 Enter)
+        self.search_param = os.getenv('AD_LIST_SEARCH_PARAM', '')
+        self.search_input = os.getenv('AD_LIST_SEARCH_INPUT', '')
+        self.search_button = os.getenv('AD_LIST_SEARCH_BUTTON', '')
+        self.list_search = bool(self.search_param or self.search_input)
+        # 매물별 조회 경로 기록 (search | search_fallback | pagination | sweep)
+        self.lookup_paths = {}
+        # 매물 위치 (매물번호 → 페이지) - 알려진 위치로 시작해 실행 중 발견한 위치로 갱신, 검색 시작 페이지로 사용
+        self.listing_pages = dict(self.known_positions)
+        self.ended_pages = {}
+        # 종료매물 인덱스 {매물번호: 종료매물 목록 내 전체 위치(0부터)} 및 페이지당 행 수
+        self.ended_index = {}
+        self.ended_page_size = 0
+        # 종료매물 목록 탐색/재광고 클릭 잠금 (워커 풀·파이프라인 탭이 인덱스와 목록 행을 동시에 건드리지 않도록)
+        self.ended_lock = asyncio.Lock()
+        # 샤드 간 목록 잠금 (샤드 실행 시 부모가 SHARD_LIST_LOCK 경로를 넘김)
+        self.list_lock = ShardListLock(os.getenv('SHARD_LIST_LOCK') or None)
+        # 워커 풀 크기 (매물별 작업을 동시에 처리할 탭 수, 1이면 기존 단일 탭 순차 처리)
+        self.pool_size = max(1, int(os.getenv('WORKER_POOL_SIZE', '1') or 1))
+        self.page_pool = None
+        # 파이프라인 모드: 노출종료가 확인되는 즉시 두 번째 탭에서 재광고/결제 (1단계와 3단계 중첩)
+        self.pipeline_mode = os.getenv('PIPELINE_MODE', 'false').lower() == 'true' and not self.test_mode
+        self.pipeline_queue = None
+        self.pipeline_results = {}
+        self.pipeline_task = None
+        # 세션 캐시 (SESSION_CACHE_KEY 설정 및 cryptography 설치 시에만 사용)
+        self.session_cache = SessionCache(self.state_cipher, self.login_id) if self.state_cipher else None
+        self.startup_timing = {}
+        # 브라우저 서버 재사용 (BROWSER_SERVER=true 시 CDP 포트의 서버에 접속, 없으면 서버를 띄움)
+        self.browser_server = os.getenv('BROWSER_SERVER', 'false').lower() == 'true'
+        self.browser_server_port = int(os.getenv('BROWSER_SERVER_PORT', '9222') or 9222)
+        self.run_started = None
+        self.run_recorder = RunRecorder(self.property_numbers, self.test_mode)
+        # 스팬 트레이스 (TRACE_OUTPUT 경로 설정 시 Chrome trace JSON 저장)
+        self.trace_output = os.getenv('TRACE_OUTPUT', '')
+        self.tracer = SpanTracer(enabled=bool(self.trace_output))
+        # 진행 저널 (크래시 후 재실행 시 매물별 마지막 단계부터 재개, 테스트 모드에서는 기록하지 않음)
+        self.journal = ProgressJournal(
+            enabled=os.getenv('PROGRESS_JOURNAL', 'true').lower() == 'true' and not self.test_mode,
+            path=self.journal_path,
+            ttl_hours=float(os.getenv('PROGRESS_JOURNAL_TTL_HOURS', '12') or 12),
+            cipher=self.state_cipher
+        )
+        self.resumed = {}
+        # Playwright 호출 프로파일 (PLAYWRIGHT_PROFILE=true 시 results/playwright_profile.json 저장)
+        self.profiler = PlaywrightProfiler(
+            enabled=os.getenv('PLAYWRIGHT_PROFILE', 'false').lower() == 'true',
+            top_n=int(os.getenv('PLAYWRIGHT_PROFILE_TOP', '15') or 15),
+            path=os.path.join(self.results_dir, os.path.basename(PROFILE_PATH))
+        )
+        self.listing_total = None
+        # 적응형 페이싱 (기존 slow_mo=50 및 고정 1초 대기 대체)
+        self.pacing = PacingController(
+            initial_ms=int(os.getenv('PACING_INITIAL_MS', '0') or 0),
+            max_ms=int(os.getenv('PACING_MAX_MS', '8000') or 8000)
+        )
+        # 리소스 라우팅 정책: block(기본) | audit | off, 허용 목록은 콤마 구분 URL 부분 문자열
+        self.resource_policy = ResourcePolicy(
+            mode=os.getenv('RESOURCE_POLICY', 'block').lower(),
+            allowlist=os.getenv('RESOURCE_ALLOWLIST', '').split(',')
+        )
+
+        # fullName은 목록 캐시로 미리 채우고 실제 행을 읽을 때 확인/갱신
+        self.fullname_mapping = {
+            num: self.listing_cache.get(num)['fullname'] for num in self.property_numbers
+            if (self.listing_cache.get(num) or {}).get('fullname')
+        }
         self.property_name_mapping = {}
 
         print(f"🔧 로그인 ID: {self.login_id}")
         print(f"🏠 처리할 매물: {len(self.property_numbers)}개")
         print(f"📋 매물번호: {', '.join(self.property_numbers)}")
+        if property_input['source'] == 'scheduled':
+            print(f"🗓️ 입력: {SCHEDULED_PROPERTIES_PATH}")
+        if property_input['duplicates']:
+            print(f"♻️ 중복 제거: {', '.join(property_input['duplicates'])}")
+        print(f"📍 위치 확인: {len(self.known_positions)}/{len(self.property_numbers)}개")
         print(f"🧪 테스트 모드: {self.test_mode}")
+        print(f"🔎 단일 스윕 검색: {self.single_sweep}")
+        if self.search_param:
+            print(f"🔍 목록 검색: URL 파라미터 '{self.search_param}'")
+        elif self.search_input:
+            print(f"🔍 목록 검색: 검색창 {self.search_input}")
+        else:
+            print(f"🔍 목록 검색: 미설정 (페이지 순회)")
+        print(f"📡 네트워크 응답 감지: {self.network_detector}"
+              + (f" ({', '.join(self.network_patterns) or 'URL 패턴 없음 - 팝업 확인만 사용'})" if self.network_detector else ''))
+        print(f"👷 워커 탭 수: {self.pool_size}")
+        print(f"🔀 파이프라인 모드: {self.pipeline_mode}")
+        print(f"🚫 리소스 정책: {self.resource_policy.mode}")
+        print(f"💾 세션 캐시: {self.session_cache is not None}")
+        print(f"🖥️ 브라우저 서버 재사용: {self.browser_server}")
+        print(f"🔬 호출 프로파일: {self.profiler.enabled}")
+        print(f"📓 진행 저널: {self.journal.enabled}")
+        print(f"🗃️ 목록 캐시: {self.listing_cache.enabled} ({len(self.listing_cache.entries)}개 항목)")
+
+    async def goto(self, page, url, **kwargs):
+        """page.goto + 트레이스 스팬"""
+        with self.tracer.span('goto', 'navigation', url=url.split('?')[0]):
+            return await page.goto(url, **kwargs)
 
     def mask_property_name(self, name):
         """이름 완전 마스킹 (로그/Actions UI 보호용)"""
@@ -36,11 +1565,12 @@ class MultiPropertyAutomation:
             return name
         return "***"
     
+    @traced('login', cat='phase')
     async def login(self, page):
         """로그인 처리"""
         print("🔗 로그인 페이지로 이동 중...")
 
-        await page.goto(self.login_url, timeout=60000, wait_until='domcontentloaded')
+        await self.goto(page, self.login_url, timeout=60000, wait_until='domcontentloaded')
         await page.wait_for_selector('#member-id', timeout=30000)
 
         await page.fill('#member-id', self.login_id)
@@ -74,6 +1604,72 @@ class MultiPropertyAutomation:
         print("✅ 브라우저 안정화 완료")
         return True
     
+    async def open_browser(self, p):
+        """브라우저 준비
+
+        BROWSER_SERVER=true이면 CDP 포트의 장기 실행 서버에 접속하고(없으면 띄운 뒤 접속),
+        아니면 기존처럼 실행마다 Chromium을 새로 띄운다. 어느 경우든 실행마다 새 컨텍스트를 만들고,
+        서버 접속 시 browser.close()는 이번 실행의 컨텍스트만 정리하고 연결을 끊는다.
+        """
+        started = time.perf_counter()
+        browser_mode = 'launch'
+        if self.browser_server:
+            port = self.browser_server_port
+            try:
+                if await asyncio.to_thread(browser_server_alive, port):
+                    browser_mode = 'reused'
+                else:
+                    print(f"🖥️ 브라우저 서버 없음 - 포트 {port}에 새로 시작")
+                    pid = await asyncio.to_thread(launch_browser_server, p.chromium.executable_path, port)
+                    print(f"🖥️ 브라우저 서버 시작 (pid {pid}, 종료: --stop-browser-server)")
+                    browser_mode = 'server_started'
+                browser = await p.chromium.connect_over_cdp(f"http://127.0.0.1:{port}", timeout=10000)
+            except Exception as e:
+                print(f"⚠️ 브라우저 서버 사용 실패 - 직접 실행으로 대체: {e}")
+                browser_mode = 'launch'
+
+        if browser_mode == 'launch':
+            browser = await p.chromium.launch(headless=True, args=BROWSER_LAUNCH_ARGS)
+
+        self.startup_timing = {'browser': browser_mode, 'browser_seconds': round(time.perf_counter() - started, 2)}
+        print(f"🖥️ 브라우저 준비: {self.startup_timing['browser_seconds']}초 ({browser_mode})")
+        return browser
+
+    def mark_first_row(self):
+        """실행 시작부터 매물 리스트 첫 행 표시까지의 시간 기록 (최초 1회)"""
+        if self.run_started is None or 'first_row_seconds' in self.startup_timing:
+            return
+        self.startup_timing['first_row_seconds'] = round(time.perf_counter() - self.run_started, 2)
+        print(f"⏱️ 첫 매물 행 표시까지: {self.startup_timing['first_row_seconds']}초 "
+              f"(브라우저: {self.startup_timing.get('browser')})")
+
+    async def ensure_session(self, context, page, restored):
+        """세션 캐시로 복원된 경우 매물 리스트 접근으로 유효성 확인, 무효하면 기존 login()으로 대체
+
+        Returns:
+            str | None: "session"(캐시 세션 유효) | "login"(로그인 수행) | None(로그인 실패)
+        """
+        if restored:
+            print("💾 세션 캐시 유효성 확인 중...")
+            try:
+                await self.goto(page, self.ad_list_url, timeout=60000, wait_until='domcontentloaded')
+                if '/integrated/login' not in page.url:
+                    await page.wait_for_selector('table tbody tr', state='visible', timeout=30000)
+                    print("✅ 세션 캐시로 로그인 생략")
+                    return "session"
+                print("⚠️ 세션 만료 - 로그인 페이지로 이동됨")
+            except Exception as e:
+                print(f"⚠️ 세션 캐시 확인 실패: {e}")
+            print("🔁 기존 로그인으로 대체")
+
+        if not await self.login(page):
+            return None
+
+        if self.session_cache:
+            self.session_cache.save(await context.storage_state())
+        return "login"
+
+    @traced(cat='property')
     async def process_single_property(self, page, property_number, index, total, popup_messages=None, retry=False, search_in_ended=False):
         """단일 매물 처리 (페이지네이션 포함)
 
@@ -92,9 +1688,9 @@ class MultiPropertyAutomation:
         print(f"{'='*60}")
 
         # 재시도인 경우 추가 대기
-        if retry:
-            print("🔄 재시도 모드: 안정성을 위해 추가 대기...")
-            await page.wait_for_timeout(1000)
+        if retry and self.pacing.delay_ms > 0:
+            print(f"🔄 재시도 모드: 안정성을 위해 추가 대기 ({self.pacing.delay_ms}ms)...")
+            await self.pacing.pause(page)
 
         # 팝업은 전역 리스너(handle_global_popup)가 처리하므로 별도 리스너 불필요
         
@@ -164,7 +1760,7 @@ class MultiPropertyAutomation:
         
         try:
             print("🌐 매물 리스트 페이지로 이동 중...")
-            await page.goto(self.ad_list_url, timeout=60000, wait_until='domcontentloaded')
+            await self.goto(page, self.ad_list_url, timeout=60000, wait_until='domcontentloaded')
 
             # 🎯 스마트 대기: 매물 테이블이 로딩될 때까지 대기
             print("📋 매물 테이블 로딩 대기 중...")
@@ -177,27 +1773,7 @@ class MultiPropertyAutomation:
                 await page.wait_for_selector('table tbody tr', state='visible', timeout=30000)
 
             # 매물 리스트 로딩 후 팝업 제거
-            await page.evaluate('''
-                () => {
-                    // 모든 팝업 오버레이 숨기기
-                    const popups = document.querySelectorAll('img[src*="popup"], div[class*="popup"], div[id*="popup"], .modal, .overlay');
-                    popups.forEach(popup => {
-                        popup.style.display = 'none';
-                        popup.style.visibility = 'hidden';
-                        popup.remove();
-                    });
-
-                    // z-index가 높은 요소들도 제거
-                    const highZIndexElements = document.querySelectorAll('*');
-                    highZIndexElements.forEach(el => {
-                        const zIndex = window.getComputedStyle(el).zIndex;
-                        if (zIndex && parseInt(zIndex) > 1000) {
-                            el.style.display = 'none';
-                            el.remove();
-                        }
-                    });
-                }
-            ''')
+            await self.remove_popups(page)
             print("✅ 매물 리스트 로딩 후 팝업 오버레이 제거 완료")
 
             # 재시도이고 종료매물에서 검색해야 하는 경우
@@ -215,25 +1791,7 @@ class MultiPropertyAutomation:
                     print("✅ 종료매물 목록 로딩 완료")
 
                     # 종료매물 목록 로딩 후 팝업 제거
-                    await page.evaluate('''
-                        () => {
-                            const popups = document.querySelectorAll('img[src*="popup"], div[class*="popup"], div[id*="popup"], .modal, .overlay');
-                            popups.forEach(popup => {
-                                popup.style.display = 'none';
-                                popup.style.visibility = 'hidden';
-                                popup.remove();
-                            });
-
-                            const highZIndexElements = document.querySelectorAll('*');
-                            highZIndexElements.forEach(el => {
-                                const zIndex = window.getComputedStyle(el).zIndex;
-                                if (zIndex && parseInt(zIndex) > 1000) {
-                                    el.style.display = 'none';
-                                    el.remove();
-                                }
-                            });
-                        }
-                    ''')
+                    await self.remove_popups(page)
                     print("✅ 종료매물 목록 로딩 후 팝업 오버레이 제거 완료")
 
                     # 종료매물은 1페이지만 확인 (최신 매물이 맨 위에 있음)
@@ -266,64 +1824,54 @@ class MultiPropertyAutomation:
                 print(f"📄 {current_page}페이지에서 매물 검색 중...")
 
                 # 테이블 찾기 (종료매물이면 클래스 필터 없이, 일반 매물이면 adComplete만)
-                if search_in_ended:
-                    # 종료매물: 클래스 필터 없이 모든 tr 검색
-                    await page.wait_for_selector('table tbody tr', timeout=30000)
-                    rows = await page.query_selector_all('table tbody tr')
-                else:
-                    # 일반 매물: adComplete 클래스만 검색
-                    await page.wait_for_selector('table tbody tr.adComplete', timeout=30000)
-                    rows = await page.query_selector_all('table tbody tr.adComplete')
+                row_selector = 'table tbody tr' if search_in_ended else 'table tbody tr.adComplete'
+                await page.wait_for_selector(row_selector, timeout=30000)
+                records = await self.extract_rows(page, row_selector)
 
-                print(f"📊 {current_page}페이지 매물 수: {len(rows)}개")
+                print(f"📊 {current_page}페이지 매물 수: {len(records)}개")
 
                 # 현재 페이지에서 매물 검색
                 update_success = False
-                for i, row in enumerate(rows, 1):
+                record = self.find_record(records, property_number)
+                if record:
                     try:
-                        # 매물번호가 있는 셀 찾기 (더 정확한 방법)
-                        number_cell = await row.query_selector('td:nth-child(3) > div.numberN')
-                        if number_cell:
-                            number_text = await number_cell.inner_text()
-                            if property_number in number_text.strip():
-                                print(f"🎯 매물번호 {property_number} 발견! ({current_page}페이지, 행 {i})")
-
-                                # 광고유형 확인 (8번째 컬럼)
-                                ad_type_cell = await row.query_selector('td:nth-child(8)')
-                                if ad_type_cell:
-                                    ad_type_text = await ad_type_cell.inner_text()
-                                    print(f"광고유형 확인: {ad_type_text.strip()}")
-
-                                    if "로켓등록" not in ad_type_text:
-                                        print(f"❌ 로켓등록 상품이 아닙니다. (광고유형: {ad_type_text.strip()})")
-                                        return (False, "failed")  # 재시도 불필요
-
-                                    print(f"✅ 로켓등록 상품 확인됨")
-                                else:
-                                    print(f"⚠️ 광고유형 컬럼을 찾을 수 없습니다.")
+                        print(f"🎯 매물번호 {property_number} 발견! ({current_page}페이지, 행 {record['index'] + 1})")
 
-                                # 매물 정보 출력
-                                await self.print_property_info(row, property_number)
+                        # 광고유형 확인 (8번째 컬럼)
+                        if record['ad_type'] is not None:
+                            print(f"광고유형 확인: {record['ad_type']}")
 
-                                # 업데이트 실행 및 결과 확인
-                                if self.test_mode:
-                                    await self.simulate_update(property_number)
-                                    update_success = True  # 테스트 모드는 항상 성공
-                                    status = "success"
-                                else:
-                                    # 종료매물에서 검색한 경우: 재광고 버튼만 클릭하고 광고등록 페이지로 이동
-                                    if search_in_ended:
-                                        update_success = await self.execute_re_register_from_ended(page, row, property_number, popup_messages)
-                                        status = "success" if update_success else "failed"
-                                    else:
-                                        # 일반 매물 리스트: 노출종료부터 전체 프로세스
-                                        update_success, status = await self.execute_real_update(page, row, property_number, popup_messages)
+                            if "로켓등록" not in record['ad_type']:
+                                print(f"❌ 로켓등록 상품이 아닙니다. (광고유형: {record['ad_type']})")
+                                return (False, "failed")  # 재시도 불필요
+
+                            print(f"✅ 로켓등록 상품 확인됨")
+                        else:
+                            print(f"⚠️ 광고유형 컬럼을 찾을 수 없습니다.")
+
+                        row = await self.get_row_handle(page, record, row_selector)
+
+                        # 매물 정보 출력
+                        await self.print_property_info(row, property_number)
 
-                                property_found = True
-                                break
+                        # 업데이트 실행 및 결과 확인
+                        if self.test_mode:
+                            await self.simulate_update(property_number)
+                            update_success = True  # 테스트 모드는 항상 성공
+                            status = "success"
+                        else:
+                            # 종료매물에서 검색한 경우: 재광고 버튼만 클릭하고 광고등록 페이지로 이동
+                            if search_in_ended:
+                                update_success = await self.execute_re_register_from_ended(page, row, property_number, popup_messages)
+                                status = "success" if update_success else "failed"
+                            else:
+                                # 일반 매물 리스트: 노출종료부터 전체 프로세스
+                                update_success, status = await self.execute_real_update(page, row, property_number, popup_messages)
                     except Exception as e:
-                        print(f"⚠️ 행 {i} 처리 중 오류: {e}")
-                        continue
+                        print(f"⚠️ 행 {record['index'] + 1} 처리 중 오류: {e}")
+                        status = "failed"
+
+                    property_found = True
 
                 if property_found:
                     break
@@ -339,44 +1887,17 @@ class MultiPropertyAutomation:
 
                         # 다음 페이지로 이동 (팝업은 전역 리스너가 처리)
                         print(f"📄 {current_page+1}페이지로 이동 중...")
+                        previous = await self.table_fingerprint(page)
                         await next_button.click()
 
-                        # 페이지 로딩 대기
-                        await page.wait_for_timeout(2000)
-
-                        # 새 페이지 로딩 대기 (종료매물이면 클래스 필터 없이)
-                        try:
-                            if search_in_ended:
-                                await page.wait_for_selector('table tbody tr', timeout=8000)
-                            else:
-                                await page.wait_for_selector('table tbody tr', timeout=8000)
-
-                            # 행이 충분히 로드될 때까지 추가 대기
-                            await page.wait_for_timeout(500)
-
+                        # 새 페이지 로딩 대기 (테이블 지문이 바뀌는 즉시 진행)
+                        if await self.wait_for_page_transition(page, previous):
                             print(f"✅ {current_page+1}페이지 로딩 완료")
-                        except:
+                        else:
                             print(f"⚠️ {current_page+1}페이지 로딩 실패 - 계속 진행")
 
                         # 페이지 로딩 후 팝업 제거
-                        await page.evaluate('''
-                            () => {
-                                const popups = document.querySelectorAll('img[src*="popup"], div[class*="popup"], div[id*="popup"], .modal, .overlay');
-                                popups.forEach(popup => {
-                                    popup.style.display = 'none';
-                                    popup.style.visibility = 'hidden';
-                                    popup.remove();
-                                });
-                                const highZIndexElements = document.querySelectorAll('*');
-                                highZIndexElements.forEach(el => {
-                                    const zIndex = window.getComputedStyle(el).zIndex;
-                                    if (zIndex && parseInt(zIndex) > 1000) {
-                                        el.style.display = 'none';
-                                        el.remove();
-                                    }
-                                });
-                            }
-                        ''')
+                        await self.remove_popups(page)
                         print(f"✅ {current_page+1}페이지 로딩 후 팝업 제거 완료")
 
                         current_page += 1
@@ -410,6 +1931,66 @@ class MultiPropertyAutomation:
             print(f"❌ 매물번호 {property_number} 처리 실패: {e}")
             return (False, "failed")
     
+    @traced('row_scan', cat='scan')
+    async def extract_rows(self, page, row_selector='table tbody tr'):
+        """현재 테이블의 모든 행을 한 번의 호출로 추출
+
+        Returns:
+            list[dict]: 행 레코드 목록
+                - index: row_selector 기준 행 순번 (0부터)
+                - number: 매물번호 (td:nth-child(3) > div.numberN)
+                - ad_type: 광고유형 (8번째 컬럼, 칸이 없으면 None)
+                - fullname: p.fullName span 텍스트
+                - trade_type: 거래종류 (4번째 컬럼)
+                - buttons: {naverEnd, reReg, naverAd} 버튼 존재 여부
+        """
+        return await page.eval_on_selector_all(row_selector, ROW_EXTRACT_SCRIPT)
+
+    def find_record(self, records, property_number):
+        """매물번호가 포함된 첫 번째 행 레코드 반환 (없으면 None)"""
+        return next((record for record in records if property_number in record['number']), None)
+
+    async def get_row_handle(self, page, record, row_selector='table tbody tr'):
+        """행 레코드에 해당하는 ElementHandle 조회 (버튼 클릭 등 실제 조작이 필요할 때만 사용)"""
+        return await page.query_selector(f"{row_selector} >> nth={record['index']}")
+
+    def remember_listing(self, property_number, record, current_page):
+        """매물 리스트에서 찾은 행의 위치/광고유형/fullName 기록 (실행 내 위치, 진행 저널, 목록 캐시)
+
+        목록 검색으로 찾은 행은 페이지 위치를 알 수 없으므로(current_page=None) 광고유형/fullName만 갱신한다.
+        """
+        if current_page is not None:
+            cached_page = self.listing_cache.page_of(property_number)
+            if cached_page and cached_page != current_page:
+                print(f"   ♻️ 캐시 위치 {cached_page}페이지 → 실제 {current_page}페이지로 갱신")
+            self.listing_pages[property_number] = current_page
+        self.journal.mark(property_number, 'found', page=current_page)
+        self.listing_cache.update(
+            property_number, page=current_page, ad_type=record['ad_type'] or None, fullname=record['fullname'] or None
+        )
+
+    def mark_paid(self, property_number):
+        """결제 완료 기록 - 결제된 매물은 매물 리스트 맨 앞으로 옮겨지므로 기존 목록 위치는 버림"""
+        self.journal.mark(property_number, 'paid')
+        self.listing_pages.pop(property_number, None)
+        self.listing_cache.forget(property_number, 'page', 'page_updated_at')
+
+    def remember_fullname(self, property_number, record):
+        """행 레코드의 fullName 저장 (결제 실패 시 재시도용)"""
+        fullname = record['fullname']
+        if fullname:
+            cached = self.fullname_mapping.get(property_number)
+            if cached and cached != fullname:
+                print(f"   ♻️ fullName이 캐시와 다름 - 실제 값으로 갱신")
+            self.fullname_mapping[property_number] = fullname
+            self.listing_cache.update(property_number, fullname=fullname)
+            if self.journal.states.get(property_number, {}).get('fullname') != fullname:
+                self.journal.mark(property_number, 'fullname', fullname=fullname)
+            print(f"   🔖 fullName 저장: {property_number} → {self.mask_property_name(fullname)}")
+        else:
+            print(f"   ⚠️ fullName을 찾을 수 없음 (결제 실패 시 재시도 불가)")
+        return fullname
+
     async def print_property_info(self, row, property_number):
         try:
             cells = await row.query_selector_all('td')
@@ -456,6 +2037,127 @@ class MultiPropertyAutomation:
         print("5️⃣ 결제완료 (시뮬레이션)")
         print(f"🎉 매물번호 {property_number} 시뮬레이션 완료!")
     
+    async def read_total_count(self, page):
+        """매물 리스트 상단의 전체 매물 수 (읽지 못하면 None)"""
+        try:
+            total_count_element = await page.query_selector('#wrap > div.container > div > div > div.sectionWrap > div.statusWrap.ver3 > div.statusItem.statusAll.GTM_offerings_ad_list_total > span.cnt')
+            if total_count_element:
+                total_count_text = await total_count_element.inner_text()
+                self.listing_total = int(total_count_text.strip().replace(',', ''))
+                return self.listing_total
+        except Exception:
+            pass
+        return None
+
+    def note_lookup(self, property_number, path):
+        """매물 조회 경로 기록 (실행 결과에 매물별로 저장)"""
+        self.lookup_paths.setdefault(property_number, []).append(path)
+
+    def search_beats_sweep(self, target_count):
+        """목록 검색(대상당 1회)이 단일 스윕(전체 페이지 순회)보다 적은 페이지를 여는지 여부"""
+        if not self.list_search or not self.listing_total:
+            return False
+        return target_count < (self.listing_total + LIST_PAGE_SIZE - 1) // LIST_PAGE_SIZE
+
+    @traced(cat='navigation')
+    async def search_list(self, page, keyword, row_selector='table tbody tr', navigate=True):
+        """매물 리스트 자체 검색으로 목록을 keyword(매물번호/fullName)로 좁혀 행 레코드 반환
+
+        AD_LIST_SEARCH_PARAM이 있으면 검색 URL로 바로 이동하고, 없으면 검색창에 입력 후 검색 버튼
+        클릭(버튼 셀렉터가 없으면 Enter). navigate=False면 이미 열려 있는 매물 리스트의 검색창을 사용한다.
+
+        Returns:
+            list[dict] | None: 검색 결과 행 레코드 (검색을 쓸 수 없거나 실패하면 None → 페이지 순회로 대체)
+        """
+        if not self.list_search:
+            return None
+        try:
+            if self.search_param:
+                separator = '&' if '?' in self.ad_list_url else '?'
+                await self.goto(page, f"{self.ad_list_url}{separator}{urlencode({self.search_param: keyword})}", timeout=60000, wait_until='domcontentloaded')
+                await page.wait_for_selector('table tbody tr', state='attached', timeout=10000)
+            else:
+                if navigate:
+                    await self.goto(page, self.ad_list_url, timeout=60000, wait_until='domcontentloaded')
+                    await page.wait_for_selector('table tbody tr', state='visible', timeout=30000)
+                search_input = await page.query_selector(self.search_input)
+                if not search_input:
+                    print(f"   ⚠️ 검색창({self.search_input})을 찾을 수 없음")
+                    return None
+                await self.remove_popups(page)
+                previous = await self.table_fingerprint(page)
+                await search_input.fill(keyword)
+                if self.search_button:
+                    await page.click(self.search_button)
+                else:
+                    await search_input.press('Enter')
+                if not await self.wait_for_page_transition(page, previous):
+                    return None
+            await self.remove_popups(page)
+            records = await self.extract_rows(page, row_selector)
+            print(f"   🔍 목록 검색 결과: {len([r for r in records if r['number']])}건")
+            return records
+        except Exception as e:
+            print(f"   ⚠️ 목록 검색 실패: {e}")
+            return None
+
+    async def find_in_ad_list(self, page, property_number, match, keyword, row_selector='table tbody tr',
+                              cached_page=None):
+        """매물 리스트에서 match(record)가 참인 첫 행 찾기 - 목록 검색 우선, 없으면 페이지 순회
+
+        cached_page(목록 캐시 위치)가 있으면 해당 페이지부터 바깥쪽으로 확인한 뒤 전체 순회한다.
+
+        Returns:
+            (dict | None, int | None): (행 레코드, 목록 페이지 - 검색으로 찾았으면 None)
+        """
+        records = await self.search_list(page, keyword, row_selector)
+        if records is not None:
+            record = next((r for r in records if match(r)), None)
+            if record:
+                self.note_lookup(property_number, 'search')
+                return record, None
+            print(f"   ⚠️ 목록 검색에서 찾지 못함 - 페이지 순회로 검색")
+        self.note_lookup(property_number, 'pagination' if records is None else 'search_fallback')
+
+        await self.goto(page, self.ad_list_url, timeout=60000, wait_until='domcontentloaded')
+        await page.wait_for_selector('table tbody tr', state='visible', timeout=30000)
+        await self.remove_popups(page)
+
+        # 전체 매물 개수 조회
+        total_count = await self.read_total_count(page)
+        if total_count:
+            max_pages = (total_count + LIST_PAGE_SIZE - 1) // LIST_PAGE_SIZE
+            print(f"   📊 전체 매물: {total_count}개 → 최대 {max_pages}페이지까지 검색")
+        else:
+            max_pages = 10
+
+        visited = set()
+        current_page = 1
+        if cached_page:
+            async for current_page in self.iterate_pages_outward(page, cached_page, 1, self.listing_cache_radius):
+                if current_page in visited:
+                    continue
+                visited.add(current_page)
+                print(f"   📄 {current_page}페이지에서 검색 중... (캐시 위치 {cached_page}페이지 주변)")
+                await page.wait_for_selector(row_selector, timeout=30000)
+                record = next((r for r in await self.extract_rows(page, row_selector) if match(r)), None)
+                if record:
+                    return record, current_page
+            print(f"   ⚠️ 캐시 위치 주변에서 찾지 못함 - 전체 검색")
+            current_page = await self.goto_page(page, 1, current_page)
+
+        while current_page <= max_pages:
+            if current_page not in visited:
+                print(f"   📄 {current_page}페이지에서 검색 중...")
+                await page.wait_for_selector(row_selector, timeout=30000)
+                record = next((r for r in await self.extract_rows(page, row_selector) if match(r)), None)
+                if record:
+                    return record, current_page
+            if not await self.goto_next_page(page, current_page):
+                break
+            current_page += 1
+        return None, None
+
     async def batch_end_exposure(self, page, popup_messages=None):
         """1단계: 모든 매물 노출종료 (배치 처리)
 
@@ -471,7 +2173,7 @@ class MultiPropertyAutomation:
         try:
             # 매물 리스트 페이지로 이동
             print("🌐 매물 리스트 페이지로 이동 중...")
-            await page.goto(self.ad_list_url, timeout=60000, wait_until='domcontentloaded')
+            await self.goto(page, self.ad_list_url, timeout=60000, wait_until='domcontentloaded')
 
             # 매물 테이블 로딩 대기 (재시도 로직 포함)
             print("📋 매물 테이블 로딩 대기 중...")
@@ -495,88 +2197,232 @@ class MultiPropertyAutomation:
                         pass
                     raise
 
+            self.mark_first_row()
+
             # 팝업 제거
             await self.remove_popups(page)
+            await self.read_total_count(page)
+
+            # 워커 풀: 매물별 검색/노출종료를 여러 탭에서 동시에 처리
+            if self.page_pool and len(self.page_pool) > 1:
+                pending = [num for num in self.property_numbers if num not in result]
+                print(f"\n👷 워커 {len(self.page_pool)}개로 매물별 노출종료 동시 처리")
+                outcomes = await self.page_pool.map(
+                    lambda worker_page, bus, num: self.paced(worker_page, self.run_recorder.track(
+                        num, 'exposure_end', self.search_and_end_exposure(worker_page, num, bus))),
+                    pending
+                )
+                for property_number, outcome in zip(pending, outcomes):
+                    if isinstance(outcome, Exception):
+                        print(f"   ❌ 매물번호 {property_number} 처리 중 오류 (재시도 대상): {outcome}")
+                        outcome = (False, "error")
+                    result[property_number] = outcome
+                pending = []
+
+            # 목록 검색이 전체 페이지 순회보다 싸면(대상 수 < 페이지 수) 스윕 대신 매물별 검색
+            elif self.single_sweep and self.search_beats_sweep(len(self.property_numbers) - len(result)):
+                pending = [num for num in self.property_numbers if num not in result]
+                print(f"\n🔍 대상 {len(pending)}개 < 목록 {(self.listing_total + LIST_PAGE_SIZE - 1) // LIST_PAGE_SIZE}페이지 - 단일 스윕 대신 목록 검색 사용")
+
+            # 단일 스윕: 리스트를 한 번 순회하며 모든 대상 처리, 못 찾은 매물만 개별 검색
+            elif self.single_sweep:
+                pending = await self.sweep_end_exposure(page, result, popup_messages)
+                if pending:
+                    print(f"\n🔁 단일 스윕에서 찾지 못했거나 오류가 난 매물 {len(pending)}개 개별 검색: {', '.join(pending)}")
+            else:
+                pending = [num for num in self.property_numbers if num not in result]
 
-            for idx, property_number in enumerate(self.property_numbers, 1):
-                print(f"\n[{idx}/{len(self.property_numbers)}] 매물번호 {property_number} 검색 중...")
+            for idx, property_number in enumerate(pending, 1):
+                print(f"\n[{idx}/{len(pending)}] 매물번호 {property_number} 검색 중...")
 
-                try:
-                    await page.goto(self.ad_list_url, timeout=60000, wait_until='domcontentloaded')
-                    await page.wait_for_selector('table tbody tr.adComplete', timeout=30000)
-                    await self.remove_popups(page)
+                result[property_number] = await self.run_recorder.track(
+                    property_number, 'exposure_end', self.search_and_end_exposure(page, property_number, popup_messages)
+                )
+                self.pacing.record(result[property_number])
 
-                    property_found = False
-                    current_page = 1
+                if idx < len(pending):
+                    await self.pacing.pause(page)
 
-                    while not property_found:
-                        print(f"   📄 {current_page}페이지에서 검색 중...")
+            # 입력 순서대로 결과 정렬
+            result = {num: result[num] for num in self.property_numbers if num in result}
 
-                        rows = await page.query_selector_all('table tbody tr.adComplete')
+            # 결과 요약
+            success_count = sum(1 for success, _ in result.values() if success)
+            print(f"\n{'='*60}")
+            print(f"✅ [1단계 완료] 노출종료: {success_count}/{len(self.property_numbers)}개 성공")
+            print(f"{'='*60}")
 
-                        for row in rows:
-                            try:
-                                number_cell = await row.query_selector('td:nth-child(3) > div.numberN')
-                                if number_cell:
-                                    number_text = await number_cell.inner_text()
-                                    if property_number in number_text.strip():
-                                        print(f"   🎯 매물번호 {property_number} 발견!")
+            return result
 
-                                        ad_type_cell = await row.query_selector('td:nth-child(8)')
-                                        if ad_type_cell:
-                                            ad_type_text = await ad_type_cell.inner_text()
-                                            if "로켓등록" not in ad_type_text:
-                                                print(f"   ❌ 로켓등록 상품이 아님 (광고유형: {ad_type_text.strip()})")
-                                                result[property_number] = (False, "not_rocket")
-                                                property_found = True
-                                                break
+        except Exception as e:
+            print(f"❌ 배치 노출종료 중 오류: {e}")
+            return result
 
-                                        await self.print_property_info(row, property_number)
+    @traced(cat='property')
+    async def search_and_end_exposure(self, page, property_number, popup_messages=None):
+        """매물 리스트에서 단일 매물을 찾아 노출종료 (개별 검색)
 
-                                        if self.test_mode:
-                                            print(f"   🧪 [테스트 모드] 노출종료 시뮬레이션")
-                                            result[property_number] = (True, None)
-                                            property_found = True
-                                            break
+        Returns:
+            (bool, str): (성공 여부, 상태) - 상태는 None(미발견) | "not_rocket" | "error"
+        """
+        try:
+            async def handle(record, current_page):
+                self.remember_listing(property_number, record, current_page)
+                print(f"   🎯 매물번호 {property_number} 발견!")
 
-                                        success = await self.execute_single_exposure_end(page, row, property_number, popup_messages)
-                                        result[property_number] = (success, None)
-                                        property_found = True
-                                        break
-                            except Exception as e:
-                                print(f"   ⚠️ 행 처리 중 오류: {e}")
-                                continue
-
-                        if property_found:
-                            break
+                if not is_rocket(record['ad_type']):
+                    print(f"   ❌ 로켓등록 상품이 아님 (광고유형: {record['ad_type']})")
+                    return (False, "not_rocket")
 
-                        if not await self.goto_next_page(page, current_page):
-                            break
-                        current_page += 1
+                row = await self.get_row_handle(page, record, 'table tbody tr.adComplete')
+                await self.print_property_info(row, property_number)
 
-                    if not property_found:
-                        print(f"   ❌ 매물번호 {property_number}를 찾을 수 없습니다.")
-                        result[property_number] = (False, None)
+                if self.test_mode:
+                    print(f"   🧪 [테스트 모드] 노출종료 시뮬레이션")
+                    return (True, None)
+
+                success = await self.execute_single_exposure_end(page, row, property_number, popup_messages)
+                return (success, None)
+
+            # 목록 자체 검색이 가능하면 대상만 남긴 목록에서 먼저 확인 (보유 매물 수와 무관한 비용)
+            records = await self.search_list(page, property_number, 'table tbody tr.adComplete')
+            if records is not None:
+                record = self.find_record(records, property_number)
+                if record:
+                    self.note_lookup(property_number, 'search')
+                    return await handle(record, None)
+                print(f"   ⚠️ 목록 검색에서 찾지 못함 - 페이지 순회로 검색")
+            self.note_lookup(property_number, 'pagination' if records is None else 'search_fallback')
+
+            await self.goto(page, self.ad_list_url, timeout=60000, wait_until='domcontentloaded')
+            await page.wait_for_selector('table tbody tr.adComplete', timeout=30000)
+            await self.remove_popups(page)
 
-                except Exception as e:
-                    print(f"   ❌ 매물번호 {property_number} 처리 중 오류 (재시도 대상): {e}")
-                    result[property_number] = (False, "error")
+            # 목록 캐시 위치가 있으면 해당 페이지부터 바깥쪽으로 확인한 뒤, 없으면 전체 순회
+            visited = set()
+            current_page = 1
+            start_page = self.listing_pages.get(property_number, 1)
+            cached_page = self.listing_cache.page_of(property_number)
+            if cached_page:
+                async for current_page in self.iterate_pages_outward(page, cached_page, 1, self.listing_cache_radius):
+                    if current_page in visited:
+                        continue
+                    visited.add(current_page)
+                    print(f"   📄 {current_page}페이지에서 검색 중... (캐시 위치 {cached_page}페이지 주변)")
+                    record = self.find_record(await self.extract_rows(page, 'table tbody tr.adComplete'), property_number)
+                    if record:
+                        return await handle(record, current_page)
+                print(f"   ⚠️ 캐시 위치 주변에서 찾지 못함 - 전체 검색")
+                start_page = 1
+
+            async for current_page in self.iterate_pages(page, start_page, current_page):
+                if current_page in visited:
+                    continue
+                print(f"   📄 {current_page}페이지에서 검색 중...")
 
-                if idx < len(self.property_numbers):
-                    await page.wait_for_timeout(1000)
+                records = await self.extract_rows(page, 'table tbody tr.adComplete')
+                record = self.find_record(records, property_number)
 
-            # 결과 요약
-            success_count = sum(1 for success, _ in result.values() if success)
-            print(f"\n{'='*60}")
-            print(f"✅ [1단계 완료] 노출종료: {success_count}/{len(self.property_numbers)}개 성공")
-            print(f"{'='*60}")
+                if record:
+                    return await handle(record, current_page)
 
-            return result
+            print(f"   ❌ 매물번호 {property_number}를 찾을 수 없습니다.")
+            self.listing_cache.forget(property_number)
+            return (False, None)
 
         except Exception as e:
-            print(f"❌ 배치 노출종료 중 오류: {e}")
-            return result
+            print(f"   ❌ 매물번호 {property_number} 처리 중 오류 (재시도 대상): {e}")
+            return (False, "error")
+
+    @traced(cat='phase')
+    async def sweep_end_exposure(self, page, result, popup_messages=None):
+        """매물 리스트 단일 스윕 노출종료
+
+        리스트를 1페이지부터 한 번만 순회하면서 각 페이지의 모든 행을 전체 대상 매물번호와
+        비교한다. 한 페이지의 대상을 모두 처리한 뒤 다음 페이지로 이동하며, 노출종료 클릭으로
+        페이지가 바뀐 경우에만 현재 페이지를 다시 읽는다.
+
+        Args:
+            result: 처리 결과를 기록할 dict ({property_number: (success, status)})
+
+        Returns:
+            list: 스윕에서 찾지 못했거나 행 처리 중 오류가 난 매물번호 (개별 검색 대상)
+        """
+        remaining = [num for num in self.property_numbers if num not in result]
+        errored = []  # 행 처리 중 오류가 난 매물 (개별 검색으로 다시 시도)
+        current_page = 1
+
+        # 알려진 위치는 대상 정렬에만 쓰고 스윕은 항상 1페이지부터 (결제된 매물은 목록 맨 앞으로 옮겨져
+        # 이전 실행의 위치보다 앞쪽에 있을 수 있음)
+        print(f"\n🔎 단일 스윕 검색 시작 (대상 {len(remaining)}개)")
 
+        while remaining:
+            print(f"   📄 {current_page}페이지 스캔 중... (남은 대상 {len(remaining)}개)")
+
+            page_changed = True
+            while page_changed and remaining:
+                page_changed = False
+
+                await page.wait_for_selector('table tbody tr', timeout=30000)
+                records = await self.extract_rows(page, 'table tbody tr.adComplete')
+                snapshot = None
+
+                for record in records:
+                    property_number = next((num for num in remaining if num in record['number']), None)
+                    if property_number is None:
+                        continue
+
+                    try:
+                        remaining.remove(property_number)
+                        self.remember_listing(property_number, record, current_page)
+                        self.note_lookup(property_number, 'sweep')
+                        print(f"   🎯 매물번호 {property_number} 발견! ({current_page}페이지)")
+
+                        if not is_rocket(record['ad_type']):
+                            print(f"   ❌ 로켓등록 상품이 아님 (광고유형: {record['ad_type']})")
+                            result[property_number] = (False, "not_rocket")
+                            continue
+
+                        row = await self.get_row_handle(page, record, 'table tbody tr.adComplete')
+                        await self.print_property_info(row, property_number)
+
+                        if self.test_mode:
+                            print(f"   🧪 [테스트 모드] 노출종료 시뮬레이션")
+                            result[property_number] = (True, None)
+                            continue
+
+                        snapshot = snapshot or await self.table_fingerprint(page)
+                        success = await self.execute_single_exposure_end(page, row, property_number, popup_messages)
+                        result[property_number] = (success, None)
+
+                        # 성공하면 행이 빠져 기존 행 순번/핸들이 어긋나므로 재조회, 실패하면 테이블이 실제로
+                        # 바뀐 경우(타임아웃 후 뒤늦게 처리되는 등)에만 재조회
+                        if success or await self.table_fingerprint(page) != snapshot:
+                            page_changed = True
+                            break
+                    except Exception as e:
+                        print(f"   ⚠️ 행 처리 중 오류 - 개별 검색으로 다시 시도: {e}")
+                        if property_number not in result:
+                            errored.append(property_number)
+                        continue
+
+                if page_changed:
+                    try:
+                        await page.wait_for_load_state('domcontentloaded', timeout=10000)
+                    except Exception:
+                        pass
+
+            if not remaining:
+                break
+
+            if not await self.goto_next_page(page, current_page):
+                break
+            current_page += 1
+
+        print(f"   ✅ 단일 스윕 완료: {current_page}페이지 순회, 미발견 {len(remaining)}개, 오류 {len(errored)}개")
+        return remaining + errored
+
+    @traced()
     async def execute_single_exposure_end(self, page, row, property_number, popup_messages=None):
         """단일 매물 노출종료 실행
 
@@ -593,46 +2439,82 @@ class MultiPropertyAutomation:
             if popup_messages is not None:
                 popup_messages.clear()
 
+            self.arm_response_detector(page, 'naverEnd')
             await end_button.click()
             print(f"   ✅ 노출종료 버튼 클릭 완료")
 
-            await page.wait_for_timeout(500)
+            outcome, message, source = await self.wait_for_confirmation(
+                page, popup_messages, EXPOSURE_END_PATTERNS, timeout=10, action='naverEnd'
+            )
 
-            max_wait = 10
-            wait_time = 0
-            success = False
-            failed = False
-
-            while wait_time < max_wait:
-                if popup_messages is not None:
-                    for msg in popup_messages:
-                        if "노출종료 했어요" in msg:
-                            print(f"   ✅ 노출종료 성공 확인: {msg}")
-                            success = True
-                            break
-                        elif "노출종료에 실패" in msg or "통신 중 오류" in msg:
-                            print(f"   ❌ 노출종료 실패: {msg}")
-                            failed = True
-                            break
-
-                if success or failed:
-                    break
-
-                await page.wait_for_timeout(500)
-                wait_time += 0.5
-
-            if success:
+            if outcome == 'success':
+                print(f"   ✅ 노출종료 성공 확인: {message}")
+                self.journal.mark(property_number, 'exposure_ended', page=self.listing_pages.get(property_number))
+                self.enqueue_ended(property_number)
+                if source == 'network':
+                    self.network_confirmed.add(property_number)
                 return True
-            elif failed:
+            elif outcome == 'failure':
+                print(f"   ❌ 노출종료 실패: {message}")
                 return False
             else:
                 print(f"   ⚠️ 노출종료 결과 확인 타임아웃 (팝업 메시지: {popup_messages if popup_messages else '없음'})")
+                self.pacing.back_off('timeout:naverEnd')
                 return False
 
         except Exception as e:
             print(f"   ❌ 노출종료 실패: {e}")
             return False
 
+    @traced(cat='navigation')
+    async def open_ended_list(self, page, settle_ms=1000):
+        """매물 리스트에서 광고종료 버튼을 눌러 종료매물 목록 열기"""
+        await self.goto(page, self.ad_list_url, timeout=60000, wait_until='domcontentloaded')
+        await page.wait_for_selector('table tbody tr', state='visible', timeout=30000)
+        await self.remove_popups(page)
+
+        ad_end_button = await page.wait_for_selector('.statusAdEnd', timeout=10000)
+        await ad_end_button.click()
+        await page.wait_for_selector('table tbody tr', state='visible', timeout=30000)
+        await self.remove_popups(page)
+        if settle_ms:
+            await page.wait_for_timeout(settle_ms)
+
+    def classify_list_failure(self, popup_messages=None):
+        """리스트 이동/로딩 실패 원인 분류 (마지막 팝업 메시지 기준)"""
+        last_popup = popup_messages[-1] if popup_messages else ''
+        if '점검' in last_popup or '전송' in last_popup:
+            return "server_maintenance"
+        return "page_load_fail"
+
+    async def reopen_and_process_ended(self, page, property_number, popup_messages=None):
+        """워커 탭 단위 작업: 종료매물 목록을 새로 열고 단일 매물 재광고/결제"""
+        try:
+            await self.open_ended_list(page, settle_ms=0 if property_number in self.ended_index else 1000)
+        except Exception as e:
+            print(f"   ❌ [{property_number}] 종료매물 리스트 이동/로딩 실패: {e}")
+            return (False, self.classify_list_failure(popup_messages))
+
+        start_page = self.ended_pages.get(property_number, 1)
+        return await self.process_single_ended_property(page, property_number, popup_messages, start_page=start_page)
+
+    async def pooled_re_register(self, page, bus, property_number):
+        """워커 풀 작업: 재광고/결제 (예외는 해당 탭의 팝업으로 saved/failed 분류)"""
+        try:
+            return await self.paced(page, self.run_recorder.track(
+                property_number, 're_register', self.reopen_and_process_ended(page, property_number, bus)))
+        except Exception as e:
+            return self.classify_worker_error(property_number, e, bus)
+
+    def classify_worker_error(self, property_number, error, popup_messages=None):
+        """워커 탭 작업 중 예외를 직렬 경로(process_payment)와 같이 분류 - 저장 팝업을 받았으면 saved, 아니면 failed"""
+        if popup_messages is not None and popup_messages.contains(SAVED_MESSAGE):
+            print(f"   ⚠️ 매물번호 {property_number} 처리 중 오류 - 매물은 저장됨 (결제 미완료): {error}")
+            self.journal.mark(property_number, 'saved')
+            return (False, "saved")
+        print(f"   ❌ 매물번호 {property_number} 재광고 처리 중 오류: {error}")
+        return (False, "failed")
+
     async def batch_process_ended_properties(self, page, popup_messages=None):
         """2-3단계: 광고종료 후 종료매물 리스트에서 모든 매물 재광고/결제
 
@@ -648,73 +2530,77 @@ class MultiPropertyAutomation:
         result = {}
 
         try:
-            # 매물 리스트 페이지로 이동
-            await page.goto(self.ad_list_url, timeout=60000, wait_until='domcontentloaded')
-            await page.wait_for_selector('table tbody tr', state='visible', timeout=30000)
-            await self.remove_popups(page)
-
-            # 광고종료 버튼 클릭
+            # 매물 리스트 → 광고종료 버튼 클릭 → 종료매물 목록
             print("🖱️ 광고종료 버튼 클릭...")
-            ad_end_button = await page.wait_for_selector('.statusAdEnd', timeout=10000)
-            await ad_end_button.click()
-
-            # 종료매물 목록 로딩 대기
-            print("⏳ 종료매물 목록 로딩 대기 중...")
-            await page.wait_for_selector('table tbody tr', state='visible', timeout=30000)
-            await self.remove_popups(page)
+            await self.open_ended_list(page, settle_ms=0)
             print("✅ 종료매물 목록 로딩 완료")
 
-            # 서버 반영 대기
-            print("⏳ 서버 반영 대기 중 (2초)...")
-            await page.wait_for_timeout(2000)
+            # 서버 반영 대기 (모든 노출종료가 백엔드 응답으로 확인된 경우 생략)
+            if self.network_detector and all(num in self.network_confirmed for num in self.property_numbers):
+                print("✅ 노출종료가 서버 응답으로 모두 확인됨 - 서버 반영 대기 생략")
+            else:
+                print("⏳ 서버 반영 대기 중 (2초)...")
+                await page.wait_for_timeout(2000)
+
+            # 종료매물 인덱스 1회 구축 (이후 매물은 인덱스 위치 페이지로 바로 이동)
+            async with self.list_lock.hold():
+                index_page = await self.build_ended_index(page)
+            # 종료매물 목록 위치 순으로 처리 (인덱스에 없는 매물은 뒤로)
+            self.property_numbers = order_by_position(self.property_numbers, {
+                num: position for num, position in self.ended_index.items() if num in self.property_numbers
+            })
 
             print(f"\n{'='*60}")
             print(f"📋 [3단계] 종료매물 리스트에서 모든 매물 재광고/결제")
             print(f"{'='*60}")
 
-            # 각 매물번호에 대해 재광고 및 결제 처리
-            for idx, property_number in enumerate(self.property_numbers, 1):
-                print(f"\n[{idx}/{len(self.property_numbers)}] 매물번호 {property_number} 재광고 처리 중...")
+            # 워커 풀: 탭마다 종료매물 리스트를 열어 매물별 재광고/결제를 동시에 처리
+            if self.page_pool and len(self.page_pool) > 1 and not self.test_mode:
+                print(f"👷 워커 {len(self.page_pool)}개로 재광고/결제 동시 처리")
+                outcomes = await self.page_pool.map(self.pooled_re_register, self.property_numbers)
+                for property_number, outcome in zip(self.property_numbers, outcomes):
+                    if isinstance(outcome, Exception):
+                        print(f"   ❌ 매물번호 {property_number} 재광고 처리 중 오류: {outcome}")
+                        outcome = (False, "failed")
+                    result[property_number] = outcome
+            else:
+                # 각 매물번호에 대해 재광고 및 결제 처리
+                last_ended_page = 1
+                for idx, property_number in enumerate(self.property_numbers, 1):
+                    print(f"\n[{idx}/{len(self.property_numbers)}] 매물번호 {property_number} 재광고 처리 중...")
 
-                # 종료매물 리스트로 다시 이동 (이전 처리 후 페이지 변경됨)
-                if idx > 1:
-                    try:
-                        await page.goto(self.ad_list_url, timeout=60000, wait_until='domcontentloaded')
-                        await page.wait_for_selector('table tbody tr', state='visible', timeout=30000)
-                        await self.remove_popups(page)
+                    # 종료매물 리스트로 다시 이동 (이전 처리 후 페이지 변경됨)
+                    if idx > 1:
+                        try:
+                            # 인덱스가 있으면 행 번호로 검증하므로 안정화 대기 생략
+                            await self.open_ended_list(page, settle_ms=0 if property_number in self.ended_index else 1000)
+                        except Exception as e:
+                            print(f"   ❌ 종료매물 리스트 이동/로딩 실패: {e}")
+                            result[property_number] = (False, self.classify_list_failure(popup_messages))
+                            self.run_recorder.record(property_number, 're_register', result[property_number])
+                            self.pacing.record(result[property_number])
+                            continue
 
-                        # 광고종료 버튼 클릭
-                        ad_end_button = await page.wait_for_selector('.statusAdEnd', timeout=10000)
-                        await ad_end_button.click()
-                        await page.wait_for_selector('table tbody tr', state='visible', timeout=30000)
-                        await self.remove_popups(page)
-                        await page.wait_for_timeout(1000)
-                    except Exception as e:
-                        error_msg = str(e)
-                        print(f"   ❌ 종료매물 리스트 이동/로딩 실패: {error_msg}")
-                        if popup_messages:
-                            last_popup = popup_messages[-1] if popup_messages else ''
-                            if '점검' in last_popup or '전송' in last_popup:
-                                result[property_number] = (False, "server_maintenance")
-                            else:
-                                result[property_number] = (False, "page_load_fail")
-                        else:
-                            result[property_number] = (False, "page_load_fail")
+                    # 테스트 모드 처리
+                    if self.test_mode:
+                        print(f"   🧪 [테스트 모드] 재광고/결제 시뮬레이션")
+                        result[property_number] = True
                         continue
 
-                # 테스트 모드 처리
-                if self.test_mode:
-                    print(f"   🧪 [테스트 모드] 재광고/결제 시뮬레이션")
-                    result[property_number] = True
-                    continue
-
-                # 종료매물 리스트에서 매물 찾아서 재광고/결제
-                success, status = await self.process_single_ended_property(page, property_number, popup_messages)
-                result[property_number] = (success, status)
-
-                # 매물 간 대기
-                if idx < len(self.property_numbers):
-                    await page.wait_for_timeout(1000)
+                    # 종료매물 리스트에서 매물 찾아서 재광고/결제
+                    # 같은 배치에서 노출종료한 매물은 종료매물 목록에서 가까이 모여 있으므로 직전 매물의 페이지부터 검색
+                    success, status = await self.run_recorder.track(property_number, 're_register', self.process_single_ended_property(
+                        page, property_number, popup_messages,
+                        start_page=last_ended_page,
+                        current_page=index_page if idx == 1 else 1
+                    ))
+                    result[property_number] = (success, status)
+                    last_ended_page = self.ended_pages.get(property_number, last_ended_page)
+                    self.pacing.record((success, status))
+
+                    # 매물 간 대기 (적응형 페이싱)
+                    if idx < len(self.property_numbers):
+                        await self.pacing.pause(page)
 
             # 결과 요약
             success_count = sum(1 for success, _ in result.values() if success)
@@ -728,107 +2614,97 @@ class MultiPropertyAutomation:
             print(f"❌ 배치 재광고/결제 중 오류: {e}")
             return result
 
-    async def process_single_ended_property(self, page, property_number, popup_messages=None):
-        """종료매물 리스트에서 단일 매물 재광고/결제 (페이지네이션 포함)
+    def ended_index_page(self, property_number):
+        """종료매물 인덱스 위치의 페이지 번호 (1부터)"""
+        return self.ended_index[property_number] // self.ended_page_size + 1
+
+    @traced(cat='scan')
+    async def build_ended_index(self, page):
+        """종료매물 목록을 한 번 훑어 대상 매물의 위치 인덱스 구축 (모두 찾으면 중단)
 
         Returns:
-            (bool, str): (성공 여부, 상태)
-                - (True, "success"): 성공
-                - (False, "saved"): 매물 저장됨 (재시도 필요)
-                - (False, "failed"): 실패
+            int: 구축 후 목록의 현재 페이지
         """
-        try:
-            found = False
-            current_page = 1
+        self.ended_index = {}
+        self.ended_page_size = 0
+        targets = set(self.property_numbers)
+        current_page = 1
 
-            while not found:
-                print(f"   📄 종료매물 {current_page}페이지에서 검색 중...")
-
-                end_rows = await page.query_selector_all('table tbody tr')
-
-                for row in end_rows:
-                    number_cell = await row.query_selector('td:nth-child(3) > div.numberN')
-                    if number_cell:
-                        number_text = await number_cell.inner_text()
-                        if property_number in number_text.strip():
-                            print(f"   🎯 종료매물에서 매물번호 {property_number} 발견! ({current_page}페이지)")
-                            found = True
-
-                            if popup_messages is not None:
-                                popup_messages.clear()
-
-                            await self.remove_popups(page)
-
-                            try:
-                                fullname_selectors = [
-                                    'td.danjiName p.fullName span',
-                                    'p.fullName span',
-                                    '.fullName span'
-                                ]
-                                fullname = None
-                                for selector in fullname_selectors:
-                                    fullname_element = await row.query_selector(selector)
-                                    if fullname_element:
-                                        fullname_text = await fullname_element.inner_text()
-                                        fullname = fullname_text.strip()
-                                        if fullname:
-                                            self.fullname_mapping[property_number] = fullname
-                                            print(f"   🔖 fullName 저장: {property_number} → {self.mask_property_name(fullname)}")
-                                            break
-                                if not fullname:
-                                    print(f"   ⚠️ fullName을 찾을 수 없음 (결제 실패 시 재시도 불가)")
-                            except Exception as e:
-                                print(f"   ⚠️ fullName 추출 실패: {e}")
-
-                            print(f"   🖱️ 재광고 버튼 클릭...")
-                            re_ad_button = await row.query_selector('#reReg')
-                            if not re_ad_button:
-                                print(f"   ❌ 재광고 버튼을 찾을 수 없습니다.")
-                                return (False, "no_readd_button")
-
-                            await re_ad_button.click()
-                            await page.wait_for_timeout(1000)
-                            print(f"   ✅ 재광고 버튼 클릭 완료")
-
-                            print(f"   📝 광고등록 페이지 처리...")
-                            await page.wait_for_url('**/offerings/ad_regist', timeout=30000)
-                            await page.wait_for_timeout(500)
+        async for current_page in self.iterate_pages(page, 1):
+            records = await self.extract_rows(page, 'table tbody tr')
+            if current_page == 1:
+                self.ended_page_size = len(records)
+            if not self.ended_page_size:
+                break
 
-                            await page.click('text=광고하기')
+            for property_number in list(targets):
+                record = self.find_record(records, property_number)
+                if record:
+                    self.ended_index[property_number] = (current_page - 1) * self.ended_page_size + record['index']
+                    self.ended_pages[property_number] = current_page
+                    self.remember_fullname(property_number, record)
+                    targets.discard(property_number)
 
-                            try:
-                                await page.wait_for_load_state('domcontentloaded', timeout=10000)
-                                print(f"   ✅ 광고하기 버튼 클릭 완료")
-                            except:
-                                print(f"   ⚠️ 페이지 로딩 타임아웃 - 계속 진행")
-                                await page.wait_for_timeout(1000)
+            if not targets:
+                break
 
-                            payment_success, payment_status = await self.process_payment(page, property_number, popup_messages)
+        print(f"🗂️ 종료매물 인덱스: {len(self.ended_index)}/{len(self.property_numbers)}개 ({current_page}페이지까지 확인)")
+        return current_page
 
-                            if payment_success:
-                                print(f"   🎉 매물번호 {property_number} 재광고/결제 완료!")
-                                return (True, "success")
-                            elif payment_status == "saved":
-                                print(f"   ⚠️ 매물번호 {property_number} 저장됨 (결제 미완료)")
-                                return (False, "saved")
-                            else:
-                                print(f"   ❌ 매물번호 {property_number} 결제 실패")
-                                return (False, "failed")
+    async def lookup_ended_index(self, page, property_number, current_page=1):
+        """인덱스 위치의 페이지로 바로 이동해 행 확인
 
-                if found:
-                    break
+        인덱스 위치의 행 번호가 일치하면 그 행을, 같은 페이지 다른 행에 있으면 그 행을 반환한다.
 
-                print(f"   ⏭️  다음 페이지로 이동 중... ({current_page} → {current_page + 1})")
-                if not await self.goto_next_page(page, current_page):
-                    print(f"   ⚠️ 다음 페이지 이동 실패 - 검색 종료 (마지막 페이지)")
-                    break
-                current_page += 1
+        Returns:
+            (int, dict | None): (현재 페이지, 행 record) - 못 찾으면 record는 None
+        """
+        position = self.ended_index[property_number]
+        target_page = self.ended_index_page(property_number)
+        current_page = await self.goto_page(page, target_page, current_page)
+        if current_page != target_page:
+            return current_page, None
+
+        records = await self.extract_rows(page, 'table tbody tr')
+        row_index = position % self.ended_page_size
+        if row_index < len(records) and property_number in records[row_index]['number']:
+            return current_page, records[row_index]
+        return current_page, self.find_record(records, property_number)
+
+    def drop_from_ended_index(self, property_number):
+        """재광고로 목록에서 빠진 매물 제거 - 뒤쪽 매물 위치를 한 칸씩 당김"""
+        position = self.ended_index.pop(property_number, None)
+        if position is None:
+            return
+        for other, other_position in self.ended_index.items():
+            if other_position > position:
+                self.ended_index[other] = other_position - 1
+
+    @traced(cat='property')
+    async def process_single_ended_property(self, page, property_number, popup_messages=None, start_page=1, current_page=1):
+        """종료매물 리스트에서 단일 매물 재광고/결제 (종료매물 인덱스 우선, 없으면 페이지네이션 검색)
 
-            if not found:
-                print(f"   ❌ 종료매물에서 찾을 수 없음 (총 {current_page}페이지 검색)")
-                if current_page == 1:
-                    return (False, "pagination_blocked")
-                return (False, "not_found")
+        Args:
+            start_page: 검색 시작 페이지 (마지막 페이지까지 본 뒤 1페이지부터 나머지 검색)
+            current_page: 종료매물 목록의 현재 페이지 (인덱스 구축 직후에는 1이 아닐 수 있음)
+
+        Returns:
+            (bool, str): (성공 여부, 상태)
+                - (True, "success"): 성공
+                - (False, "saved"): 매물 저장됨 (재시도 필요)
+                - (False, "failed"): 실패
+        """
+        try:
+            # 목록 탐색과 재광고 클릭은 잠금 안에서 처리 (워커끼리 종료매물 인덱스를 동시에 고치거나
+            # 다른 워커의 재광고로 당겨지는 행을 읽지 않도록), 광고등록/결제는 잠금 밖에서 동시에 진행
+            async with self.ended_lock, self.list_lock.hold():
+                current_page, record, status = await self.locate_ended_property(page, property_number, start_page, current_page)
+                if record is None:
+                    return (False, status)
+                status = await self.click_re_register(page, property_number, record, current_page, popup_messages)
+            if status:
+                return (False, status)
+            return await self.register_and_pay(page, property_number, popup_messages)
 
         except Exception as e:
             error_msg = str(e)
@@ -842,6 +2718,101 @@ class MultiPropertyAutomation:
                 return (False, "timeout_error")
             return (False, "process_error")
 
+    async def locate_ended_property(self, page, property_number, start_page=1, current_page=1):
+        """종료매물 목록에서 매물 행 찾기 (종료매물 인덱스 우선, 없으면 페이지네이션 검색)
+
+        Returns:
+            (int, dict | None, str | None): (현재 페이지, 행 record, 못 찾은 경우 상태 "not_found" | "pagination_blocked")
+        """
+        if property_number in self.ended_index:
+            indexed_page = self.ended_index_page(property_number)
+            current_page, record = await self.lookup_ended_index(page, property_number, current_page)
+            if record:
+                print(f"   🎯 인덱스로 종료매물 {indexed_page}페이지에서 매물번호 {property_number} 확인")
+                return current_page, record, None
+
+            # 인덱스가 목록과 맞지 않음 (stale) - 인덱스 위치 페이지부터 검색
+            print(f"   ⚠️ 종료매물 인덱스 불일치 - {indexed_page}페이지부터 검색")
+            self.ended_index.pop(property_number, None)
+            start_page = indexed_page
+
+        pages_searched = 0
+
+        async for current_page in self.iterate_pages(page, start_page, current_page):
+            pages_searched += 1
+            print(f"   📄 종료매물 {current_page}페이지에서 검색 중...")
+
+            end_records = await self.extract_rows(page, 'table tbody tr')
+            record = self.find_record(end_records, property_number)
+
+            if record:
+                print(f"   🎯 종료매물에서 매물번호 {property_number} 발견! ({current_page}페이지)")
+                return current_page, record, None
+
+        print(f"   ❌ 종료매물에서 찾을 수 없음 (총 {pages_searched}페이지 검색)")
+        return current_page, None, "pagination_blocked" if pages_searched == 1 else "not_found"
+
+    @traced()
+    async def click_re_register(self, page, property_number, record, current_page, popup_messages=None):
+        """종료매물 목록에서 찾은 행(record)의 재광고 버튼 클릭 (실패 시 상태, 성공 시 None)"""
+        self.ended_pages[property_number] = current_page
+
+        if popup_messages is not None:
+            popup_messages.clear()
+
+        await self.remove_popups(page)
+
+        self.remember_fullname(property_number, record)
+
+        print(f"   🖱️ 재광고 버튼 클릭...")
+        if not record['buttons']['reReg']:
+            print(f"   ❌ 재광고 버튼을 찾을 수 없습니다.")
+            return "no_readd_button"
+        re_ad_button = await page.query_selector(f"table tbody tr >> nth={record['index']} >> #reReg")
+
+        self.arm_response_detector(page, 'reReg')
+        await re_ad_button.click()
+        # 재광고하면 종료매물 목록에서 빠지므로 인덱스에서 제거 (뒤쪽 행은 한 칸씩 당겨짐)
+        if self.ended_page_size:
+            self.ended_index.setdefault(property_number, (current_page - 1) * self.ended_page_size + record['index'])
+        self.drop_from_ended_index(property_number)
+        if not await self.settle_re_register(page):
+            return "process_error"
+        self.journal.mark(property_number, 're_registered', ended_page=current_page)
+        print(f"   ✅ 재광고 버튼 클릭 완료")
+        return None
+
+    @traced()
+    async def register_and_pay(self, page, property_number, popup_messages=None):
+        """재광고 클릭 후 광고등록 페이지에서 광고하기 → 결제"""
+        print(f"   📝 광고등록 페이지 처리...")
+        await page.wait_for_url('**/offerings/ad_regist', timeout=30000)
+        await page.wait_for_timeout(500)
+
+        await page.click('text=광고하기')
+
+        try:
+            await page.wait_for_load_state('domcontentloaded', timeout=10000)
+            print(f"   ✅ 광고하기 버튼 클릭 완료")
+        except:
+            print(f"   ⚠️ 페이지 로딩 타임아웃 - 계속 진행")
+            await page.wait_for_timeout(1000)
+
+        payment_success, payment_status = await self.process_payment(page, property_number, popup_messages)
+
+        if payment_success:
+            print(f"   🎉 매물번호 {property_number} 재광고/결제 완료!")
+            self.mark_paid(property_number)
+            return (True, "success")
+        elif payment_status == "saved":
+            print(f"   ⚠️ 매물번호 {property_number} 저장됨 (결제 미완료)")
+            self.journal.mark(property_number, 'saved')
+            return (False, "saved")
+        else:
+            print(f"   ❌ 매물번호 {property_number} 결제 실패")
+            return (False, "failed")
+
+    @traced()
     async def process_payment(self, page, property_number, popup_messages=None):
         """결제 처리
 
@@ -909,89 +2880,353 @@ class MultiPropertyAutomation:
                 print(f"   ❌ 결제하기 버튼을 찾을 수 없음")
                 return (False, "failed")
 
+            self.arm_response_detector(page, 'naverSendSave')
             await payment_button.click()
             print(f"   ✅ 결제하기 버튼 클릭 완료")
 
             # 결제 완료 확인
             print(f"   ⏳ 결제 완료 대기 중...")
-            payment_success = False
-            saved_message_found = False
-            wait_time = 0
-            max_wait = 20
+            outcome, message, _ = await self.wait_for_confirmation(
+                page, popup_messages, PAYMENT_PATTERNS, timeout=20, action='naverSendSave'
+            )
+            saved_message_found = popup_messages is not None and popup_messages.contains(SAVED_MESSAGE)
+
+            if outcome == 'saved':
+                print(f"   🔄 매물이 저장되었으나 결제는 미완료 (서버 응답: {message}) - 재시도 필요")
+                return (False, "saved")
+            elif outcome == 'success':
+                print(f"   ✅ 결제 성공 확인: {message}")
+                return (True, "success")
+            elif outcome == 'failure':
+                print(f"   ❌ 체크박스 미동의로 결제 실패: {message}")
+                return (False, "failed")
+            else:
+                # 타임아웃: "로켓전송이 완료되었습니다"를 받지 못함
+                print(f"   ❌ 결제 완료 확인 실패 - '로켓전송이 완료되었습니다' alert를 받지 못함")
+                print(f"   📋 받은 팝업 메시지: {popup_messages if popup_messages else '없음'}")
+                self.pacing.back_off('timeout:naverSend')
 
-            while wait_time < max_wait:
-                await page.wait_for_timeout(1000)
-                wait_time += 1
+                # "매물을 저장 하였습니다" 팝업이 있었으면 "saved" 상태로 재시도
+                if saved_message_found:
+                    print(f"   ℹ️ 매물 저장 확인: {SAVED_MESSAGE}")
+                    print(f"   🔄 매물이 저장되었으나 결제는 미완료 - 재시도 필요")
+                    return (False, "saved")
+                else:
+                    return (False, "failed")
 
-                if popup_messages is not None:
-                    for msg in popup_messages:
-                        if "로켓전송이 완료되었습니다" in msg:
-                            print(f"   ✅ 결제 성공 확인: {msg}")
-                            payment_success = True
-                            break
-                        elif "매물을 저장 하였습니다" in msg:
-                            # 매물 저장 팝업은 자연스러운 흐름 - 계속 대기
-                            print(f"   ℹ️ 매물 저장 확인: {msg} (계속 처리 중...)")
-                            saved_message_found = True
-                            # break 하지 않고 계속 대기 → "로켓전송이 완료되었습니다" 대기
+        except Exception as e:
+            print(f"   ❌ 결제 처리 중 오류: {e}")
+            if popup_messages is not None:
+                for msg in popup_messages:
+                    if "매물을 저장 하였습니다" in msg:
+                        print(f"   🔄 예외 발생했지만 매물 저장됨 확인 - saved 상태로 재시도 가능")
+                        return (False, "saved")
+            return (False, "failed")
+
+    def attach_dialog_bus(self, page, name='main'):
+        """페이지에 전역 팝업 리스너를 등록하고 해당 페이지 전용 DialogBus 반환"""
+        bus = DialogBus(name)
+        bus.subscribe(self.pacing.observe_dialog)
+
+        # 전역 팝업 처리 함수
+        async def handle_global_popup(dialog):
+            message = dialog.message
+            print(f"전역 팝업 감지: {dialog.type} - {message}")
+
+            try:
+                if dialog.type == 'alert':
+                    await dialog.accept()
+                elif dialog.type == 'confirm':
+                    await dialog.accept()
+                elif dialog.type == 'prompt':
+                    await dialog.accept("")
+            except Exception as e:
+                print(f"팝업 처리 중 오류: {e}")
+
+            await bus.publish(message)
+
+        page.on('dialog', handle_global_popup)
+        return bus
+
+    async def wait_for_dialog(self, popup_messages, patterns, timeout):
+        """DialogBus에서 패턴에 맞는 팝업 메시지 대기
+
+        Returns:
+            (str, str): (결과 키, 메시지) - 타임아웃 또는 메시지 스트림이 없으면 (None, None)
+        """
+        if popup_messages is None:
+            return None, None
+        return await popup_messages.wait_for(patterns, timeout)
+
+    def attach_response_detector(self, page):
+        """페이지에 네트워크 응답 감지기 등록 (NETWORK_DETECTOR=true일 때만)"""
+        if not self.network_detector:
+            return None
+        detector = ResponseDetector(page, self.network_patterns)
+        self.response_detectors[page] = detector
+        return detector
+
+    def arm_response_detector(self, page, action):
+        """버튼 클릭 직전에 호출 - 이후 도착하는 해당 버튼의 백엔드 응답 수집 시작"""
+        detector = self.response_detectors.get(page)
+        if detector:
+            detector.arm(action)
+
+    async def wait_for_confirmation(self, page, popup_messages, patterns, timeout, action=None):
+        """팝업 메시지와 네트워크 응답 중 먼저 판정되는 결과 대기
+
+        네트워크 감지기가 없거나 action이 지정되지 않으면 팝업 메시지만 기다린다.
+
+        Returns:
+            (str, str, str): (결과 키, 메시지/상세, 출처 'dialog' | 'network') - 타임아웃 시 (None, None, None)
+        """
+        detector = self.response_detectors.get(page) if action else None
+        if detector is None or detector.action != action:
+            outcome, message = await self.wait_for_dialog(popup_messages, patterns, timeout)
+            return outcome, message, 'dialog' if outcome else None
+
+        tasks = {
+            asyncio.ensure_future(self.wait_for_dialog(popup_messages, patterns, timeout)): 'dialog',
+            asyncio.ensure_future(detector.wait_verdict(timeout)): 'network',
+        }
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    outcome, message = task.result()
+                    if outcome:
+                        return outcome, message, tasks[task]
+            return None, None, None
+        finally:
+            for task in pending:
+                task.cancel()
+            detector.disarm()
+
+    async def settle_re_register(self, page):
+        """재광고 버튼 클릭 후 대기
+
+        네트워크 감지기가 있으면 백엔드 응답을 최대 1초 기다려 실패 응답이면 False를 반환하고,
+        없으면 기존처럼 1초 대기한다.
+        """
+        if page not in self.response_detectors:
+            await page.wait_for_timeout(1000)
+            return True
+
+        outcome, message, _ = await self.wait_for_confirmation(page, None, {}, timeout=1, action='reReg')
+        if outcome == 'failure':
+            print(f"   ❌ 재광고 요청 실패 (서버 응답: {message})")
+            return False
+        return True
+
+    async def paced(self, page, action):
+        """워커 작업 실행 후 결과로 페이싱을 조정하고 다음 작업 전 지연"""
+        try:
+            outcome = await action
+        except Exception as e:
+            self.pacing.record(e)
+            raise
+        self.pacing.record(outcome)
+        await self.pacing.pause(page)
+        return outcome
+
+    async def create_page_pool(self, context, page, popup_messages):
+        """로그인된 컨텍스트에서 워커 탭 풀 생성 (0번 워커는 메인 탭)"""
+        workers = [(page, popup_messages)]
+        for i in range(1, self.pool_size):
+            worker_page = await context.new_page()
+            bus = self.attach_dialog_bus(worker_page, name=f'worker{i}')
+            self.attach_response_detector(worker_page)
+            workers.append((worker_page, bus))
+        if self.pool_size > 1:
+            print(f"👷 워커 탭 {self.pool_size}개 준비 완료")
+        return PagePool(workers)
+
+    async def start_pipeline(self, context, initial=()):
+        """파이프라인 모드 시작: 전용 탭과 큐를 만들고 재광고/결제 소비자 작업 실행
+
+        Args:
+            initial: 시작 시점에 이미 노출종료된 매물 (진행 저널 재개 등)
+        """
+        page = await context.new_page()
+        bus = self.attach_dialog_bus(page, name='pipeline')
+        self.attach_response_detector(page)
+        self.pipeline_queue = asyncio.Queue()
+        self.pipeline_results = {}
+        for property_number in initial:
+            self.enqueue_ended(property_number)
+        self.pipeline_task = asyncio.create_task(self.pipeline_worker(page, bus))
+        print(f"🔀 파이프라인 탭 준비 완료 (대기 {len(initial)}개)")
+
+    def enqueue_ended(self, property_number):
+        """노출종료 확인된 매물을 파이프라인 큐에 추가 (파이프라인 미사용/종료 후에는 무시)"""
+        if self.pipeline_queue is None or property_number in self.pipeline_results:
+            return
+        self.pipeline_results[property_number] = None
+        self.pipeline_queue.put_nowait(property_number)
+
+    async def pipeline_worker(self, page, popup_messages):
+        """파이프라인 소비자: 큐에서 매물을 꺼내 종료매물 목록에서 재광고/결제 (None이면 종료)"""
+        TRACE_LANE.set(popup_messages.name)
+        CURRENT_STAGE.set('re_register')
+        while True:
+            property_number = await self.pipeline_queue.get()
+            if property_number is None:
+                break
+            print(f"\n🔀 [파이프라인] 매물번호 {property_number} 재광고 처리 중...")
+
+            # 노출종료 서버 반영 대기 (백엔드 응답으로 확인된 경우 생략)
+            if property_number not in self.network_confirmed:
+                await page.wait_for_timeout(2000)
+            try:
+                outcome = await self.paced(page, self.run_recorder.track(
+                    property_number, 're_register', self.reopen_and_process_ended(page, property_number, popup_messages)))
+            except Exception as e:
+                outcome = self.classify_worker_error(property_number, e, popup_messages)
+            self.pipeline_results[property_number] = outcome
+
+        await page.close()
+
+    async def drain_pipeline(self):
+        """1단계 종료 후 남은 큐를 모두 처리하고 결과 반환 ({property_number: (success, status)})"""
+        self.pipeline_queue.put_nowait(None)
+        try:
+            await self.pipeline_task
+        except Exception as e:
+            print(f"❌ 파이프라인 처리 중 오류: {e}")
+        self.pipeline_queue = None
+        results = {num: outcome for num, outcome in self.pipeline_results.items() if outcome is not None}
+        success_count = sum(1 for success, _ in results.values() if success)
+        print(f"\n🔀 [파이프라인 완료] 재광고/결제: {success_count}/{len(results)}개 성공")
+        return results
+
+    async def install_overlay_suppressor(self, context):
+        """컨텍스트에 오버레이 억제 스크립트 설치 (이후 생성/이동하는 매물 리스트 페이지에 적용)"""
+        if not self.overlay_suppressor:
+            return
+        try:
+            await context.add_init_script(overlay_suppressor_script(self.ad_list_path))
+            self.overlay_suppressor_installed = True
+            print(f"✅ 오버레이 억제 스크립트 설치 완료 ({self.ad_list_path})")
+        except Exception as e:
+            print(f"⚠️ 오버레이 억제 스크립트 설치 실패 - 기존 팝업 제거 방식 사용: {e}")
+
+    async def remove_popups(self, page, force=False):
+        """팝업 오버레이 제거
+
+        억제 스크립트가 설치된 경우 매물 리스트의 오버레이는 나타나는 즉시 처리되므로 바로 반환한다.
+        그 밖의 페이지(광고등록/결제)와 force=True이면 페이지에서 즉시 스윕한다.
+        """
+        if self.overlay_suppressor_installed and not force and urlparse(page.url).path.startswith(self.ad_list_path):
+            return
+        try:
+            await page.evaluate(REMOVE_POPUPS_SCRIPT)
+        except:
+            pass
+
+    async def table_fingerprint(self, page):
+        """현재 테이블 지문 (첫/마지막 매물번호, 활성 페이지, 다음 버튼 data-value)"""
+        return await page.evaluate(TABLE_FINGERPRINT_SCRIPT)
+
+    async def wait_for_page_transition(self, page, previous, timeout=10000):
+        """테이블 지문이 이전과 달라질 때까지 대기 (고정 sleep 없이 새 페이지가 그려지는 즉시 반환)
+
+        Returns:
+            bool: 전환 확인 여부 (타임아웃 시 False)
+        """
+        try:
+            await page.wait_for_function(TABLE_TRANSITION_SCRIPT, arg=previous, timeout=timeout)
+            return True
+        except Exception as e:
+            print(f"   ⚠️ 페이지 전환 확인 실패 (이전 지문: {previous}): {e}")
+            return False
+
+    @traced(cat='navigation')
+    async def goto_page(self, page, target_page, current_page=1, ad_list=False):
+        """목록의 target_page로 바로 이동
+
+        1) ad_list=True이고 AD_LIST_PAGE_PARAM이 설정된 경우 URL 파라미터로 이동
+        2) 페이지 번호 링크 클릭 또는 다음 버튼 data-value를 바꿔 페이지네이션 핸들러 실행
+        3) 실패하면 goto_next_page로 순차 이동 (앞쪽 페이지로만 가능)
+
+        Returns:
+            int: 이동 후 현재 페이지 번호
+        """
+        if target_page == current_page:
+            return current_page
+
+        if ad_list and self.page_param:
+            separator = '&' if '?' in self.ad_list_url else '?'
+            await self.goto(page, f"{self.ad_list_url}{separator}{self.page_param}={target_page}", timeout=60000, wait_until='domcontentloaded')
+            await page.wait_for_selector('table tbody tr', state='visible', timeout=30000)
+            await self.remove_popups(page)
+            print(f"   ⏩ {target_page}페이지로 바로 이동 (URL 파라미터)")
+            return target_page
+
+        try:
+            previous = await self.table_fingerprint(page)
+            method = await page.evaluate(GOTO_PAGE_SCRIPT, target_page)
+            if method and await self.wait_for_page_transition(page, previous):
+                await self.remove_popups(page)
+                active = (await self.table_fingerprint(page))['active']
+                if not active or not active.isdigit() or int(active) == target_page:
+                    print(f"   ⏩ {target_page}페이지로 바로 이동 ({method})")
+                    return target_page
+                current_page = int(active)
+                print(f"   ⚠️ {target_page}페이지 직접 이동 결과 {current_page}페이지 - 순차 이동으로 보정")
+        except Exception as e:
+            print(f"   ⚠️ {target_page}페이지 직접 이동 실패 - 순차 이동: {e}")
 
-                if payment_success:
-                    break
+        while current_page < target_page:
+            if not await self.goto_next_page(page, current_page):
+                break
+            current_page += 1
+        return current_page
 
-                if popup_messages is not None:
-                    for msg in popup_messages:
-                        if "동의해 주세요" in msg or "동의" in msg:
-                            print(f"   ❌ 체크박스 미동의로 결제 실패: {msg}")
-                            return (False, "failed")
+    async def iterate_pages_outward(self, page, center, current_page=1, radius=2):
+        """center 페이지부터 바깥쪽으로 (center, center-1, center+1, ...) radius까지 이동하며 도착 페이지 yield
 
-            if payment_success:
-                return (True, "success")
-            else:
-                # 타임아웃: "로켓전송이 완료되었습니다"를 받지 못함
-                print(f"   ❌ 결제 완료 확인 실패 - '로켓전송이 완료되었습니다' alert를 받지 못함")
-                print(f"   📋 받은 팝업 메시지: {popup_messages if popup_messages else '없음'}")
+        이동이 목표 페이지에 닿지 못해도(마지막 페이지 초과 등) 실제 도착한 페이지를 yield하므로
+        호출 측은 마지막으로 받은 값을 현재 페이지로 쓰면 된다.
+        """
+        targets = [center]
+        for distance in range(1, radius + 1):
+            targets += [center - distance, center + distance]
+        for target in targets:
+            if target < 1:
+                continue
+            current_page = await self.goto_page(page, target, current_page, ad_list=True)
+            yield current_page
+
+    async def iterate_pages(self, page, start_page=1, current_page=1):
+        """목록 페이지 순회 (async generator) - 도착한 페이지 번호를 yield
+
+        start_page가 1보다 크면 해당 페이지로 바로 이동해 마지막 페이지까지 순회한 뒤,
+        1페이지로 돌아가 start_page 직전 페이지까지 순회한다.
+        current_page는 순회 시작 시점에 목록이 보여주고 있는 페이지다.
+        """
+        if start_page != current_page:
+            current_page = await self.goto_page(page, start_page, current_page)
+        first_page = current_page
+        wrapped = False
 
-                # "매물을 저장 하였습니다" 팝업이 있었으면 "saved" 상태로 재시도
-                if saved_message_found:
-                    print(f"   🔄 매물이 저장되었으나 결제는 미완료 - 재시도 필요")
-                    return (False, "saved")
-                else:
-                    return (False, "failed")
+        while True:
+            yield current_page
 
-        except Exception as e:
-            print(f"   ❌ 결제 처리 중 오류: {e}")
-            if popup_messages is not None:
-                for msg in popup_messages:
-                    if "매물을 저장 하였습니다" in msg:
-                        print(f"   🔄 예외 발생했지만 매물 저장됨 확인 - saved 상태로 재시도 가능")
-                        return (False, "saved")
-            return (False, "failed")
+            if await self.goto_next_page(page, current_page):
+                current_page += 1
+            elif first_page > 1 and not wrapped:
+                current_page = await self.goto_page(page, 1, current_page)
+                if current_page != 1:
+                    return
+                wrapped = True
+            else:
+                return
 
-    async def remove_popups(self, page):
-        """팝업 오버레이 제거"""
-        try:
-            await page.evaluate('''
-                () => {
-                    const popups = document.querySelectorAll('img[src*="popup"], div[class*="popup"], div[id*="popup"], .modal, .overlay');
-                    popups.forEach(popup => {
-                        popup.style.display = 'none';
-                        popup.style.visibility = 'hidden';
-                        popup.remove();
-                    });
-
-                    const highZIndexElements = document.querySelectorAll('*');
-                    highZIndexElements.forEach(el => {
-                        const zIndex = window.getComputedStyle(el).zIndex;
-                        if (zIndex && parseInt(zIndex) > 1000) {
-                            el.style.display = 'none';
-                            el.remove();
-                        }
-                    });
-                }
-            ''')
-        except:
-            pass
+            if wrapped and current_page >= first_page:
+                return
 
+    @traced(cat='navigation')
     async def goto_next_page(self, page, current_page):
         try:
             next_button = await page.query_selector('.pagination a.btnArrow.next')
@@ -1001,12 +3236,13 @@ class MultiPropertyAutomation:
                     return False
 
                 await self.remove_popups(page)
+                previous = await self.table_fingerprint(page)
 
                 try:
                     await next_button.click(timeout=5000)
                 except Exception:
                     print(f"   ⚠️ 팝업 감지 - 재제거 후 강제 클릭 시도")
-                    await self.remove_popups(page)
+                    await self.remove_popups(page, force=True)
                     await page.wait_for_timeout(300)
                     try:
                         await next_button.click(force=True, timeout=5000)
@@ -1014,21 +3250,17 @@ class MultiPropertyAutomation:
                         print(f"   ⚠️ 강제 클릭도 실패 - JavaScript 직접 클릭 시도")
                         await next_button.evaluate('el => el.click()')
 
-                await page.wait_for_timeout(2000)
-
-                try:
-                    await page.wait_for_selector('table tbody tr', timeout=8000)
-                    await page.wait_for_timeout(500)
-                    await self.remove_popups(page)
-                    return True
-                except:
+                if not await self.wait_for_page_transition(page, previous):
                     return False
+                await self.remove_popups(page)
+                return True
             else:
                 return False
         except Exception as e:
             print(f"   ⚠️ 페이지 이동 중 오류: {e}")
             return False
 
+    @traced()
     async def execute_re_register_from_ended(self, page, row, property_number, popup_messages=None):
         """종료매물에서 재광고 실행 (재시도 전용)
 
@@ -1046,24 +3278,7 @@ class MultiPropertyAutomation:
             print("1️⃣ 재광고 버튼 클릭...")
 
             # 재광고 버튼 클릭 직전 팝업 제거 (종료매물 목록 로딩 후 시간 경과로 재생성된 팝업 제거)
-            await page.evaluate('''
-                () => {
-                    const popups = document.querySelectorAll('img[src*="popup"], div[class*="popup"], div[id*="popup"], .modal, .overlay');
-                    popups.forEach(popup => {
-                        popup.style.display = 'none';
-                        popup.style.visibility = 'hidden';
-                        popup.remove();
-                    });
-                    const highZIndexElements = document.querySelectorAll('*');
-                    highZIndexElements.forEach(el => {
-                        const zIndex = window.getComputedStyle(el).zIndex;
-                        if (zIndex && parseInt(zIndex) > 1000) {
-                            el.style.display = 'none';
-                            el.remove();
-                        }
-                    });
-                }
-            ''')
+            await self.remove_popups(page)
             print("   ✅ [재시도] 재광고 버튼 클릭 전 팝업 제거 완료")
 
             re_ad_button = await row.query_selector('#reReg')
@@ -1071,8 +3286,10 @@ class MultiPropertyAutomation:
                 print("   ❌ 재광고 버튼을 찾을 수 없습니다.")
                 return False
 
+            self.arm_response_detector(page, 'reReg')
             await re_ad_button.click()
-            await page.wait_for_timeout(1000)
+            if not await self.settle_re_register(page):
+                return False
             print("   ✅ 재광고 버튼 클릭 완료")
 
             # 2. 광고등록 페이지 처리
@@ -1089,86 +3306,11 @@ class MultiPropertyAutomation:
                 print("   ⚠️ 페이지 로딩 타임아웃 - 계속 진행")
                 await page.wait_for_timeout(1000)
 
-            # 3. 결제 처리
+            # 3. 결제 처리 (process_payment 공용 경로 - 확인 타임아웃 시 페이싱 감속 포함)
             print("3️⃣ 결제 처리...")
-
-            # 체크박스 클릭
-            checkbox_checked = False
-            for attempt in range(3):
-                try:
-                    await page.wait_for_selector('#consentMobile2', state='attached', timeout=10000)
-
-                    result = await page.evaluate('''
-                        () => {
-                            const checkbox = document.querySelector('#consentMobile2');
-                            if (checkbox) {
-                                checkbox.click();
-                                return checkbox.checked;
-                            }
-                            return false;
-                        }
-                    ''')
-
-                    await page.wait_for_timeout(500)
-
-                    if result:
-                        print(f"   ✅ 체크박스 클릭 완료 (시도 {attempt + 1})")
-                        checkbox_checked = True
-                        break
-                    else:
-                        print(f"   ⚠️ 체크박스 클릭했지만 체크 안됨 (시도 {attempt + 1})")
-                        if attempt < 2:
-                            await page.wait_for_timeout(500)
-                            continue
-
-                except Exception as e:
-                    print(f"   ⚠️ 체크박스 클릭 시도 {attempt + 1} 실패: {e}")
-                    if attempt < 2:
-                        await page.wait_for_timeout(500)
-                        continue
-
-            if not checkbox_checked:
-                print(f"   ❌ 체크박스 클릭 실패 - 매물번호 {property_number} 재시도 실패")
-                return False
-
-            # 결제하기 버튼 클릭
-            payment_button = await page.query_selector('#naverSendSave')
-            if not payment_button:
-                print("   ❌ 결제하기 버튼을 찾을 수 없음")
-                return False
-
-            await payment_button.click()
-            print("   ✅ 결제하기 버튼 클릭 완료")
-
-            # 결제 완료 확인
-            print("   ⏳ 결제 완료 대기 중...")
-            payment_success = False
-            wait_time = 0
-            max_wait = 20
-
-            while wait_time < max_wait:
-                await page.wait_for_timeout(1000)
-                wait_time += 1
-
-                if popup_messages is not None:
-                    for msg in popup_messages:
-                        if "로켓전송이 완료되었습니다" in msg:
-                            print(f"   ✅ 결제 성공 확인: {msg}")
-                            payment_success = True
-                            break
-
-                if payment_success:
-                    break
-
-                if popup_messages is not None:
-                    for msg in popup_messages:
-                        if "동의해 주세요" in msg or "동의" in msg:
-                            print(f"   ❌ 체크박스 미동의로 결제 실패: {msg}")
-                            return False
-
+            payment_success, payment_status = await self.process_payment(page, property_number, popup_messages)
             if not payment_success:
-                print(f"   ❌ 결제 완료 확인 실패 - '로켓전송이 완료되었습니다' alert를 받지 못함")
-                print(f"   📋 받은 팝업 메시지: {popup_messages if popup_messages else '없음'}")
+                print(f"   ❌ [재시도] 매물번호 {property_number} 결제 실패 (상태: {payment_status})")
                 return False
 
             print(f"🎉 [재시도] 매물번호 {property_number} 재광고 완료!")
@@ -1183,6 +3325,7 @@ class MultiPropertyAutomation:
                 pass
             return False
 
+    @traced()
     async def execute_real_update(self, page, row, property_number, popup_messages=None):
         """실제 업데이트 실행
 
@@ -1248,12 +3391,24 @@ class MultiPropertyAutomation:
             try:
                 # 노출종료 버튼 클릭 (전역 팝업 리스너가 처리함)
                 print("🖱️ 노출종료 버튼을 클릭합니다...")
+                self.arm_response_detector(page, 'naverEnd')
                 await end_button.click()
                 print("✅ 노출종료 버튼 클릭 완료")
 
-                # 팝업 처리를 위한 최소 대기
-                print("⏳ 팝업 처리 대기 중...")
-                await page.wait_for_timeout(1000)
+                if page in self.response_detectors:
+                    # 노출종료 백엔드 응답 확인 (응답으로 판정되지 않으면 팝업 메시지로 확인)
+                    outcome, message, source = await self.wait_for_confirmation(
+                        page, popup_messages, EXPOSURE_END_PATTERNS, timeout=10, action='naverEnd'
+                    )
+                    if outcome == 'failure':
+                        print(f"❌ 노출종료 실패: {message}")
+                        return (False, "failed")
+                    if outcome == 'success' and source == 'network':
+                        self.network_confirmed.add(property_number)
+                else:
+                    # 팝업 처리를 위한 최소 대기
+                    print("⏳ 팝업 처리 대기 중...")
+                    await page.wait_for_timeout(1000)
 
                 # 🎯 스마트 대기: 광고종료 버튼이 활성화될 때까지 대기
                 print("⏳ 광고종료 버튼 활성화 대기 중...")
@@ -1271,27 +3426,7 @@ class MultiPropertyAutomation:
             print("2️⃣ 광고종료 버튼 클릭...")
 
             # 팝업 오버레이 제거 (광고종료 버튼 클릭 전) - 강력한 방식으로 수정
-            await page.evaluate('''
-                () => {
-                    // 모든 팝업 오버레이 숨기기
-                    const popups = document.querySelectorAll('img[src*="popup"], div[class*="popup"], div[id*="popup"], .modal, .overlay');
-                    popups.forEach(popup => {
-                        popup.style.display = 'none';
-                        popup.style.visibility = 'hidden';
-                        popup.remove();
-                    });
-
-                    // z-index가 높은 요소들도 제거
-                    const highZIndexElements = document.querySelectorAll('*');
-                    highZIndexElements.forEach(el => {
-                        const zIndex = window.getComputedStyle(el).zIndex;
-                        if (zIndex && parseInt(zIndex) > 1000) {
-                            el.style.display = 'none';
-                            el.remove();
-                        }
-                    });
-                }
-            ''')
+            await self.remove_popups(page)
             print("✅ 광고종료 버튼 클릭 전 팝업 오버레이 제거 완료")
 
             ad_end_button = await page.wait_for_selector('.statusAdEnd', timeout=10000)
@@ -1303,96 +3438,42 @@ class MultiPropertyAutomation:
             print("✅ 종료매물 목록 로딩 완료")
 
             # 종료매물 목록 로딩 후 팝업 제거
-            await page.evaluate('''
-                () => {
-                    // 모든 팝업 오버레이 숨기기
-                    const popups = document.querySelectorAll('img[src*="popup"], div[class*="popup"], div[id*="popup"], .modal, .overlay');
-                    popups.forEach(popup => {
-                        popup.style.display = 'none';
-                        popup.style.visibility = 'hidden';
-                        popup.remove();
-                    });
-
-                    // z-index가 높은 요소들도 제거
-                    const highZIndexElements = document.querySelectorAll('*');
-                    highZIndexElements.forEach(el => {
-                        const zIndex = window.getComputedStyle(el).zIndex;
-                        if (zIndex && parseInt(zIndex) > 1000) {
-                            el.style.display = 'none';
-                            el.remove();
-                        }
-                    });
-                }
-            ''')
+            await self.remove_popups(page)
             print("✅ 종료매물 목록 로딩 후 팝업 오버레이 제거 완료")
 
             # ⏳ 서버 반영 대기: 노출종료한 매물이 종료매물 목록에 반영될 때까지 추가 대기
-            print("⏳ 종료매물 목록 서버 반영 대기 중 (2초)...")
-            await page.wait_for_timeout(2000)
-            print("✅ 서버 반영 대기 완료")
+            #    (노출종료가 백엔드 응답으로 확인된 경우 이미 반영되었으므로 생략)
+            if property_number in self.network_confirmed:
+                print("✅ 노출종료가 서버 응답으로 확인됨 - 서버 반영 대기 생략")
+            else:
+                print("⏳ 종료매물 목록 서버 반영 대기 중 (2초)...")
+                await page.wait_for_timeout(2000)
+                print("✅ 서버 반영 대기 완료")
 
             # 3. 재광고
             print("3️⃣ 종료매물에서 재광고 버튼 검색...")
-            end_rows = await page.query_selector_all('table tbody tr')
+            end_records = await self.extract_rows(page, 'table tbody tr')
+            record = self.find_record(end_records, property_number)
 
             found_in_ended = False
-            for row in end_rows:
-                number_cell = await row.query_selector('td:nth-child(3) > div.numberN')
-                if number_cell:
-                    number_text = await number_cell.inner_text()
-                    if property_number in number_text.strip():
-                        print(f"   종료매물에서 매물번호 {property_number} 발견!")
-
-                        # 재광고 버튼 클릭 직전 팝업 제거 (시간 경과로 재생성된 팝업 제거)
-                        await page.evaluate('''
-                            () => {
-                                const popups = document.querySelectorAll('img[src*="popup"], div[class*="popup"], div[id*="popup"], .modal, .overlay');
-                                popups.forEach(popup => {
-                                    popup.style.display = 'none';
-                                    popup.style.visibility = 'hidden';
-                                    popup.remove();
-                                });
-                                const highZIndexElements = document.querySelectorAll('*');
-                                highZIndexElements.forEach(el => {
-                                    const zIndex = window.getComputedStyle(el).zIndex;
-                                    if (zIndex && parseInt(zIndex) > 1000) {
-                                        el.style.display = 'none';
-                                        el.remove();
-                                    }
-                                });
-                            }
-                        ''')
-                        print("   ✅ 재광고 버튼 클릭 전 팝업 제거 완료")
+            if record:
+                print(f"   종료매물에서 매물번호 {property_number} 발견!")
 
-                        # 🔖 재광고 버튼 클릭 전에 fullName 추출 및 저장 (결제 실패 시 재시도용)
-                        try:
-                            fullname_selectors = [
-                                'td.danjiName p.fullName span',
-                                'p.fullName span',
-                                '.fullName span'
-                            ]
-                            fullname = None
-                            for selector in fullname_selectors:
-                                fullname_element = await row.query_selector(selector)
-                                if fullname_element:
-                                    fullname_text = await fullname_element.inner_text()
-                                    fullname = fullname_text.strip()
-                                    if fullname:
-                                        self.fullname_mapping[property_number] = fullname
-                                        print(f"   🔖 fullName 저장: {property_number} → {self.mask_property_name(fullname)}")
-                                        break
-                            if not fullname:
-                                print(f"   ⚠️ fullName을 찾을 수 없음 (결제 실패 시 재시도 불가)")
-                        except Exception as e:
-                            print(f"   ⚠️ fullName 추출 실패: {e}")
-
-                        re_ad_button = await row.query_selector('#reReg')
-                        if re_ad_button:
-                            await re_ad_button.click()
-                            await page.wait_for_timeout(1000)
-                            print("   ✅ 재광고 버튼 클릭 완료")
-                            found_in_ended = True
-                            break
+                # 재광고 버튼 클릭 직전 팝업 제거 (시간 경과로 재생성된 팝업 제거)
+                await self.remove_popups(page)
+                print("   ✅ 재광고 버튼 클릭 전 팝업 제거 완료")
+
+                # 🔖 재광고 버튼 클릭 전에 fullName 저장 (결제 실패 시 재시도용)
+                self.remember_fullname(property_number, record)
+
+                if record['buttons']['reReg']:
+                    re_ad_button = await page.query_selector(f"table tbody tr >> nth={record['index']} >> #reReg")
+                    self.arm_response_detector(page, 'reReg')
+                    await re_ad_button.click()
+                    if not await self.settle_re_register(page):
+                        return (False, "exposure_ended")
+                    print("   ✅ 재광고 버튼 클릭 완료")
+                    found_in_ended = True
 
             if not found_in_ended:
                 print(f"   ❌ 종료매물에서 매물번호 {property_number}를 찾을 수 없습니다.")
@@ -1412,97 +3493,12 @@ class MultiPropertyAutomation:
                 print("   ⚠️ 페이지 로딩 타임아웃 - 계속 진행")
                 await page.wait_for_timeout(1000)
 
-            # 5. 결제
+            # 5. 결제 (process_payment 공용 경로 - 확인 타임아웃 시 페이싱 감속 포함)
             print("5️⃣ 결제 처리...")
-
-            # ✅ 체크박스 클릭 (evaluate 방식 - viewport/visibility 무관)
-            checkbox_checked = False
-            for attempt in range(3):  # 최대 3회 시도
-                try:
-                    # 체크박스 존재 확인
-                    await page.wait_for_selector('#consentMobile2', state='attached', timeout=10000)
-
-                    # ✅ JavaScript로 직접 클릭 (이전 안정 버전 방식)
-                    result = await page.evaluate('''
-                        () => {
-                            const checkbox = document.querySelector('#consentMobile2');
-                            if (checkbox) {
-                                checkbox.click();
-                                // 클릭 후 실제로 체크되었는지 확인
-                                return checkbox.checked;
-                            }
-                            return false;
-                        }
-                    ''')
-
-                    await page.wait_for_timeout(500)
-
-                    if result:
-                        print(f"   ✅ 체크박스 클릭 완료 (시도 {attempt + 1})")
-                        checkbox_checked = True
-                        break
-                    else:
-                        print(f"   ⚠️ 체크박스 클릭했지만 체크 안됨 (시도 {attempt + 1})")
-                        if attempt < 2:
-                            await page.wait_for_timeout(500)
-                            continue
-
-                except Exception as e:
-                    print(f"   ⚠️ 체크박스 클릭 시도 {attempt + 1} 실패: {e}")
-                    if attempt < 2:
-                        await page.wait_for_timeout(500)
-                        continue
-
-            # 체크박스가 체크되지 않으면 실패 처리
-            if not checkbox_checked:
-                print(f"   ❌ 체크박스 클릭 실패 - 매물번호 {property_number} 업데이트 실패")
-                return (False, "exposure_ended")
-
-            # 체크박스 체크 후에만 결제하기 버튼 클릭
-            payment_button = await page.query_selector('#naverSendSave')
-            if not payment_button:
-                print("   ❌ 결제하기 버튼을 찾을 수 없음")
-                return (False, "exposure_ended")
-
-            await payment_button.click()
-            print("   ✅ 결제하기 버튼 클릭 완료")
-
-            # ✅ "로켓전송이 완료되었습니다" alert 대기 (최대 20초)
-            print("   ⏳ 결제 완료 대기 중...")
-            payment_success = False
-            saved_message_found = False
-            wait_time = 0
-            max_wait = 20
-
-            while wait_time < max_wait:
-                await page.wait_for_timeout(1000)
-                wait_time += 1
-
-                if popup_messages is not None:
-                    for msg in popup_messages:
-                        if "로켓전송이 완료되었습니다" in msg:
-                            print(f"   ✅ 결제 성공 확인: {msg}")
-                            payment_success = True
-                            break
-                        elif "매물을 저장 하였습니다" in msg:
-                            saved_message_found = True
-
-                if payment_success:
-                    break
-
-                if popup_messages is not None:
-                    for msg in popup_messages:
-                        if "동의해 주세요" in msg or "동의" in msg:
-                            print(f"   ❌ 체크박스 미동의로 결제 실패: {msg}")
-                            return (False, "exposure_ended")
-
+            payment_success, payment_status = await self.process_payment(page, property_number, popup_messages)
             if not payment_success:
-                print(f"   ❌ 결제 완료 확인 실패 - '로켓전송이 완료되었습니다' alert를 받지 못함")
-                print(f"   📋 받은 팝업 메시지: {popup_messages if popup_messages else '없음'}")
-                if saved_message_found:
-                    print(f"   🔄 매물이 저장되었으나 결제는 미완료 - 재시도 필요")
-                    return (False, "saved")
-                return (False, "exposure_ended")
+                # 노출종료는 끝났으므로 매물만 저장된 경우가 아니면 종료매물 목록에서 재시도
+                return (False, "saved" if payment_status == "saved" else "exposure_ended")
 
             print(f"🎉 매물번호 {property_number} 실제 업데이트 완료!")
             return (True, "success")
@@ -1517,6 +3513,85 @@ class MultiPropertyAutomation:
                 pass
             return (False, "exposure_ended" if exposure_ended else "failed")
     
+    def resume_from_journal(self):
+        """진행 저널에서 이번 대상 매물의 마지막 단계 복원
+
+        위치/fullName은 모든 기록 매물에 대해 미리 채우고, 노출종료 이후 단계까지 진행된 매물만
+        재개 대상으로 반환한다 (found 단계는 위치만 재사용하고 노출종료부터 다시 처리).
+
+        Returns:
+            dict: {property_number: stage} - stage는 exposure_ended 이후 단계
+        """
+        states = self.journal.load()
+        resumed = {}
+        for num in self.property_numbers:
+            state = states.get(num)
+            if not state:
+                continue
+            if state.get('page') and state['stage'] != 'paid':
+                self.listing_pages[num] = state['page']
+            if state.get('ended_page'):
+                self.ended_pages[num] = state['ended_page']
+            if state.get('fullname'):
+                self.fullname_mapping[num] = state['fullname']
+            if ProgressJournal.rank(state['stage']) >= ProgressJournal.rank('exposure_ended'):
+                resumed[num] = state['stage']
+
+        if resumed:
+            print(f"\n📓 진행 저널에서 {len(resumed)}개 매물 재개:")
+            for num, stage in resumed.items():
+                print(f"   - {num}: {stage} 단계부터")
+        return resumed
+
+    def final_status(self, prop_num, payment_results, exposure_fail_codes):
+        """매물의 최종 상태 코드 (REASON_MAP 키)"""
+        result = payment_results.get(prop_num)
+        if result is None:
+            return exposure_fail_codes.get(prop_num, 'not_processed')
+        if isinstance(result, tuple):
+            return 'success' if result[0] else result[1]
+        return 'success' if result else 'process_failed'
+
+    def finish_property(self, prop_num, payment_results, exposure_fail_codes):
+        """실행 결과에 매물 최종 상태와 목록 위치 기록 (매물명은 마스킹)"""
+        self.run_recorder.finish(
+            prop_num,
+            self.final_status(prop_num, payment_results, exposure_fail_codes),
+            masked_name=self.mask_property_name(self.property_name_mapping.get(prop_num, '매물명 미확인')),
+            list_page=self.listing_pages.get(prop_num),
+            ended_page=self.ended_pages.get(prop_num),
+            lookup=self.lookup_paths.get(prop_num),
+        )
+
+    def write_run_result(self, aborted=None):
+        """실행 결과 파일 저장 (시작 시간/페이싱/리소스 요약 포함)"""
+        self.run_recorder.extra = {
+            'startup': self.startup_timing,
+            'listing_total': self.listing_total,
+            'pool_size': self.pool_size,
+            'pacing': {
+                'final_delay_ms': self.pacing.delay_ms,
+                'total_wait_ms': self.pacing.total_wait_ms,
+                'adjustments': self.pacing.adjustments,
+            },
+            'resources': self.resource_policy.summary(),
+            'resumed': self.resumed,
+            'lookup': {
+                'list_search': self.list_search,
+                'paths': {
+                    path: sum(paths.count(path) for paths in self.lookup_paths.values())
+                    for path in sorted({path for paths in self.lookup_paths.values() for path in paths})
+                },
+            },
+        }
+        self.run_recorder.write(os.path.join(self.results_dir, os.path.basename(RUN_RESULT_PATH)), aborted=aborted)
+        self.tracer.export(self.trace_output)
+        self.profiler.finish()
+        self.listing_cache.save()
+        # 진행 저널은 한 배치 안에서만 유효 - 정상 종료 시 삭제하고, 중단된 실행만 다음 실행에서 재개
+        if aborted is None:
+            self.journal.clear()
+
     async def run_automation(self):
         """다중 매물 자동화 실행 (배치 처리 방식)"""
         print("\n" + "="*80)
@@ -1527,69 +3602,89 @@ class MultiPropertyAutomation:
             print("❌ 처리할 매물번호가 없습니다.")
             sys.exit(1)
 
+        # Playwright는 브라우저를 실제로 다룰 때만 import (--plan 등 가벼운 경로의 시작 시간 단축)
+        from playwright.async_api import async_playwright
+
+        self.profiler.install()
         async with async_playwright() as p:
             try:
-                # 브라우저 실행
-                browser = await p.chromium.launch(
-                    headless=True,
-                    slow_mo=50,
-                    args=[
-                        '--disable-blink-features=AutomationControlled',
-                        '--no-sandbox',
-                        '--disable-setuid-sandbox',
-                        '--disable-dev-shm-usage',
-                        '--disable-accelerated-2d-canvas',
-                        '--no-first-run',
-                        '--no-zygote',
-                        '--disable-gpu',
-                        '--disable-web-security'
-                    ]
-                )
+                startup_started = self.run_started = time.perf_counter()
+
+                # 브라우저 실행 (서버 재사용 모드면 기존 서버에 접속)
+                browser = await self.open_browser(p)
 
+                storage_state = self.session_cache.load() if self.session_cache else None
                 context = await browser.new_context(
                     viewport={'width': 1280, 'height': 720},
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                    storage_state=storage_state
                 )
 
-                page = await context.new_page()
-
-                # 팝업 메시지 저장용 변수
-                popup_messages = []
+                await self.install_overlay_suppressor(context)
+                await self.resource_policy.install(context)
 
-                # 전역 팝업 처리 함수
-                async def handle_global_popup(dialog):
-                    message = dialog.message
-                    print(f"전역 팝업 감지: {dialog.type} - {message}")
-                    popup_messages.append(message)
-
-                    try:
-                        if dialog.type == 'alert':
-                            await dialog.accept()
-                        elif dialog.type == 'confirm':
-                            await dialog.accept()
-                        elif dialog.type == 'prompt':
-                            await dialog.accept("")
-                    except Exception as e:
-                        print(f"팝업 처리 중 오류: {e}")
+                page = await context.new_page()
 
-                # 전역 팝업 리스너 등록
-                page.on('dialog', handle_global_popup)
+                # 팝업 메시지 스트림 (페이지별) - 전역 팝업 리스너 등록
+                popup_messages = self.attach_dialog_bus(page)
+                self.attach_response_detector(page)
 
-                # 로그인
-                login_success = await self.login(page)
-                if not login_success:
+                # 로그인 (세션 캐시가 있으면 유효성 확인 후 생략)
+                with self.run_recorder.stage('login'):
+                    login_mode = await self.ensure_session(context, page, storage_state is not None)
+                if not login_mode:
                     print("❌ 로그인 실패로 자동화 중단")
+                    self.write_run_result(aborted='login_failed')
                     await browser.close()
                     sys.exit(1)
 
+                self.startup_timing.update({
+                    'mode': login_mode,
+                    'seconds': round(time.perf_counter() - startup_started, 2),
+                })
+                print(f"⏱️ 시작 소요 시간: {self.startup_timing['seconds']}초 ({'세션 캐시' if login_mode == 'session' else '로그인'})")
+
+                # 워커 풀 (로그인 후 생성해야 추가 탭이 세션 쿠키를 공유)
+                self.page_pool = await self.create_page_pool(context, page, popup_messages)
+
                 # ============================================================
                 # [배치 처리 로직]
                 # 1단계: 모든 매물 노출종료
                 # 2-3단계: 광고종료 → 종료매물 리스트에서 모든 매물 재광고/결제
                 # ============================================================
 
-                # 1단계: 모든 매물 노출종료
-                exposure_results = await self.batch_end_exposure(page, popup_messages)
+                # 진행 저널: 이전 실행에서 노출종료 이후 단계까지 진행된 매물은 해당 단계부터 재개
+                self.resumed = self.resume_from_journal()
+
+                # 파이프라인 모드: 노출종료가 확인된 매물(재개 매물 포함)을 두 번째 탭에서 바로 재광고/결제
+                if self.pipeline_mode:
+                    await self.start_pipeline(context, [
+                        num for num, stage in self.resumed.items() if stage in ('exposure_ended', 'fullname')
+                    ])
+
+                # 1단계: 모든 매물 노출종료 (재개 매물 제외)
+                original_property_numbers = self.property_numbers
+                self.property_numbers = [num for num in original_property_numbers if num not in self.resumed]
+                exposure_results = {}
+                if self.property_numbers:
+                    with self.run_recorder.stage('exposure_end'), self.tracer.span('phase1_exposure_end', 'phase'):
+                        async with self.list_lock.hold():
+                            exposure_results = await self.batch_end_exposure(page, popup_messages)
+                self.property_numbers = original_property_numbers
+
+                for prop_num, stage in self.resumed.items():
+                    exposure_results[prop_num] = (True, None)
+                    self.run_recorder.record(prop_num, 'exposure_end', (True, f"resumed:{stage}"))
+                exposure_results = {num: exposure_results[num] for num in self.property_numbers if num in exposure_results}
+
+                # 파이프라인 모드: 1단계와 겹쳐 처리된 재광고/결제의 남은 작업 마무리
+                pipeline_results = {}
+                if self.pipeline_mode:
+                    with self.run_recorder.stage('re_register'), self.tracer.span('pipeline_drain', 'phase'):
+                        pipeline_results = await self.drain_pipeline()
+                for prop_num, outcome in exposure_results.items():
+                    if 'exposure_end' not in self.run_recorder.properties.get(prop_num, {}).get('stages', {}):
+                        self.run_recorder.record(prop_num, 'exposure_end', outcome)
 
                 successful_exposures = [
                     prop_num for prop_num, (success, _) in exposure_results.items() if success
@@ -1599,17 +3694,13 @@ class MultiPropertyAutomation:
                     prop_num for prop_num, (success, _) in exposure_results.items() if not success
                 ]
 
-                exposure_fail_reasons = {}
-                for prop_num, (success, status) in exposure_results.items():
-                    if not success:
-                        if status == "not_rocket":
-                            exposure_fail_reasons[prop_num] = "로켓등록 상품 아님"
-                        elif status is None:
-                            exposure_fail_reasons[prop_num] = "매물을 찾을 수 없습니다"
-                        elif status == "error":
-                            exposure_fail_reasons[prop_num] = "처리 중 오류 발생"
-                        else:
-                            exposure_fail_reasons[prop_num] = "노출종료 실패"
+                exposure_fail_codes = {
+                    prop_num: exposure_status_code(status)
+                    for prop_num, (success, status) in exposure_results.items() if not success
+                }
+                exposure_fail_reasons = {
+                    prop_num: REASON_MAP[code] for prop_num, code in exposure_fail_codes.items()
+                }
 
                 if successful_exposures:
                     print(f"\n✅ 노출종료 성공 매물: {len(successful_exposures)}개")
@@ -1629,8 +3720,8 @@ class MultiPropertyAutomation:
                     print(f"❌ 최종 실패: {', '.join(self.property_numbers)}")
                     print("\n📋 실패 상세:")
                     try:
-                        os.makedirs("results", exist_ok=True)
-                        with open("results/email_report.txt", "w", encoding="utf-8") as f:
+                        os.makedirs(self.results_dir, exist_ok=True)
+                        with open(self.email_report_path, "w", encoding="utf-8") as f:
                             for prop_num in self.property_numbers:
                                 prop_name = self.property_name_mapping.get(prop_num, '매물명 미확인')
                                 reason = exposure_fail_reasons.get(prop_num, '노출종료 실패')
@@ -1645,19 +3736,40 @@ class MultiPropertyAutomation:
                             print(f"FAIL_DETAIL:{prop_num}|{self.mask_property_name(prop_name)}|{reason}")
                     print("="*80)
 
+                    for prop_num in self.property_numbers:
+                        self.finish_property(prop_num, {}, exposure_fail_codes)
+                    self.write_run_result()
+
                     await browser.close()
                     sys.exit(0)
 
                 # 2-3단계: 노출종료 성공한 매물들만 재광고/결제 (배치 처리)
-                # property_numbers를 임시로 성공한 매물로 교체
+                # property_numbers를 임시로 성공한 매물로 교체 (재광고 이후 단계에서 재개한 매물은 제외)
                 original_property_numbers = self.property_numbers
-                self.property_numbers = successful_exposures
+                # (파이프라인에서 이미 처리한 매물도 제외)
+                self.property_numbers = [
+                    num for num in successful_exposures
+                    if self.resumed.get(num) not in ('re_registered', 'saved', 'paid') and num not in pipeline_results
+                ]
 
-                payment_results = await self.batch_process_ended_properties(page, popup_messages)
+                payment_results = dict(pipeline_results)
+                if self.property_numbers:
+                    with self.run_recorder.stage('re_register'), self.tracer.span('phase3_re_register', 'phase'):
+                        payment_results.update(await self.batch_process_ended_properties(page, popup_messages))
 
                 # 원래 매물 리스트 복원
                 self.property_numbers = original_property_numbers
 
+                # 재개 매물: 결제 완료는 성공, 저장 이후는 매물 리스트에서 fullName으로 결제 재시도,
+                # 재광고 클릭 후 저장 전에 중단된 매물은 아직 종료매물 목록에 있으므로 종료매물 목록에서 재시도
+                for prop_num, stage in self.resumed.items():
+                    if stage == 'paid':
+                        payment_results[prop_num] = (True, "success")
+                    elif stage == 'saved':
+                        payment_results[prop_num] = (False, "saved")
+                    elif stage == 're_registered':
+                        payment_results[prop_num] = (False, "exposure_ended")
+
                 failed_payments = {}
                 for prop_num in successful_exposures:
                     payment_result = payment_results.get(prop_num)
@@ -1676,10 +3788,25 @@ class MultiPropertyAutomation:
                 if failed_payments:
                     print(f"\n🔄 실패 매물 재시도 ({len(failed_payments)}개)")
                     print("="*60)
+                    retry_phase_started = time.perf_counter()
+                    retry_phase_span = self.tracer.start('retry_phase', 'phase', count=len(failed_payments))
+                    retry_stage_token = CURRENT_STAGE.set('retry')
 
                     for idx, (property_number, fail_status) in enumerate(failed_payments.items(), 1):
                         print(f"\n[재시도 {idx}/{len(failed_payments)}] 매물번호 {property_number} (상태: {fail_status})")
+                        retry_started = time.perf_counter()
+                        self.run_recorder.add_retry(property_number)
+                        if fail_status == "saved":
+                            retry_branch = 'retry_saved'
+                        elif property_number in successful_exposures:
+                            retry_branch = 'retry_ended_list'
+                        else:
+                            retry_branch = 'retry_exposure_end'
+                        retry_span = self.tracer.start(retry_branch, 'retry', property=property_number, status=fail_status)
+                        retry_outcome = None  # 재시도 자체의 결과 (원래 실패 상태가 아닌)
 
+                        # 재시도는 목록 탐색·클릭과 결제가 섞여 있으므로 매물 단위로 샤드 간 목록 잠금
+                        await self.list_lock.acquire()
                         try:
                             # 상태에 따라 재시도 위치 결정
                             if fail_status == "saved":
@@ -1691,111 +3818,55 @@ class MultiPropertyAutomation:
                                 if not saved_fullname:
                                     print(f"   ❌ 저장된 fullName 없음 - 재시도 불가")
                                     print(f"   ℹ️ 광고등록 페이지까지 도달하지 못한 경우입니다.")
+                                    self.tracer.finish(retry_span, success=False)
+                                    self.run_recorder.record(property_number, 'retry', (False, fail_status), time.perf_counter() - retry_started)
                                     continue
 
                                 print(f"   🔍 검색할 fullName: {self.mask_property_name(saved_fullname)}")
 
-                                # 매물 리스트 페이지로 이동
-                                await page.goto(self.ad_list_url, timeout=60000, wait_until='domcontentloaded')
-                                await page.wait_for_selector('table tbody tr', state='visible', timeout=30000)
-                                await self.remove_popups(page)
-
-                                # 전체 매물 개수 조회
-                                try:
-                                    total_count_element = await page.query_selector('#wrap > div.container > div > div > div.sectionWrap > div.statusWrap.ver3 > div.statusItem.statusAll.GTM_offerings_ad_list_total > span.cnt')
-                                    if total_count_element:
-                                        total_count_text = await total_count_element.inner_text()
-                                        total_count = int(total_count_text.strip().replace(',', ''))
-                                        max_pages = (total_count + 49) // 50
-                                        print(f"   📊 전체 매물: {total_count}개 → 최대 {max_pages}페이지까지 검색")
+                                # 매물 검색 (#naverAd 버튼이 있는 행 중 fullName 매칭, 목록 검색 우선)
+                                record, _ = await self.find_in_ad_list(
+                                    page, property_number,
+                                    lambda r: r['buttons']['naverAd'] and r['fullname'] == saved_fullname,
+                                    saved_fullname, cached_page=self.listing_cache.page_of(property_number)
+                                )
+                                if record:
+                                    print(f"   🎯 fullName 매칭 성공: {self.mask_property_name(record['fullname'])}")
+
+                                    # 팝업 메시지 초기화
+                                    if popup_messages is not None:
+                                        popup_messages.clear()
+
+                                    # 팝업 제거
+                                    await self.remove_popups(page)
+
+                                    print(f"   🖱️ 광고하기 버튼 클릭...")
+                                    ad_button = await page.query_selector(f"table tbody tr >> nth={record['index']} >> #naverAd")
+                                    await ad_button.click()
+                                    await page.wait_for_timeout(1000)
+                                    print(f"   ✅ 광고하기 버튼 클릭 완료")
+
+                                    print(f"   ⏳ 결제 페이지 로딩 대기 중...")
+                                    await page.wait_for_selector('#consentMobile2', state='attached', timeout=15000)
+                                    print(f"   ✅ 결제 페이지 이동 완료")
+
+                                    payment_success, payment_status = await self.process_payment(page, property_number, popup_messages)
+                                    retry_outcome = (payment_success, payment_status)
+
+                                    if payment_success:
+                                        payment_results[property_number] = (True, "success")
+                                        self.mark_paid(property_number)
+                                        print(f"   ✅ 재시도 성공: {property_number}")
                                     else:
-                                        max_pages = 10
-                                except:
-                                    max_pages = 10
-
-                                # 매물 검색 (fullName 매칭)
-                                property_found = False
-                                current_page = 1
-
-                                while not property_found and current_page <= max_pages:
-                                    print(f"   📄 {current_page}페이지에서 fullName 매칭 검색 중...")
-
-                                    await page.wait_for_selector('table tbody tr', timeout=30000)
-                                    rows = await page.query_selector_all('table tbody tr')
-
-                                    for row in rows:
-                                        try:
-                                            # #naverAd 버튼이 있는 행만 확인
-                                            ad_button = await row.query_selector('#naverAd')
-                                            if not ad_button:
-                                                continue
-
-                                            # fullName 추출 및 매칭
-                                            fullname_selectors = [
-                                                'td.danjiName p.fullName span',
-                                                'td.danjiName > div > p.fullName > span',
-                                                'p.fullName span'
-                                            ]
-                                            current_fullname = None
-                                            for selector in fullname_selectors:
-                                                fullname_element = await row.query_selector(selector)
-                                                if fullname_element:
-                                                    fullname_text = await fullname_element.inner_text()
-                                                    current_fullname = fullname_text.strip()
-                                                    if current_fullname:
-                                                        break
-                                            
-                                            if current_fullname:
-                                                # fullName 매칭 확인
-                                                if current_fullname == saved_fullname:
-                                                    print(f"   🎯 fullName 매칭 성공: {self.mask_property_name(current_fullname)}")
-                                                    property_found = True
-
-                                                    # 팝업 메시지 초기화
-                                                    if popup_messages is not None:
-                                                        popup_messages.clear()
-
-                                                    # 팝업 제거
-                                                    await self.remove_popups(page)
-
-                                                    print(f"   🖱️ 광고하기 버튼 클릭...")
-                                                    await ad_button.click()
-                                                    await page.wait_for_timeout(1000)
-                                                    print(f"   ✅ 광고하기 버튼 클릭 완료")
-
-                                                    print(f"   ⏳ 결제 페이지 로딩 대기 중...")
-                                                    await page.wait_for_selector('#consentMobile2', state='attached', timeout=15000)
-                                                    print(f"   ✅ 결제 페이지 이동 완료")
-
-                                                    payment_success, payment_status = await self.process_payment(page, property_number, popup_messages)
-
-                                                    if payment_success:
-                                                        payment_results[property_number] = (True, "success")
-                                                        print(f"   ✅ 재시도 성공: {property_number}")
-                                                    else:
-                                                        print(f"   ❌ 재시도 실패: {property_number} (상태: {payment_status})")
-
-                                                    break
-
-                                        except Exception as e:
-                                            print(f"   ⚠️ 행 처리 중 오류: {e}")
-                                            continue
-
-                                    if property_found:
-                                        break
-
-                                    # 다음 페이지로 이동
-                                    if not await self.goto_next_page(page, current_page):
-                                        break
-                                    current_page += 1
-
-                                if not property_found:
+                                        print(f"   ❌ 재시도 실패: {property_number} (상태: {payment_status})")
+                                else:
+                                    retry_outcome = (False, "exposure_not_found")
                                     print(f"   ❌ fullName 매칭 실패: {self.mask_property_name(saved_fullname)}을(를) 찾을 수 없습니다.")
 
                             elif property_number in successful_exposures:
                                 print(f"   📍 노출종료 완료됨 → 종료매물 목록에서 재시도")
 
-                                await page.goto(self.ad_list_url, timeout=60000, wait_until='domcontentloaded')
+                                await self.goto(page, self.ad_list_url, timeout=60000, wait_until='domcontentloaded')
                                 await page.wait_for_selector('table tbody tr', state='visible', timeout=30000)
                                 await self.remove_popups(page)
 
@@ -1805,7 +3876,11 @@ class MultiPropertyAutomation:
                                 await self.remove_popups(page)
                                 await page.wait_for_timeout(1000)
 
-                                success, status = await self.process_single_ended_property(page, property_number, popup_messages)
+                                success, status = await self.process_single_ended_property(
+                                    page, property_number, popup_messages,
+                                    start_page=self.ended_pages.get(property_number, 1)
+                                )
+                                retry_outcome = (success, status)
 
                                 if success:
                                     payment_results[property_number] = (True, "success")
@@ -1817,97 +3892,69 @@ class MultiPropertyAutomation:
                                 # 노출종료 미완료 → 일반 매물 리스트에서 전체 프로세스 재시도
                                 print(f"   📍 노출종료 미완료 → 일반 매물 리스트에서 전체 프로세스 재시도")
 
-                                # 매물 리스트로 이동
-                                await page.goto(self.ad_list_url, timeout=60000, wait_until='domcontentloaded')
-                                await page.wait_for_selector('table tbody tr', state='visible', timeout=30000)
-                                await self.remove_popups(page)
-
-                                # 전체 매물 개수 조회
-                                try:
-                                    total_count_element = await page.query_selector('#wrap > div.container > div > div > div.sectionWrap > div.statusWrap.ver3 > div.statusItem.statusAll.GTM_offerings_ad_list_total > span.cnt')
-                                    if total_count_element:
-                                        total_count_text = await total_count_element.inner_text()
-                                        total_count = int(total_count_text.strip().replace(',', ''))
-                                        max_pages = (total_count + 49) // 50
-                                        print(f"   📊 전체 매물: {total_count}개 → 최대 {max_pages}페이지까지 검색")
+                                # 매물 검색 및 노출종료 실행 (목록 검색 우선)
+                                record, _ = await self.find_in_ad_list(
+                                    page, property_number, lambda r: property_number in r['number'],
+                                    property_number, 'table tbody tr.adComplete',
+                                    cached_page=self.listing_cache.page_of(property_number)
+                                )
+                                if record:
+                                    print(f"   🎯 매물번호 {property_number} 발견!")
+
+                                    # 광고유형 확인
+                                    if not is_rocket(record['ad_type']):
+                                        retry_outcome = (False, "not_rocket")
+                                        print(f"   ❌ 로켓등록 상품이 아님")
                                     else:
-                                        max_pages = 10
-                                except:
-                                    max_pages = 10
-
-                                # 매물 검색 및 노출종료 실행
-                                property_found = False
-                                current_page = 1
-
-                                while not property_found and current_page <= max_pages:
-                                    print(f"   📄 {current_page}페이지에서 매물 검색 중...")
-
-                                    await page.wait_for_selector('table tbody tr.adComplete', timeout=30000)
-                                    rows = await page.query_selector_all('table tbody tr.adComplete')
-
-                                    for row in rows:
-                                        try:
-                                            number_cell = await row.query_selector('td:nth-child(3) > div.numberN')
-                                            if number_cell:
-                                                number_text = await number_cell.inner_text()
-                                                if property_number in number_text.strip():
-                                                    print(f"   🎯 매물번호 {property_number} 발견!")
-                                                    property_found = True
-
-                                                    # 광고유형 확인
-                                                    ad_type_cell = await row.query_selector('td:nth-child(8)')
-                                                    if ad_type_cell:
-                                                        ad_type_text = await ad_type_cell.inner_text()
-                                                        if "로켓등록" not in ad_type_text:
-                                                            print(f"   ❌ 로켓등록 상품이 아님")
-                                                            break
-
-                                                    # 노출종료 실행
-                                                    success = await self.execute_single_exposure_end(page, row, property_number)
-
-                                                    if success:
-                                                        # 노출종료 성공 시 종료매물에서 재광고/결제
-                                                        await page.goto(self.ad_list_url, timeout=60000, wait_until='domcontentloaded')
-                                                        await self.remove_popups(page)
-
-                                                        ad_end_button = await page.wait_for_selector('.statusAdEnd', timeout=10000)
-                                                        await ad_end_button.click()
-                                                        await page.wait_for_selector('table tbody tr', state='visible', timeout=10000)
-                                                        await self.remove_popups(page)
-                                                        await page.wait_for_timeout(2000)
-
-                                                        payment_success, payment_status = await self.process_single_ended_property(page, property_number, popup_messages)
-
-                                                        if payment_success:
-                                                            payment_results[property_number] = (True, "success")
-                                                            print(f"   ✅ 재시도 성공: {property_number}")
-                                                        else:
-                                                            print(f"   ❌ 재시도 실패: {property_number} (상태: {payment_status})")
-                                                    else:
-                                                        print(f"   ❌ 노출종료 재시도 실패: {property_number}")
-
-                                                    break
-                                        except Exception as e:
-                                            print(f"   ⚠️ 행 처리 중 오류: {e}")
-                                            continue
-
-                                    if property_found:
-                                        break
-
-                                    # 다음 페이지로 이동
-                                    if not await self.goto_next_page(page, current_page):
-                                        break
-                                    current_page += 1
-
-                                if not property_found:
+                                        # 노출종료 실행
+                                        row = await self.get_row_handle(page, record, 'table tbody tr.adComplete')
+                                        success = await self.execute_single_exposure_end(page, row, property_number, popup_messages)
+
+                                        if success:
+                                            # 노출종료 성공 시 종료매물에서 재광고/결제
+                                            await self.goto(page, self.ad_list_url, timeout=60000, wait_until='domcontentloaded')
+                                            await self.remove_popups(page)
+
+                                            ad_end_button = await page.wait_for_selector('.statusAdEnd', timeout=10000)
+                                            await ad_end_button.click()
+                                            await page.wait_for_selector('table tbody tr', state='visible', timeout=10000)
+                                            await self.remove_popups(page)
+                                            await page.wait_for_timeout(2000)
+
+                                            payment_success, payment_status = await self.process_single_ended_property(page, property_number, popup_messages)
+                                            retry_outcome = (payment_success, payment_status)
+
+                                            if payment_success:
+                                                payment_results[property_number] = (True, "success")
+                                                print(f"   ✅ 재시도 성공: {property_number}")
+                                            else:
+                                                print(f"   ❌ 재시도 실패: {property_number} (상태: {payment_status})")
+                                        else:
+                                            retry_outcome = (False, "exposure_failed")
+                                            print(f"   ❌ 노출종료 재시도 실패: {property_number}")
+                                else:
+                                    retry_outcome = (False, "exposure_not_found")
                                     print(f"   ❌ 매물번호 {property_number}를 찾을 수 없습니다.")
 
                         except Exception as e:
+                            retry_outcome = (False, "process_error")
                             print(f"   ❌ 재시도 중 오류: {e}")
+                        finally:
+                            self.list_lock.release()
 
-                        # 재시도 간 대기
+                        if retry_outcome is None:
+                            retry_outcome = (False, fail_status)
+                        self.tracer.finish(retry_span, success=bool(retry_outcome[0]))
+                        self.run_recorder.record(property_number, 'retry', retry_outcome, time.perf_counter() - retry_started)
+                        self.pacing.record(retry_outcome)
+
+                        # 재시도 간 대기 (적응형 페이싱)
                         if idx < len(failed_payments):
-                            await page.wait_for_timeout(1000)
+                            await self.pacing.pause(page)
+
+                    self.tracer.finish(retry_phase_span)
+                    CURRENT_STAGE.reset(retry_stage_token)
+                    self.run_recorder.stage_timings['retry'] = round(time.perf_counter() - retry_phase_started, 2)
 
                 # 최종 결과 집계 (payment_results 값이 (bool, str) 튜플이므로 첫 번째 값 체크)
                 total_success = sum(
@@ -1934,35 +3981,17 @@ class MultiPropertyAutomation:
                     print(f"❌ 최종 실패: {', '.join(failed_list)}")
                     print("\n📋 실패 상세:")
                     try:
-                        os.makedirs("results", exist_ok=True)
-                        f = open("results/email_report.txt", "w", encoding="utf-8")
+                        os.makedirs(self.results_dir, exist_ok=True)
+                        f = open(self.email_report_path, "w", encoding="utf-8")
                     except Exception as e:
                         print(f"이메일 리포트 파일 생성 실패: {e}")
                         f = None
 
                     for prop_num in failed_list:
                         prop_name = self.property_name_mapping.get(prop_num, '매물명 미확인')
-                        result = payment_results.get(prop_num)
-                        if result is None:
-                            reason = exposure_fail_reasons.get(prop_num, '처리 안됨')
-                        elif isinstance(result, tuple):
-                            status = result[1]
-                            reason_map = {
-                                'saved': '광고 저장됨(결제 미완료)',
-                                'failed': '결제 실패',
-                                'not_found': '종료매물에서 미발견',
-                                'exposure_ended': '노출종료 후 재광고 실패',
-                                'server_maintenance': '네이버 서버 점검',
-                                'page_load_fail': '페이지 로딩 실패',
-                                'pagination_blocked': '팝업으로 페이지 이동 차단',
-                                'no_readd_button': '재광고 버튼 없음',
-                                'timeout_error': '타임아웃 오류',
-                                'process_error': '처리 중 오류',
-                            }
-                            reason = reason_map.get(status, status)
-                        else:
-                            reason = '처리 실패'
-                        
+                        status = self.final_status(prop_num, payment_results, exposure_fail_codes)
+                        reason = REASON_MAP.get(status, status)
+
                         if f:
                             f.write(f"{prop_num}({prop_name}/{reason}),\n")
                         print(f"FAIL_DETAIL:{prop_num}|{self.mask_property_name(prop_name)}|{reason}")
@@ -1974,6 +4003,14 @@ class MultiPropertyAutomation:
 
                 print("="*80)
 
+                self.resource_policy.print_report()
+                print(f"⏱️ 페이싱: 최종 지연 {self.pacing.delay_ms}ms, 조정 {len(self.pacing.adjustments)}회, 누적 대기 {self.pacing.total_wait_ms}ms")
+
+                for prop_num in self.property_numbers:
+                    self.finish_property(prop_num, payment_results, exposure_fail_codes)
+                self.write_run_result()
+                self.resource_policy.save_sizes()
+
                 # 최종 스크린샷
                 screenshot_path = f"batch_automation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
                 await page.screenshot(path=screenshot_path)
@@ -1987,13 +4024,537 @@ class MultiPropertyAutomation:
 
             except Exception as e:
                 print(f"❌ 자동화 실행 실패: {e}")
+                self.write_run_result(aborted=f"error:{type(e).__name__}")
                 try:
                     await browser.close()
                 except:
                     pass
                 sys.exit(1)
 
+# 브라우저 서버 재사용 - 장기 실행 Chromium에 CDP로 접속해 연속 실행 시 콜드 스타트 생략
+BROWSER_LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--no-first-run',
+    '--no-zygote',
+    '--disable-gpu',
+    '--disable-web-security'
+]
+BROWSER_SERVER_STATE = os.path.join('.cache', 'browser_server.json')
+BROWSER_SERVER_PROFILE = os.path.join('.cache', 'browser_server_profile')
+
+
+def browser_server_alive(port):
+    """CDP 엔드포인트(/json/version) 응답 여부"""
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/json/version", timeout=1) as response:
+            return response.status == 200
+    except OSError:
+        return False
+
+
+def launch_browser_server(executable_path, port, timeout=20):
+    """Chromium을 원격 디버깅 포트(127.0.0.1)로 분리 실행하고 준비될 때까지 대기
+
+    실행 중인 서버에 접속한 로컬 프로세스는 브라우저를 조작할 수 있으므로 루프백에만 바인딩하며,
+    로그인 세션은 실행마다 만드는 컨텍스트에만 있고 실행이 끝나면 컨텍스트와 함께 닫힌다.
+    """
+    process = subprocess.Popen(
+        [executable_path, '--headless=new', f'--remote-debugging-port={port}', '--remote-debugging-address=127.0.0.1',
+         f'--user-data-dir={os.path.abspath(BROWSER_SERVER_PROFILE)}', *BROWSER_LAUNCH_ARGS, 'about:blank'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if browser_server_alive(port):
+            os.makedirs(os.path.dirname(BROWSER_SERVER_STATE), exist_ok=True)
+            with open(BROWSER_SERVER_STATE, 'w', encoding='utf-8') as f:
+                json.dump({'pid': process.pid, 'port': port,
+                           'started_at': datetime.now().isoformat(timespec='seconds')}, f)
+            return process.pid
+        if process.poll() is not None:
+            break
+        time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"브라우저 서버 시작 실패 (포트 {port})")
+
+
+def stop_browser_server(state_path=BROWSER_SERVER_STATE):
+    """launch_browser_server로 띄운 서버 종료"""
+    try:
+        with open(state_path, encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        print("ℹ️ 실행 중인 브라우저 서버 정보 없음")
+        return
+    try:
+        os.kill(state['pid'], signal.SIGTERM)
+        print(f"🛑 브라우저 서버 종료 (pid {state['pid']}, 포트 {state['port']})")
+    except OSError as e:
+        print(f"⚠️ 브라우저 서버 종료 실패: {e}")
+    os.remove(state_path)
+
+
+# 샤드 실행 - 매물 목록을 K개로 나눠 프로세스(브라우저)별로 처리하고 결과를 합침
+SHARD_DIR = os.path.join('.cache', 'shards')
+SHARD_LIST_LOCK_PATH = os.path.join(SHARD_DIR, 'list.lock')
+SHARD_READY_MARKER = "⏱️ 시작 소요 시간"
+# 워크플로가 실행 전에 옮겨 두는 직전 실행 결과 (위치 정보 재사용)
+LAST_RUN_RESULT_PATH = os.path.join('.cache', 'last_run_result.json')
+
+
+def load_known_positions(property_numbers, listing_cache=None, journal_path=PROGRESS_JOURNAL_PATH):
+    """직전 실행 결과, 목록 캐시, 진행 저널에서 매물별 매물 리스트 페이지 위치 수집 ({매물번호: 페이지})
+
+    나중에 읽는 출처(더 최근 정보)가 앞선 출처를 덮어쓴다.
+    """
+    positions = {}
+    for path in (LAST_RUN_RESULT_PATH, RUN_RESULT_PATH):
+        try:
+            with open(path, encoding='utf-8') as f:
+                for num, item in json.load(f).get('properties', {}).items():
+                    if item.get('list_page'):
+                        positions[num] = item['list_page']
+        except (OSError, ValueError, AttributeError):
+            pass
+    listing_cache = listing_cache or ListingCache().load()
+    for num in property_numbers:
+        if listing_cache.page_of(num):
+            positions[num] = listing_cache.page_of(num)
+    try:
+        with open(journal_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get('stage') == 'paid':
+                    # 결제된 매물은 목록 맨 앞으로 옮겨지므로 그 전에 기록된 위치는 버림
+                    positions.pop(entry.get('property'), None)
+                elif entry.get('page'):
+                    positions[entry.get('property')] = entry['page']
+    except OSError:
+        pass
+    return {num: positions[num] for num in property_numbers if num in positions}
+
+
+def plan_shards(property_numbers, positions, count):
+    """위치를 고려한 샤드 분할
+
+    위치를 아는 매물은 페이지 순으로 정렬해 같은 페이지가 두 샤드에 걸치지 않도록 연속 구간으로 나누고
+    (앞쪽 구간 샤드의 스윕이 일찍 끝나도록), 위치를 모르는 매물은 가장 작은 샤드부터 채운다.
+    샤드는 모두 같은 목록을 1페이지부터 보므로 목록 작업 자체는 ShardListLock으로 한 번에 한 샤드씩 진행한다.
+    """
+    count = max(1, min(count, len(property_numbers)))
+    by_page = {}
+    for num in property_numbers:
+        if num in positions:
+            by_page.setdefault(positions[num], []).append(num)
+    unknown = [num for num in property_numbers if num not in positions]
+
+    known_total = sum(len(group) for group in by_page.values())
+    target = -(-known_total // count) if known_total else 0
+    shards = [[]]
+    for page_number in sorted(by_page):
+        if len(shards[-1]) >= target and len(shards) < count:
+            shards.append([])
+        shards[-1].extend(by_page[page_number])
+    shards += [[] for _ in range(count - len(shards))]
+
+    for num in unknown:
+        min(shards, key=len).append(num)
+    return [shard for shard in shards if shard]
+
+
+def merge_run_results(property_numbers, shard_results, wall_seconds):
+    """샤드별 실행 결과를 하나의 실행 결과로 합침 (결과 파일이 없는 샤드 매물은 미처리로 기록)"""
+    properties = {}
+    stage_timings = {}
+    aborted = None
+    shards = []
+    started, finished = [], []
+    for index, (shard, result, exit_code) in enumerate(shard_results):
+        if result is None:
+            aborted = aborted or f"error:shard{index}"
+            for num in shard:
+                properties[num] = {'status': 'not_processed', 'reason': REASON_MAP['not_processed'],
+                                   'stages': {}, 'retries': 0}
+        else:
+            aborted = aborted or result.get('aborted')
+            properties.update(result.get('properties', {}))
+            started.append(result['started_at'])
+            finished.append(result['finished_at'])
+            for stage, seconds in result.get('stage_timings', {}).items():
+                stage_timings[stage] = max(stage_timings.get(stage, 0), seconds)
+        shards.append({
+            'index': index,
+            'properties': shard,
+            'exit_code': exit_code,
+            'stage_timings': result.get('stage_timings') if result else None,
+            'startup': result.get('startup') if result else None,
+            'listing_total': result.get('listing_total') if result else None,
+            'lookup': result.get('lookup') if result else None,
+        })
+
+    properties = {num: properties[num] for num in property_numbers if num in properties}
+    success = [num for num, item in properties.items() if item['status'] == 'success']
+    return {
+        'version': RUN_RESULT_VERSION,
+        'started_at': min(started) if started else datetime.now().isoformat(timespec='seconds'),
+        'finished_at': max(finished) if finished else datetime.now().isoformat(timespec='seconds'),
+        'test_mode': os.getenv('TEST_MODE', 'false').lower() == 'true',
+        'aborted': aborted,
+        'total_count': len(properties),
+        'success_count': len(success),
+        'failed_properties': [num for num in properties if num not in success],
+        'stage_timings': dict(stage_timings, total=round(wall_seconds, 2)),
+        'properties': properties,
+        'listing_total': next((item['listing_total'] for item in shards if item['listing_total']), None),
+        'shards': shards,
+    }
+
+
+def shard_state_paths(index):
+    """샤드별 진행 저널/목록 캐시 경로 (샤드끼리 같은 파일을 교체·재작성하지 않도록 분리)"""
+    shard_dir = os.path.join(SHARD_DIR, f"shard{index}")
+    return (os.path.join(shard_dir, os.path.basename(PROGRESS_JOURNAL_PATH)),
+            os.path.join(shard_dir, os.path.basename(LISTING_CACHE_PATH)))
+
+
+def read_journal_lines(path):
+    """진행 저널을 (매물번호, 줄) 목록으로 읽기 (손상된 줄은 버림)"""
+    lines = []
+    try:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    lines.append((json.loads(line)['property'], line if line.endswith('\n') else line + '\n'))
+                except (ValueError, KeyError, TypeError):
+                    continue
+    except OSError:
+        pass
+    return lines
+
+
+def read_listing_entries(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_private_file(path, text):
+    """권한 0600 임시 파일에 쓴 뒤 교체"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + '.tmp'
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+def seed_shard_state(index, shard):
+    """공유 진행 저널/목록 캐시에서 샤드 매물 몫만 샤드 파일로 복사"""
+    journal_path, cache_path = shard_state_paths(index)
+    members = set(shard)
+    write_private_file(journal_path, ''.join(
+        line for num, line in read_journal_lines(PROGRESS_JOURNAL_PATH) if num in members))
+    entries = read_listing_entries(LISTING_CACHE_PATH)
+    write_private_file(cache_path, json.dumps(
+        {num: entry for num, entry in entries.items() if num in members}, ensure_ascii=False))
+    return journal_path, cache_path
+
+
+def merge_shard_state(shards):
+    """샤드별 진행 저널/목록 캐시를 공유 파일로 합침
+
+    샤드 매물의 기록은 샤드 파일로 대체한다 (정상 종료로 저널을 지웠거나 캐시에서 뺀 매물은 공유 파일에서도 삭제).
+    """
+    members = {num for shard in shards for num in shard}
+    journal = [line for num, line in read_journal_lines(PROGRESS_JOURNAL_PATH) if num not in members]
+    entries = {num: entry for num, entry in read_listing_entries(LISTING_CACHE_PATH).items() if num not in members}
+    for index, shard in enumerate(shards):
+        journal_path, cache_path = shard_state_paths(index)
+        journal += [line for num, line in read_journal_lines(journal_path) if num in shard]
+        shard_entries = read_listing_entries(cache_path)
+        entries.update({num: shard_entries[num] for num in shard if num in shard_entries})
+
+    try:
+        if journal:
+            write_private_file(PROGRESS_JOURNAL_PATH, ''.join(journal))
+        elif os.path.exists(PROGRESS_JOURNAL_PATH):
+            os.remove(PROGRESS_JOURNAL_PATH)
+        write_private_file(LISTING_CACHE_PATH, json.dumps(entries, ensure_ascii=False))
+        print(f"🗃️ 샤드 상태 병합: 진행 저널 {len(journal)}줄, 목록 캐시 {len(entries)}개 매물")
+    except OSError as e:
+        print(f"⚠️ 샤드 상태 병합 실패: {e}")
+
+
+async def run_shard(index, shard, ready):
+    """샤드 하나를 하위 프로세스로 실행 (출력은 [shardN] 접두어로 전달, 로그인 완료 시 ready 설정)
+
+    진행 저널/목록 캐시는 샤드별 파일을 쓰고 (공유 파일을 동시에 교체·재작성하지 않도록) 끝난 뒤 부모가 합친다.
+    """
+    results_dir = os.path.join(SHARD_DIR, f"shard{index}")
+    result_path = os.path.join(results_dir, os.path.basename(RUN_RESULT_PATH))
+    for path in (result_path, os.path.join(results_dir, 'email_report.txt')):
+        if os.path.exists(path):
+            os.remove(path)
+    journal_path, cache_path = seed_shard_state(index, shard)
+
+    env = dict(os.environ, PROPERTY_NUMBERS=','.join(shard), RESULTS_DIR=results_dir, SHARD_COUNT='1',
+               PROGRESS_JOURNAL_FILE=journal_path, LISTING_CACHE_FILE=cache_path,
+               SHARD_LIST_LOCK=SHARD_LIST_LOCK_PATH)
+    if env.get('TRACE_OUTPUT'):
+        env['TRACE_OUTPUT'] = os.path.join(results_dir, os.path.basename(env['TRACE_OUTPUT']))
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, '-u', os.path.abspath(__file__), env=env,
+        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT
+    )
+    async for raw in process.stdout:
+        line = raw.decode('utf-8', errors='replace').rstrip('\n')
+        print(f"[shard{index}] {line}", flush=True)
+        if SHARD_READY_MARKER in line:
+            ready.set()
+    exit_code = await process.wait()
+    ready.set()
+
+    try:
+        with open(result_path, encoding='utf-8') as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        result = None
+    return exit_code, result
+
+
+async def run_sharded(property_numbers, count):
+    """매물 목록을 위치 기준으로 count개 샤드로 나눠 병렬 실행하고 results/에 합친 결과와 이메일 리포트 저장
+
+    같은 계정으로 동시에 로그인하면 세션이 끊길 수 있으므로 0번 샤드의 로그인(세션 캐시 저장)이
+    끝난 뒤 나머지 샤드를 시작한다. 세션 캐시를 쓸 수 없으면(SESSION_CACHE_KEY 미설정 등) 샤드마다 로그인하므로
+    샤드를 하나씩, 앞 샤드의 로그인이 끝난 뒤 시작한다.
+    매물 목록을 훑고 클릭하는 구간은 샤드 간 파일 잠금(SHARD_LIST_LOCK)으로 한 번에 한 샤드씩 진행한다.
+    """
+    started = time.perf_counter()
+    positions = load_known_positions(property_numbers)
+    shards = plan_shards(property_numbers, positions, count)
+
+    print("\n" + "="*80)
+    print(f"🧩 샤드 실행: {len(property_numbers)}개 매물 → {len(shards)}개 샤드 (위치 확인 {len(positions)}개)")
+    for index, shard in enumerate(shards):
+        pages = sorted({positions[num] for num in shard if num in positions})
+        page_range = f"{pages[0]}~{pages[-1]}페이지" if pages else "위치 미확인"
+        print(f"   - shard{index}: {len(shard)}개 ({page_range})")
+    print("="*80)
+
+    serialize_logins = StateCipher.from_env() is None
+    if serialize_logins and len(shards) > 1:
+        print("⚠️ 세션 캐시 미사용 (SESSION_CACHE_KEY 미설정 또는 cryptography 없음) - 샤드마다 로그인하므로 로그인을 차례로 진행")
+    os.makedirs(SHARD_DIR, exist_ok=True)
+
+    first_ready = asyncio.Event()
+    tasks = [asyncio.create_task(run_shard(0, shards[0], first_ready))]
+    await first_ready.wait()
+    first_login_failed = tasks[0].done() and (tasks[0].result()[1] or {}).get('aborted') == 'login_failed'
+    if first_login_failed:
+        print("❌ shard0 로그인 실패 - 나머지 샤드를 시작하지 않음")
+    else:
+        for index, shard in enumerate(shards[1:], 1):
+            ready = asyncio.Event()
+            tasks.append(asyncio.create_task(run_shard(index, shard, ready)))
+            if serialize_logins:
+                await ready.wait()
+    outcomes = await asyncio.gather(*tasks)
+    outcomes += [(None, None)] * (len(shards) - len(outcomes))
+    merge_shard_state(shards[:len(tasks)])
+
+    shard_results = [(shard, result, exit_code) for shard, (exit_code, result) in zip(shards, outcomes)]
+    merged = merge_run_results(property_numbers, shard_results, time.perf_counter() - started)
+
+    os.makedirs('results', exist_ok=True)
+    with open(RUN_RESULT_PATH, 'w', encoding='utf-8') as f:
+        json.dump(merged, f, ensure_ascii=False, indent=2)
+    print(f"📝 실행 결과 저장: {RUN_RESULT_PATH}")
+
+    report_lines = []
+    for index in range(len(shards)):
+        try:
+            with open(os.path.join(SHARD_DIR, f"shard{index}", 'email_report.txt'), encoding='utf-8') as f:
+                report_lines.append(f.read())
+        except OSError:
+            pass
+    if any(report_lines):
+        with open(os.path.join('results', 'email_report.txt'), 'w', encoding='utf-8') as f:
+            f.write(''.join(report_lines))
+
+    print("\n" + "="*80)
+    print(f"🧩 샤드 실행 완료: {merged['success_count']}/{merged['total_count']}개 성공 "
+          f"({merged['stage_timings']['total']}초)")
+    for num in merged['failed_properties']:
+        item = merged['properties'][num]
+        print(f"FAIL_DETAIL:{num}|{item.get('masked_name', '***')}|{item['reason']}")
+    print("="*80)
+
+    if any(exit_code != 0 for exit_code, _ in outcomes if exit_code is not None) or first_login_failed:
+        sys.exit(1)
+
+
+# 실행 계획 (--plan) - Playwright 없이 대상 매물 확인과 페이지/시간 추정만 수행
+SCHEDULED_PROPERTIES_PATH = os.path.join('data', 'scheduled_properties.json')
+LIST_PAGE_SIZE = 50
+# 이전 실행 기록이 없을 때 쓰는 대략적인 소요 시간 (초)
+PLAN_DEFAULT_SECONDS = {'startup': 20, 'page': 2, 'exposure_end': 8, 're_register': 20}
+
+
+def order_by_position(property_numbers, positions):
+    """위치(페이지 또는 목록 내 순번)를 아는 매물을 위치 순으로 앞에, 모르는 매물은 입력 순서대로 뒤에 배치"""
+    known = sorted((num for num in property_numbers if num in positions), key=lambda num: positions[num])
+    return known + [num for num in property_numbers if num not in positions]
+
+
+def read_property_input():
+    """PROPERTY_NUMBERS(우선) 또는 data/scheduled_properties.json에서 매물번호 읽기
+
+    기존과 같이 공백이 아닌 값은 형식과 관계없이 모두 대상으로 받고 중복만 제거한다.
+
+    Returns:
+        dict: numbers(중복 제거 후, 입력 순서 유지), source, duplicates
+    """
+    raw = [num.strip() for num in os.getenv('PROPERTY_NUMBERS', '').split(',') if num.strip()]
+    source = 'env'
+    if not raw:
+        source = 'scheduled'
+        try:
+            with open(SCHEDULED_PROPERTIES_PATH, encoding='utf-8') as f:
+                raw = [str(num).strip() for num in json.load(f).get('properties', []) if str(num).strip()]
+        except (OSError, ValueError, AttributeError):
+            raw, source = [], None
+
+    numbers, duplicates = [], []
+    for num in raw:
+        if num in numbers:
+            duplicates.append(num)
+        else:
+            numbers.append(num)
+    return {'numbers': numbers, 'source': source, 'duplicates': duplicates}
+
+
+def load_last_run_result():
+    """직전 실행 결과 (워크플로가 .cache로 옮긴 파일 우선, 없으면 None)"""
+    for path in (LAST_RUN_RESULT_PATH, RUN_RESULT_PATH):
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            continue
+    return None
+
+
+def build_plan():
+    """실행 계획: 대상 매물, 알려진 위치, 예상 목록 페이지 수와 소요 시간 (직전 실행 결과 기반 추정)"""
+    property_input = read_property_input()
+    numbers = property_input['numbers']
+    positions = load_known_positions(numbers)
+    last = load_last_run_result() or {}
+
+    listing_total = last.get('listing_total')
+    total_pages = -(-listing_total // LIST_PAGE_SIZE) if listing_total else None
+
+    # 단계별 매물당 평균 시간 (직전 실행의 매물별 기록)
+    seconds = dict(PLAN_DEFAULT_SECONDS, startup=(last.get('startup') or {}).get('seconds') or PLAN_DEFAULT_SECONDS['startup'])
+    for stage in ('exposure_end', 're_register'):
+        samples = [
+            item['stages'][stage]['seconds'] for item in last.get('properties', {}).values()
+            if item.get('stages', {}).get(stage, {}).get('seconds') is not None
+        ]
+        if samples:
+            seconds[stage] = round(sum(samples) / len(samples), 2)
+
+    # 단일 스윕은 1페이지부터 가장 뒤쪽 대상 페이지까지 순회, 위치를 모르는 매물이 있으면 전체 페이지
+    unknown = [num for num in numbers if num not in positions]
+    if unknown:
+        list_pages = total_pages
+    else:
+        list_pages = max(positions.values()) if positions else 0
+    # 목록 검색이 설정되어 있고 대상 수가 페이지 수보다 적으면 매물당 검색 1회 (search_beats_sweep과 같은 기준)
+    list_search = bool(os.getenv('AD_LIST_SEARCH_PARAM') or os.getenv('AD_LIST_SEARCH_INPUT'))
+    lookup = 'sweep'
+    if list_search and total_pages and len(numbers) < total_pages:
+        lookup, list_pages = 'search', len(numbers)
+
+    estimated = None
+    if numbers:
+        estimated = round(
+            seconds['startup']
+            + (list_pages or 1) * seconds['page']
+            + len(numbers) * (seconds['exposure_end'] + seconds['re_register']), 1
+        )
+
+    return {
+        'source': property_input['source'],
+        'properties': numbers,
+        'duplicates': property_input['duplicates'],
+        'positions': positions,
+        'unknown_positions': unknown,
+        'listing_total': listing_total,
+        'total_pages': total_pages,
+        'list_pages': list_pages,
+        'lookup': lookup,
+        'seconds_per_stage': seconds,
+        'estimated_seconds': estimated,
+    }
+
+
+def print_plan(plan):
+    source_label = {'env': 'PROPERTY_NUMBERS', 'scheduled': SCHEDULED_PROPERTIES_PATH}.get(plan['source'], '없음')
+    print(f"🗒️ 실행 계획 (입력: {source_label})")
+    print(f"🏠 대상 매물: {len(plan['properties'])}개")
+    if plan['properties']:
+        print(f"📋 매물번호: {', '.join(plan['properties'])}")
+    if plan['duplicates']:
+        print(f"♻️ 중복 제거: {', '.join(plan['duplicates'])}")
+    if plan['positions']:
+        by_page = sorted(plan['positions'].items(), key=lambda item: item[1])
+        print(f"📍 위치 확인: {len(by_page)}개 ({', '.join(f'{num}→{page}p' for num, page in by_page)})")
+    if plan['unknown_positions']:
+        print(f"❔ 위치 미확인: {len(plan['unknown_positions'])}개")
+    if plan['listing_total']:
+        print(f"📊 전체 매물(직전 실행): {plan['listing_total']}개 / {plan['total_pages']}페이지")
+    if plan['list_pages'] is not None:
+        lookup_label = ' (목록 검색)' if plan['lookup'] == 'search' else ''
+        print(f"📄 예상 목록 순회: {plan['list_pages']}페이지{lookup_label}")
+    else:
+        print("📄 예상 목록 순회: 알 수 없음 (전체 매물 수 미확인)")
+    if plan['estimated_seconds'] is not None:
+        print(f"⏱️ 예상 소요 시간: 약 {plan['estimated_seconds'] / 60:.1f}분 ({plan['estimated_seconds']}초)")
+
+
 async def main():
+    if '--plan' in sys.argv:
+        plan = build_plan()
+        if '--json' in sys.argv:
+            print(json.dumps(plan, ensure_ascii=False, indent=2))
+        else:
+            print_plan(plan)
+        sys.exit(0 if plan['properties'] else 1)
+
+    if '--stop-browser-server' in sys.argv:
+        stop_browser_server()
+        return
+
+    shard_count = int(os.getenv('SHARD_COUNT', '1') or 1)
+    if '--shards' in sys.argv:
+        shard_count = int(sys.argv[sys.argv.index('--shards') + 1])
+
+    property_numbers = read_property_input()['numbers']
+    if shard_count > 1 and len(property_numbers) > 1:
+        await run_sharded(property_numbers, shard_count)
+        return
+
     automation = MultiPropertyAutomation()
     await automation.run_automation()
 